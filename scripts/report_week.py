@@ -1,29 +1,108 @@
 #!/usr/bin/env python3
-import json, pathlib, datetime, sys
-from collections import Counter, defaultdict
-
-LOG_DIR = pathlib.Path(sys.argv[1]) if len(sys.argv) > 1 else pathlib.Path("9_ADMIN/logs")
-since_days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
-
-events = []
-cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=since_days)
-for p in LOG_DIR.glob("*.log.jsonl"):
-    for line in p.read_text(encoding="utf-8", errors="ignore").splitlines():
-        try:
-            obj = json.loads(line)
-            ts = datetime.datetime.fromisoformat(obj["ts"].replace("Z","+00:00"))
-            if ts >= cutoff:
-                events.append(obj)
-        except Exception:
-            pass
-
-by_op = Counter(e["op"] for e in events)
-by_proj = Counter()
-for e in events:
-    if "project" in e:
-        by_proj[e["project"]] += 1
-
-print("# Report (last %d days)" % since_days)
-print("Total events:", len(events))
-print("By op:", dict(by_op))
-print("Top projects:", by_proj.most_common(10))
+"""Weekly report over the vault JSONL event logs.
+
+Usage: report_week.py [LOG_DIR] [DAYS] [--no-summary]
+
+Logs are named YYYY-MM-DD.log.jsonl, so files older than the window are
+skipped by name and the rest are streamed line by line. Days that lie wholly
+inside the window are read from per-day summaries in LOG_DIR/.summary, which
+are rebuilt whenever the log file's size or mtime changes.
+"""
+import argparse, json, pathlib, datetime
+from collections import Counter
+
+SUMMARY_DIR = ".summary"
+
+
+def file_day(path):
+    try:
+        return datetime.date.fromisoformat(path.name[:10])
+    except ValueError:
+        return None
+
+
+def event_time(obj):
+    ts = datetime.datetime.fromisoformat(obj["ts"].replace("Z", "+00:00"))
+    return ts if ts.tzinfo else ts.replace(tzinfo=datetime.timezone.utc)
+
+
+def scan(path, cutoff=None):
+    """Stream a log file into counters, keeping events at or after cutoff."""
+    total, by_op, by_proj = 0, Counter(), Counter()
+    with path.open(encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            try:
+                obj = json.loads(line)
+                if cutoff is not None and event_time(obj) < cutoff:
+                    continue
+                op = obj["op"]
+            except Exception:
+                continue
+            total += 1
+            by_op[op] += 1
+            if "project" in obj:
+                by_proj[obj["project"]] += 1
+    return total, by_op, by_proj
+
+
+def day_summary(path):
+    """Counters for a whole day, from the summary cache when it is current."""
+    stat = path.stat()
+    cache = path.parent / SUMMARY_DIR / (path.name + ".json")
+    try:
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        if data["size"] == stat.st_size and data["mtime_ns"] == stat.st_mtime_ns:
+            return data["total"], Counter(data["by_op"]), Counter(data["by_proj"])
+    except Exception:
+        pass
+
+    total, by_op, by_proj = scan(path)
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        tmp = cache.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "total": total,
+                                   "by_op": by_op, "by_proj": by_proj}, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(cache)
+    except OSError:
+        pass
+    return total, by_op, by_proj
+
+
+def report(log_dir, since_days, use_summary=True):
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=since_days)
+    # File names use the local date and event timestamps are UTC: allow a day of slack on the edge
+    first_day = cutoff.date() - datetime.timedelta(days=1)
+    edge_day = cutoff.date() + datetime.timedelta(days=1)
+
+    total, by_op, by_proj = 0, Counter(), Counter()
+    for path in sorted(log_dir.glob("*.log.jsonl")):
+        day = file_day(path)
+        if day is not None and day < first_day:
+            continue
+        if use_summary and day is not None and day > edge_day:
+            counts = day_summary(path)
+        else:
+            counts = scan(path, cutoff)
+        total += counts[0]
+        by_op.update(counts[1])
+        by_proj.update(counts[2])
+    return total, by_op, by_proj
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on vault events from JSONL logs")
+    parser.add_argument("log_dir", nargs="?", default="9_ADMIN/logs", type=pathlib.Path)
+    parser.add_argument("since_days", nargs="?", default=7, type=int)
+    parser.add_argument("--no-summary", action="store_true", help="do not read or write per-day summaries")
+    args = parser.parse_args()
+
+    total, by_op, by_proj = report(args.log_dir, args.since_days, use_summary=not args.no_summary)
+
+    print("# Report (last %d days)" % args.since_days)
+    print("Total events:", total)
+    print("By op:", dict(by_op))
+    print("Top projects:", by_proj.most_common(10))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Tests for report_week.py."""
+
+import datetime
+import importlib.util
+import json
+import pathlib
+
+import pytest
+
+SCRIPT = pathlib.Path(__file__).resolve().parents[1] / "report_week.py"
+DAYS = 7
+
+
+@pytest.fixture
+def report_week():
+    spec = importlib.util.spec_from_file_location("report_week", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_log(log_dir, day, *events):
+    path = log_dir / f"{day.isoformat()}.log.jsonl"
+    with path.open("a", encoding="utf-8") as f:
+        for ts, op, project in events:
+            f.write(json.dumps({"ts": ts.isoformat().replace("+00:00", "Z"), "op": op, "project": project}) + "\n")
+    return path
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """A week of logs around the window edge."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cutoff = now - datetime.timedelta(days=DAYS)
+    hour = datetime.timedelta(hours=1)
+    day = datetime.timedelta(days=1)
+    # Beyond the day of slack: skipped by name even though the event is inside the window
+    write_log(tmp_path, cutoff.date() - 2 * day, (cutoff + hour, "move", "OLD"))
+    # The day of slack: a local-date file holding one UTC event on each side of the cutoff
+    write_log(tmp_path, cutoff.date() - day, (cutoff - hour, "move", "EDGE"), (cutoff + hour, "move", "EDGE"))
+    write_log(tmp_path, cutoff.date(), (cutoff - hour, "hash", "EDGE"), (cutoff + hour, "hash", "EDGE"))
+    # Whole days inside the window
+    write_log(tmp_path, now.date() - 2 * day, (now - 2 * day, "move", "ABC"), (now - 2 * day, "convert", "ABC"))
+    write_log(tmp_path, now.date(), (now - hour, "move", "XYZ"))
+    (tmp_path / "notes.txt").write_text("not a log", encoding="utf-8")
+    return tmp_path
+
+
+def test_summary_matches_full_scan(report_week, log_dir):
+    """Summaries give the same totals as streaming every file."""
+    scanned = report_week.report(log_dir, DAYS, use_summary=False)
+    summarized = report_week.report(log_dir, DAYS)
+
+    assert summarized == scanned
+    assert (log_dir / report_week.SUMMARY_DIR).is_dir()
+    # A second run reads the cached summaries
+    assert report_week.report(log_dir, DAYS) == scanned
+    total, by_op, by_proj = summarized
+    assert total == 5
+    assert by_op == {"move": 3, "hash": 1, "convert": 1}
+    assert by_proj == {"EDGE": 2, "ABC": 2, "XYZ": 1}
+
+
+def test_no_summary_writes_no_cache(report_week, log_dir):
+    """--no-summary neither reads nor writes the summary cache."""
+    report_week.report(log_dir, DAYS, use_summary=False)
+
+    assert not (log_dir / report_week.SUMMARY_DIR).exists()
+
+
+def test_summary_goes_stale_after_append(report_week, log_dir):
+    """Appending to a log rebuilds its summary instead of reusing the cached counts."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    day = now.date() - datetime.timedelta(days=2)
+    report_week.report(log_dir, DAYS)
+    cache = log_dir / report_week.SUMMARY_DIR / f"{day.isoformat()}.log.jsonl.json"
+    assert json.loads(cache.read_text(encoding="utf-8"))["total"] == 2
+
+    write_log(log_dir, day, (now - datetime.timedelta(days=2), "move", "ABC"))
+    total, by_op, _ = report_week.report(log_dir, DAYS)
+
+    assert total == 6
+    assert by_op["move"] == 4
+    assert json.loads(cache.read_text(encoding="utf-8"))["total"] == 3
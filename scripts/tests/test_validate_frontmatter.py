@@ -0,0 +1,36 @@
+"""Tests for validate_frontmatter.py."""
+
+import importlib.util
+import pathlib
+
+import pytest
+
+SCRIPT = pathlib.Path(__file__).resolve().parents[1] / "validate_frontmatter.py"
+
+
+@pytest.fixture
+def validate(tmp_path, monkeypatch):
+    """Load the script with its cache in a temporary directory."""
+    spec = importlib.util.spec_from_file_location("validate_frontmatter", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "CACHE_FILE", tmp_path / ".cache" / "frontmatter.json")
+    return module
+
+
+def run(module, *args):
+    with pytest.raises(SystemExit) as exit_info:
+        module.main([str(arg) for arg in args])
+    return exit_info.value.code
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_missing_fields_fail(validate, tmp_path, newline, capsys):
+    """A project note missing required fields fails whatever its line endings."""
+    note = tmp_path / "project.md"
+    note.write_bytes(newline.join(["---", "type: project", "title: Demo", "---", "# Demo", ""]).encode("utf-8"))
+
+    assert run(validate, note) == 1
+    assert "[SCHEMA FAIL]" in capsys.readouterr().out
+    # A failed note is not cached as passed
+    assert run(validate, note) == 1
@@ -1,6 +1,16 @@
 #!/usr/bin/env python3
-import sys, re, json, yaml, pathlib
-from jsonschema import validate, ValidationError
+"""Validate note frontmatter against the JSON schemas in schemas/.
+
+Usage: validate_frontmatter.py [--jobs N] [--no-cache] FILE...
+
+Schemas are compiled into validators once per process. Notes that already
+passed with the same content and the same schemas are skipped using the cache
+in .cache/frontmatter.json; the rest are validated in parallel.
+"""
+import sys, re, json, yaml, pathlib, hashlib, argparse, os, time
+from concurrent.futures import ProcessPoolExecutor
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 HERE = pathlib.Path(__file__).resolve().parents[1]
 SCHEMAS = {
@@ -11,31 +21,110 @@ SCHEMAS = {
     "note": HERE / "schemas" / "note.json",
 }
 FM_RE = re.compile(r"^---\n(.*?)\n---", re.S)
+CACHE_FILE = HERE / ".cache" / "frontmatter.json"
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+# Cache entries for content not seen for this long are dropped
+CACHE_TTL = 30 * 86400
 
-def load_json(p): 
+VALIDATORS = {}
+
+def load_json(p):
     return json.loads(p.read_text(encoding="utf-8"))
 
-def main(files):
-    ok = True
-    cache = {k: load_json(v) for k, v in SCHEMAS.items()}
-    for f in files:
-        text = pathlib.Path(f).read_text(encoding="utf-8", errors="ignore")
-        m = FM_RE.search(text)
-        if not m: 
+def schemas_digest():
+    h = hashlib.sha256()
+    for name in sorted(SCHEMAS):
+        h.update(name.encode("utf-8"))
+        h.update(SCHEMAS[name].read_bytes())
+    return h.hexdigest()
+
+def init_validators():
+    for name, path in SCHEMAS.items():
+        schema = load_json(path)
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        VALIDATORS[name] = cls(schema)
+
+def check(item):
+    """Validate one note; returns a list of error messages."""
+    f, text = item
+    m = FM_RE.search(text)
+    if not m:
+        return []
+    try:
+        fm = yaml.safe_load(m.group(1)) or {}
+    except Exception as e:
+        return [f"[YAML ERROR] {f}: {e}"]
+    t = fm.get("type") if isinstance(fm, dict) else None
+    if t in VALIDATORS:
+        error = best_match(VALIDATORS[t].iter_errors(fm))
+        if error is not None:
+            return [f"[SCHEMA FAIL] {f}: {error.message}"]
+    return []
+
+def load_cache(digest):
+    """Content hashes of notes that passed with these schemas, with when they were last seen."""
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        if data.get("schemas") == digest:
+            return dict(data.get("passed", {}))
+    except Exception:
+        pass
+    return {}
+
+def save_cache(digest, passed):
+    cutoff = time.time() - CACHE_TTL
+    passed = {key: seen for key, seen in passed.items() if seen >= cutoff}
+    try:
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"schemas": digest, "passed": passed}), encoding="utf-8")
+        tmp.replace(CACHE_FILE)
+    except OSError:
+        pass
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Validate YAML frontmatter against JSON Schema")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="validate every file")
+    args = parser.parse_args(argv)
+
+    digest = schemas_digest()
+    passed = {} if args.no_cache else load_cache(digest)
+    now = time.time()
+
+    pending, hashes = [], {}
+    for f in args.files:
+        data = pathlib.Path(f).read_bytes()
+        key = hashlib.sha256(data).hexdigest()
+        if key in passed:
+            passed[key] = now
             continue
-        try:
-            fm = yaml.safe_load(m.group(1)) or {}
-        except Exception as e:
-            print(f"[YAML ERROR] {f}: {e}")
+        hashes[f] = key
+        # Same newline translation as read_text, so CRLF notes match FM_RE
+        text = data.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+        pending.append((f, text))
+
+    if args.jobs > 1 and len(pending) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_validators) as pool:
+            results = list(pool.map(check, pending, chunksize=max(1, len(pending) // (args.jobs * 4))))
+    else:
+        init_validators()
+        results = [check(item) for item in pending]
+
+    ok = True
+    for (f, _), errors in zip(pending, results):
+        for message in errors:
+            print(message)
+        if errors:
             ok = False
-            continue
-        t = fm.get("type")
-        if t in cache:
-            try:
-                validate(instance=fm, schema=cache[t])
-            except ValidationError as e:
-                print(f"[SCHEMA FAIL] {f}: {e.message}")
-                ok = False
+        else:
+            passed[hashes[f]] = now
+
+    if not args.no_cache:
+        save_cache(digest, passed)
     sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":
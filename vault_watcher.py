@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # vault_watcher.py — idempotent file/router + 3D pipeline
-import os, re, sys, time, json, yaml, shutil, tempfile, hashlib, uuid, datetime, subprocess
+import os, re, sys, time, json, yaml, shutil, tempfile, hashlib, uuid, datetime, subprocess, threading, atexit
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -34,23 +34,68 @@ CONFIG = {
 
 MODEL_EXTS = {".stl",".obj",".fbx",".dae",".ply",".gltf",".glb",".3ds",".blend",".step",".stp",".iges",".igs"}
 NOTE_EXTS = {".md"}
-ASSIGN_RE = re.compile(r"([PRC]):([A-Za-z0-9\\-_]+)")
-NAME_MARK_RE = re.compile(r"\\[(P|R|C):([A-Za-z0-9\\-_]+)\\]")
-FM_RE = re.compile(r"^---\\n(.*?)\\n---", re.S)
+ASSIGN_RE = re.compile(r"([PRC]):([A-Za-z0-9\-_]+)")
+NAME_MARK_RE = re.compile(r"\[(P|R|C):([A-Za-z0-9\-_]+)\]")
+FM_RE = re.compile(r"^---\n(.*?)\n---", re.S)
 
 def vpath(*parts):
     return Path(CONFIG["vault"]).joinpath(*parts)
 
+class JsonlLog:
+    """Buffered append-only JSONL log, one file per day (9_ADMIN/logs/YYYY-MM-DD.log.jsonl)."""
+    def __init__(self, flush_every=64, flush_interval=1.0):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.buf, self.buf_day = [], None
+        self.fh, self.fh_day = None, None
+        self.last_flush = time.monotonic()
+
+    def write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        day = datetime.date.today()
+        with self.lock:
+            if self.buf and self.buf_day != day:
+                self._flush()
+            if not self.buf:
+                self.buf_day = day
+            self.buf.append(line)
+            if len(self.buf) >= self.flush_every or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            if self.fh:
+                self.fh.close()
+                self.fh = None
+
+    def _flush(self):
+        self.last_flush = time.monotonic()
+        if not self.buf:
+            return
+        if self.fh is None or self.fh_day != self.buf_day:
+            if self.fh:
+                self.fh.close()
+            log_dir = vpath(CONFIG["log_dir"])
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self.fh = open(log_dir / (self.buf_day.isoformat() + ".log.jsonl"), "a", encoding="utf-8")
+            self.fh_day = self.buf_day
+        self.fh.write("".join(self.buf))
+        self.fh.flush()
+        self.buf.clear()
+
+LOG = JsonlLog()
+atexit.register(LOG.close)
+
 def log_event(op, **kw):
     ts = datetime.datetime.utcnow().isoformat() + "Z"
     op_id = uuid.uuid4().hex[:26]
-    log_dir = vpath(CONFIG["log_dir"])
-    log_dir.mkdir(parents=True, exist_ok=True)
-    entry = {"ts":ts,"op_id":op_id,"op":op, **kw}
-    (log_dir / (datetime.date.today().isoformat()+".log.jsonl")).write_text(
-        ((log_dir / (datetime.date.today().isoformat()+".log.jsonl")).read_text(encoding="utf-8", errors="ignore") if (log_dir / (datetime.date.today().isoformat()+".log.jsonl")).exists() else "") + json.dumps(entry, ensure_ascii=False)+"\n",
-        encoding="utf-8"
-    )
+    LOG.write({"ts":ts,"op_id":op_id,"op":op, **kw})
 
 def sha256(p: Path, chunk=1024*1024):
     h = hashlib.sha256()
@@ -303,9 +348,11 @@ def main():
     try:
         while True:
             time.sleep(1)
+            LOG.flush()
     except KeyboardInterrupt:
         obs.stop()
     obs.join()
+    LOG.close()
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,41 @@
 """API for Vault Watcher using FastAPI."""
 
 import asyncio
+import json
+import math
+from collections import Counter, deque
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+import yaml
+from fastapi import (
+    FastAPI, HTTPException, BackgroundTasks, Depends, Header, Query, Request, Response, WebSocket, WebSocketDisconnect
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.middleware.base import BaseHTTPMiddleware
 
 from .config import Config
+from .conversion import ConversionJobStore
 from .core import VaultWatcher
+from .eventstream import EventBroadcaster, EventStreamClient
+from .executor import BackgroundJobs, BlockingExecutor, Job, OperationTimeoutError
+from .frontmatter import FrontmatterCache
+from .index import VaultIndex
+from .listing import DirectoryListing, InvalidCursorError
 from .logging import get_logger, setup_logging
+from .logtail import LogFilter, LogFollower, parse_line, tail
+from .metrics import CONTENT_TYPE, ProcessingMetrics
+from .ratelimit import RateLimiter
+from .scheduler import ProcessingScheduler, SchedulerFullError
+
+
+FILE_TYPE_LABELS = {"model": "3D Model", "note": "Note", "document": "Document", "image": "Image"}
+# Probes, scrapes and long-lived streams are not counted against the rate limit
+RATE_LIMIT_EXEMPT = frozenset({"/health", "/metrics", "/events"})
 
 
 class FileInfo(BaseModel):
@@ -26,6 +49,15 @@ class FileInfo(BaseModel):
     is_directory: bool
 
 
+class FileListing(BaseModel):
+    """Page of a directory listing."""
+    
+    path: str
+    total: int
+    next_cursor: Optional[str] = None
+    items: List[FileInfo]
+
+
 class VaultStatus(BaseModel):
     """Vault status model."""
     
@@ -51,6 +83,26 @@ class ProcessingResult(BaseModel):
     destination_path: Optional[str] = None
 
 
+class BatchProcessRequest(BaseModel):
+    """Batch processing request model."""
+    
+    paths: List[str] = Field(default=[], description="File paths relative to the vault")
+    glob: Optional[str] = Field(default=None, description="Glob pattern relative to the vault, e.g. 0_INBOX/**/*.stl")
+
+
+class JobStatus(BaseModel):
+    """Background job status model."""
+    
+    job_id: str
+    operation: str
+    status: str
+    status_url: str
+    created: datetime
+    updated: datetime
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
 class ConfigurationUpdate(BaseModel):
     """Configuration update model."""
     
@@ -67,6 +119,16 @@ class VaultWatcherAPI:
         self.logger = get_logger("API")
         self.watcher: Optional[VaultWatcher] = None
         self.watcher_task: Optional[asyncio.Task] = None
+        self._conversion_store: Optional[ConversionJobStore] = None
+        self._vault_index: Optional[VaultIndex] = None
+        self._frontmatter: Optional[FrontmatterCache] = None
+        self.listing = DirectoryListing(self._describe_file_type)
+        self.event_stream = EventBroadcaster(config.api.event_buffer_size)
+        # Outlives watcher restarts so counters keep growing between scrapes
+        self.metrics = ProcessingMetrics()
+        self.executor = BlockingExecutor.from_config(config)
+        self.jobs = BackgroundJobs.from_config(config, self.executor)
+        self._watcher_lock = asyncio.Lock()
         
         # Create FastAPI app
         self.app = FastAPI(
@@ -75,8 +137,14 @@ class VaultWatcherAPI:
             version="0.1.0",
             docs_url="/docs",
             redoc_url="/redoc",
+            lifespan=self._lifespan,
         )
         
+        # Rate limiting sits inside CORS so rejected requests still carry CORS headers
+        self.rate_limiter = RateLimiter(config.api.rate_limit) if config.api.rate_limit > 0 else None
+        if self.rate_limiter is not None:
+            self.app.add_middleware(BaseHTTPMiddleware, dispatch=self._limit_rate)
+        
         # Setup CORS
         self.app.add_middleware(
             CORSMiddleware,
@@ -110,63 +178,140 @@ class VaultWatcherAPI:
                 "watcher_running": self.watcher is not None and self.watcher_task is not None
             }
         
+        @self.app.get("/metrics")
+        async def get_metrics():
+            """Processing metrics in the Prometheus text format."""
+            # Collecting reads the conversion job store
+            return Response(await self._run_blocking("metrics", self.metrics.render), media_type=CONTENT_TYPE)
+        
         @self.app.get("/vault/status", response_model=VaultStatus)
-        async def get_vault_status():
+        async def get_vault_status(
+            refresh: bool = Query(False, description="Reconcile the vault index with the disk first"),
+        ):
             """Get vault status and statistics."""
             try:
-                stats = self._collect_vault_statistics()
+                stats = await self._run_blocking("vault_status", self._collect_vault_statistics, refresh)
                 return VaultStatus(
                     vault_path=self.config.general.vault_path,
                     watcher_running=self.watcher is not None and self.watcher_task is not None,
                     **stats
                 )
+            except HTTPException:
+                raise
             except Exception as e:
                 self.logger.error("vault_status_error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
         
-        @self.app.get("/vault/files", response_model=List[FileInfo])
-        async def get_vault_files(path: str = ""):
-            """Get files in vault directory."""
+        @self.app.get("/vault/files", response_model=FileListing)
+        async def get_vault_files(
+            response: Response,
+            path: str = "",
+            cursor: Optional[str] = None,
+            limit: int = Query(200, ge=1, le=1000),
+            file_type: Optional[str] = None,
+            suffix: Optional[str] = Query(None, description="Comma-separated suffixes, e.g. .stl,.obj"),
+            sort: str = Query("name", pattern="^(name|size|modified|type)$"),
+            order: str = Query("asc", pattern="^(asc|desc)$"),
+            if_none_match: Optional[str] = Header(None),
+        ):
+            """Get a page of files in a vault directory."""
             try:
-                vault_path = Path(self.config.general.vault_path)
-                target_path = vault_path / path if path else vault_path
-                
-                if not target_path.exists():
-                    raise HTTPException(status_code=404, detail="Path not found")
+                def list_page():
+                    vault_path = Path(self.config.general.vault_path)
+                    target_path = vault_path / path if path else vault_path
+                    
+                    if not target_path.resolve().is_relative_to(vault_path.resolve()):
+                        raise HTTPException(status_code=400, detail="Path is outside the vault")
+                    if not target_path.is_dir():
+                        raise HTTPException(status_code=404, detail="Path not found")
+                    
+                    query = {
+                        "cursor": cursor,
+                        "limit": limit,
+                        "file_type": file_type,
+                        "suffixes": suffix.split(",") if suffix else (),
+                        "sort": sort,
+                        "order": order,
+                    }
+                    if if_none_match:
+                        etag = self.listing.etag_for(target_path, **query)
+                        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+                            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+                    
+                    page = self.listing.page(target_path, **query)
+                    response.headers["ETag"] = page.etag
+                    response.headers["Cache-Control"] = "no-cache"
+                    
+                    return FileListing(
+                        path=str(target_path.relative_to(vault_path)) if path else "",
+                        total=page.total,
+                        next_cursor=page.next_cursor,
+                        items=[
+                            FileInfo(
+                                name=entry.name,
+                                path=str((target_path / entry.name).relative_to(vault_path)),
+                                size=entry.size,
+                                file_type=entry.file_type,
+                                modified=datetime.fromtimestamp(entry.mtime_ns / 1e9),
+                                is_directory=entry.is_directory,
+                            )
+                            for entry in page.entries
+                        ],
+                    )
                 
-                files = []
-                for item in target_path.iterdir():
+                return await self._run_blocking("vault_files", list_page)
+            
+            except HTTPException:
+                raise
+            except InvalidCursorError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.logger.error("vault_files_error", error=str(e))
+                raise HTTPException(status_code=500, detail=str(e))
+        
+        @self.app.get("/vault/frontmatter")
+        async def get_frontmatter(path: str):
+            """Get the parsed frontmatter of a note."""
+            try:
+                def read_frontmatter():
+                    vault_path = Path(self.config.general.vault_path)
+                    note_path = vault_path / path
+                    
+                    if not note_path.resolve().is_relative_to(vault_path.resolve()):
+                        raise HTTPException(status_code=400, detail="Path is outside the vault")
+                    if not note_path.is_file() or self.config.classify(note_path) != "note":
+                        raise HTTPException(status_code=404, detail="Note not found")
+                    
                     try:
-                        stat = item.stat()
-                        files.append(FileInfo(
-                            name=item.name,
-                            path=str(item.relative_to(vault_path)),
-                            size=stat.st_size if item.is_file() else 0,
-                            file_type=self._get_file_type(item),
-                            modified=datetime.fromtimestamp(stat.st_mtime),
-                            is_directory=item.is_dir()
-                        ))
-                    except PermissionError:
-                        continue
+                        frontmatter = self._get_frontmatter_cache().get(note_path)
+                    except yaml.YAMLError as e:
+                        raise HTTPException(status_code=422, detail=f"Invalid frontmatter: {e}")
+                    return {"path": path, "frontmatter": frontmatter}
                 
-                return sorted(files, key=lambda x: (not x.is_directory, x.name.lower()))
+                return await self._run_blocking("frontmatter", read_frontmatter)
             
+            except HTTPException:
+                raise
             except Exception as e:
-                self.logger.error("vault_files_error", error=str(e))
+                self.logger.error("frontmatter_get_error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.post("/watcher/start")
         async def start_watcher(background_tasks: BackgroundTasks):
             """Start the vault watcher."""
             try:
-                if self.watcher is not None and self.watcher_task is not None:
-                    return {"message": "Watcher is already running"}
-                
-                self.watcher = VaultWatcher(self.config)
-                self.watcher.start()
-                
-                # Run watcher in background
-                self.watcher_task = asyncio.create_task(self._run_watcher())
+                async with self._watcher_lock:
+                    if self.watcher is not None and self.watcher_task is not None:
+                        return {"message": "Watcher is already running"}
+                    
+                    # Opening the databases and recovering the journal touch the disk
+                    watcher = await self._run_blocking("watcher", VaultWatcher, self.config, self.metrics, timeout=0)
+                    self.event_stream.attach(watcher.events)
+                    await self._run_blocking("watcher", watcher.start, timeout=0)
+                    self.watcher = watcher
+                    
+                    # Run watcher in background
+                    self.watcher_task = asyncio.create_task(self._run_watcher())
                 
                 self.logger.info("watcher_started")
                 return {"message": "Watcher started successfully"}
@@ -179,20 +324,23 @@ class VaultWatcherAPI:
         async def stop_watcher():
             """Stop the vault watcher."""
             try:
-                if self.watcher is None:
-                    return {"message": "Watcher is not running"}
-                
-                self.watcher.stop()
-                
-                if self.watcher_task:
-                    self.watcher_task.cancel()
-                    try:
-                        await self.watcher_task
-                    except asyncio.CancelledError:
-                        pass
-                
-                self.watcher = None
-                self.watcher_task = None
+                async with self._watcher_lock:
+                    if self.watcher is None:
+                        return {"message": "Watcher is not running"}
+                    
+                    # Stopping waits for files being processed
+                    await self._run_blocking("watcher", self.watcher.stop, timeout=0)
+                    self.event_stream.detach()
+                    
+                    if self.watcher_task:
+                        self.watcher_task.cancel()
+                        try:
+                            await self.watcher_task
+                        except asyncio.CancelledError:
+                            pass
+                    
+                    self.watcher = None
+                    self.watcher_task = None
                 
                 self.logger.info("watcher_stopped")
                 return {"message": "Watcher stopped successfully"}
@@ -206,43 +354,106 @@ class VaultWatcherAPI:
             """Get watcher status."""
             return {
                 "running": self.watcher is not None and self.watcher_task is not None,
-                "started_at": getattr(self.watcher, 'started_at', None) if self.watcher else None
+                "started_at": getattr(self.watcher, 'started_at', None) if self.watcher else None,
+                "events": self.watcher.get_metrics() if self.watcher else None
             }
         
-        @self.app.post("/files/process", response_model=ProcessingResult)
+        @self.app.get("/events")
+        async def stream_events(request: Request, types: Optional[str] = Query(None, description="Comma-separated event types")):
+            """Stream watcher events as server-sent events."""
+            try:
+                client = self.event_stream.connect(self._parse_event_types(types))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
+            return StreamingResponse(
+                self._stream_events(request, client),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
+        
+        @self.app.websocket("/events")
+        async def stream_events_websocket(websocket: WebSocket, types: Optional[str] = None):
+            """Stream watcher events over a WebSocket, one JSON message per event."""
+            try:
+                client = self.event_stream.connect(self._parse_event_types(types))
+            except ValueError as e:
+                await websocket.close(code=1008, reason=str(e))
+                return
+            
+            await websocket.accept()
+            try:
+                await self._relay_events(websocket, client)
+            finally:
+                self.event_stream.disconnect(client)
+        
+        @self.app.post("/files/process", response_model=JobStatus, status_code=202)
         async def process_file(file_path: str):
-            """Process a specific file."""
+            """Queue processing of a specific file and return the job to poll."""
+            if self.watcher is None:
+                raise HTTPException(status_code=400, detail="Watcher is not running")
+            
+            vault_path = Path(self.config.general.vault_path)
+            target_file = vault_path / file_path
+            
+            if not target_file.resolve().is_relative_to(vault_path.resolve()):
+                raise HTTPException(status_code=400, detail="Path is outside the vault")
+            if not target_file.exists():
+                raise HTTPException(status_code=404, detail="File not found")
+            
+            # Hashing, copying and queueing conversions can take long: run it as a job
+            job = self.jobs.submit("process", self._process_file, self.watcher.scheduler, target_file)
+            return self._job_status(job)
+        
+        @self.app.post("/files/process:batch")
+        async def process_files_batch(batch: BatchProcessRequest):
+            """Process many files on the processing pool, streaming one NDJSON line per file."""
+            if self.watcher is None:
+                raise HTTPException(status_code=400, detail="Watcher is not running")
+            if not batch.paths and not batch.glob:
+                raise HTTPException(status_code=400, detail="Either paths or glob is required")
+            
+            paths, rejected, duplicates = await self._run_blocking("process_batch", self._resolve_batch, batch)
+            return StreamingResponse(
+                self._stream_batch(self.watcher.scheduler, paths, rejected, duplicates),
+                media_type="application/x-ndjson",
+            )
+        
+        @self.app.get("/files/process/{job_id}", response_model=JobStatus)
+        async def get_processing_job(job_id: str):
+            """Get the status of a file processing job."""
+            job = self.jobs.get(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+            return self._job_status(job)
+        
+        @self.app.get("/conversions")
+        async def list_conversions(status: Optional[str] = None, limit: int = 100):
+            """List recent 3D conversion jobs."""
             try:
-                if self.watcher is None:
-                    raise HTTPException(status_code=400, detail="Watcher is not running")
-                
-                vault_path = Path(self.config.general.vault_path)
-                target_file = vault_path / file_path
-                
-                if not target_file.exists():
-                    raise HTTPException(status_code=404, detail="File not found")
-                
-                # Process file
-                result = self.watcher.processor.process_file(target_file)
+                def list_jobs():
+                    store = self._get_conversion_store()
+                    return {
+                        "counts": store.counts(),
+                        "jobs": [job._asdict() for job in store.recent(status=status, limit=limit)],
+                    }
                 
-                if result:
-                    return ProcessingResult(
-                        success=True,
-                        message="File processed successfully",
-                        file_path=str(target_file),
-                        destination_path=str(result)
-                    )
-                else:
-                    return ProcessingResult(
-                        success=False,
-                        message="File could not be processed",
-                        file_path=str(target_file)
-                    )
+                return await self._run_blocking("conversions", list_jobs)
             
+            except HTTPException:
+                raise
             except Exception as e:
-                self.logger.error("file_process_error", error=str(e), file_path=file_path)
+                self.logger.error("conversions_get_error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
         
+        @self.app.get("/conversions/{job_id}")
+        async def get_conversion(job_id: str):
+            """Get 3D conversion job status."""
+            job = await self._run_blocking("conversions", self._get_conversion_store().get, job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+            return job._asdict()
+        
         @self.app.get("/config")
         async def get_configuration():
             """Get current configuration."""
@@ -286,24 +497,42 @@ class VaultWatcherAPI:
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.get("/logs")
-        async def get_logs(limit: int = 100):
-            """Get recent logs."""
+        async def get_logs(
+            request: Request,
+            limit: int = Query(100, ge=0, le=10000),
+            level: Optional[str] = None,
+            event: Optional[str] = None,
+            file_path: Optional[str] = None,
+            since: Optional[datetime] = None,
+            until: Optional[datetime] = None,
+            follow: bool = False,
+        ):
+            """Get recent logs, optionally following new lines as server-sent events."""
+            try:
+                log_filter = LogFilter(level=level, event=event, file_path=file_path, since=since, until=until)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            
             try:
-                log_dir = self.config.get_log_dir()
-                log_files = sorted(log_dir.glob("*.log"), key=lambda x: x.stat().st_mtime, reverse=True)
+                def read_tail():
+                    latest_log = self._latest_log_file()
+                    # Start following before reading the tail so no line falls in between
+                    follower = LogFollower(latest_log) if follow and latest_log else None
+                    return follower, tail(latest_log, limit, log_filter) if latest_log else []
                 
-                if not log_files:
-                    return {"logs": []}
+                follower, lines = await self._run_blocking("logs", read_tail)
                 
-                # Read from most recent log file
-                latest_log = log_files[0]
-                with open(latest_log, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
+                if follow:
+                    return StreamingResponse(
+                        self._follow_logs(request, follower, lines, log_filter),
+                        media_type="text/event-stream",
+                        headers={"Cache-Control": "no-cache"},
+                    )
                 
-                # Return last N lines
-                recent_logs = lines[-limit:] if len(lines) > limit else lines
-                return {"logs": [line.strip() for line in recent_logs]}
+                return {"logs": lines}
             
+            except HTTPException:
+                raise
             except Exception as e:
                 self.logger.error("logs_get_error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
@@ -312,46 +541,51 @@ class VaultWatcherAPI:
         async def validate_vault():
             """Validate vault structure."""
             try:
-                vault_path = Path(self.config.general.vault_path)
-                
-                if not vault_path.exists():
+                def validate():
+                    vault_path = Path(self.config.general.vault_path)
+                    
+                    if not vault_path.exists():
+                        return {
+                            "valid": False,
+                            "errors": ["Vault path does not exist"]
+                        }
+                    
+                    errors = []
+                    warnings = []
+                    
+                    # Check required folders
+                    required_folders = [
+                        self.config.folders.inbox,
+                        self.config.folders.projects,
+                        self.config.folders.categories,
+                        self.config.folders.resources,
+                        self.config.folders.admin,
+                    ]
+                    
+                    for folder in required_folders:
+                        folder_path = vault_path / folder
+                        if not folder_path.exists():
+                            errors.append(f"Required folder missing: {folder}")
+                        elif not folder_path.is_dir():
+                            errors.append(f"Path is not a directory: {folder}")
+                    
+                    # Check admin subdirectories
+                    admin_path = vault_path / self.config.folders.admin
+                    if admin_path.exists():
+                        log_dir = admin_path / "logs"
+                        if not log_dir.exists():
+                            warnings.append("Log directory missing in admin folder")
+                    
                     return {
-                        "valid": False,
-                        "errors": ["Vault path does not exist"]
+                        "valid": len(errors) == 0,
+                        "errors": errors,
+                        "warnings": warnings
                     }
                 
-                errors = []
-                warnings = []
-                
-                # Check required folders
-                required_folders = [
-                    self.config.folders.inbox,
-                    self.config.folders.projects,
-                    self.config.folders.categories,
-                    self.config.folders.resources,
-                    self.config.folders.admin,
-                ]
-                
-                for folder in required_folders:
-                    folder_path = vault_path / folder
-                    if not folder_path.exists():
-                        errors.append(f"Required folder missing: {folder}")
-                    elif not folder_path.is_dir():
-                        errors.append(f"Path is not a directory: {folder}")
-                
-                # Check admin subdirectories
-                admin_path = vault_path / self.config.folders.admin
-                if admin_path.exists():
-                    log_dir = admin_path / "logs"
-                    if not log_dir.exists():
-                        warnings.append("Log directory missing in admin folder")
-                
-                return {
-                    "valid": len(errors) == 0,
-                    "errors": errors,
-                    "warnings": warnings
-                }
+                return await self._run_blocking("validate", validate)
             
+            except HTTPException:
+                raise
             except Exception as e:
                 self.logger.error("vault_validate_error", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e))
@@ -364,63 +598,291 @@ class VaultWatcherAPI:
         except asyncio.CancelledError:
             pass
     
-    def _collect_vault_statistics(self) -> Dict[str, Any]:
-        """Collect vault statistics."""
-        stats = {
-            "total_files": 0,
-            "total_size": 0,
-            "projects": 0,
-            "categories": 0,
-            "resources": 0,
-            "models": 0,
-            "notes": 0,
-            "documents": 0,
-            "images": 0,
-        }
+    async def _run_blocking(
+        self,
+        operation: str,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Run blocking work on the executor, answering 504 if it times out."""
+        try:
+            return await self.executor.run(operation, func, *args, timeout=timeout)
+        except OperationTimeoutError as e:
+            self.logger.warning("api_operation_timeout", operation=operation, timeout=e.timeout)
+            raise HTTPException(status_code=504, detail=str(e))
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Stop the executor's worker threads when the app shuts down."""
+        yield
+        self.executor.shutdown(wait=False)
+    
+    async def _limit_rate(self, request: Request, call_next):
+        """Reject requests of clients over ``api.rate_limit`` requests per minute."""
+        if request.url.path in RATE_LIMIT_EXEMPT or (
+            request.url.path == "/logs" and request.query_params.get("follow", "").lower() in ("1", "true")
+        ):
+            return await call_next(request)
         
-        vault_path = Path(self.config.general.vault_path)
+        client = request.client.host if request.client else "unknown"
+        retry_after = self.rate_limiter.acquire(client)
+        if retry_after:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        return await call_next(request)
+    
+    def _resolve_batch(self, batch: BatchProcessRequest) -> Tuple[List[Path], List[Dict[str, Any]], int]:
+        """Resolve the files of a batch request, dropping repeated paths.
         
-        for file_path in vault_path.rglob("*"):
-            if file_path.is_file():
-                stats["total_files"] += 1
-                stats["total_size"] += file_path.stat().st_size
-                
-                if self.config.is_model_file(file_path):
-                    stats["models"] += 1
-                elif self.config.is_note_file(file_path):
-                    stats["notes"] += 1
-                elif self.config.is_document_file(file_path):
-                    stats["documents"] += 1
-                elif self.config.is_image_file(file_path):
-                    stats["images"] += 1
+        Returns the files to process, result lines for paths that cannot be
+        processed and the number of repeated paths.
+        """
+        vault_path = Path(self.config.general.vault_path)
+        vault_root = vault_path.resolve()
+        candidates = list(batch.paths)
+        if batch.glob:
+            try:
+                matches = [path for path in vault_path.glob(batch.glob) if path.is_file()]
+            except (ValueError, NotImplementedError) as e:
+                raise HTTPException(status_code=400, detail=f"Invalid glob: {e}")
+            candidates.extend(str(path.relative_to(vault_path)) for path in matches)
         
-        # Count directories
-        projects_dir = vault_path / self.config.folders.projects
-        categories_dir = vault_path / self.config.folders.categories
-        resources_dir = vault_path / self.config.folders.resources
+        paths: Dict[Path, Path] = {}
+        seen = set()
+        rejected = []
+        for candidate in candidates:
+            resolved = (vault_path / candidate).resolve()
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            if not resolved.is_relative_to(vault_root):
+                rejected.append({"file_path": candidate, "status": "rejected", "error": "Path is outside the vault"})
+            elif not resolved.is_file():
+                rejected.append({"file_path": candidate, "status": "rejected", "error": "File not found"})
+            else:
+                paths[resolved] = vault_path / candidate
+        return list(paths.values()), rejected, len(candidates) - len(seen)
+    
+    async def _stream_batch(
+        self,
+        scheduler: ProcessingScheduler,
+        paths: List[Path],
+        rejected: List[Dict[str, Any]],
+        duplicates: int,
+    ) -> AsyncIterator[str]:
+        """Schedule files and yield an NDJSON line per file as each finishes, then a summary.
         
-        if projects_dir.exists():
-            stats["projects"] = len([d for d in projects_dir.iterdir() if d.is_dir()])
+        Files are submitted without blocking; when the processing queue is full
+        the stream waits for its own files to finish before submitting more.
+        """
+        vault_path = Path(self.config.general.vault_path)
+        counts = Counter(rejected=len(rejected))
+        for line in rejected:
+            yield json.dumps(line) + "\n"
         
-        if categories_dir.exists():
-            stats["categories"] = len([d for d in categories_dir.iterdir() if d.is_dir()])
+        queue = deque(paths)
+        pending: Dict[asyncio.Future, Path] = {}
+        while queue or pending:
+            while queue:
+                try:
+                    future = scheduler.submit(queue[0], block=False)
+                except SchedulerFullError:
+                    break
+                pending[asyncio.wrap_future(future)] = queue.popleft()
+            
+            if not pending:
+                # The queue is full of other work; give it a moment
+                await asyncio.sleep(0.05)
+                continue
+            
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                file_path = pending.pop(future)
+                line = {"file_path": str(file_path.relative_to(vault_path))}
+                if future.exception() is not None:
+                    line.update(status="failed", error=str(future.exception()))
+                elif future.result() is not None:
+                    line.update(status="moved", destination_path=str(future.result()))
+                else:
+                    line.update(status="unchanged")
+                counts[line["status"]] += 1
+                yield json.dumps(line) + "\n"
         
-        if resources_dir.exists():
-            stats["resources"] = len([d for d in resources_dir.iterdir() if d.is_dir()])
+        summary = {"files": len(paths), "duplicates": duplicates}
+        summary.update({status: counts[status] for status in ("moved", "unchanged", "failed", "rejected")})
+        yield json.dumps({"summary": summary}) + "\n"
+    
+    @staticmethod
+    def _process_file(scheduler: ProcessingScheduler, target_file: Path) -> Dict[str, Any]:
+        """Process a file for a background job on the watcher's pool, in order with its events."""
+        result = scheduler.submit(target_file).result()
+        if result:
+            return ProcessingResult(
+                success=True,
+                message="File processed successfully",
+                file_path=str(target_file),
+                destination_path=str(result)
+            ).model_dump()
+        return ProcessingResult(
+            success=False,
+            message="File could not be processed",
+            file_path=str(target_file)
+        ).model_dump()
+    
+    def _job_status(self, job: Job) -> JobStatus:
+        """Describe a background job with the URL to poll it."""
+        return JobStatus(
+            job_id=job.id,
+            operation=job.operation,
+            status=job.status,
+            status_url=self.app.url_path_for("get_processing_job", job_id=job.id),
+            created=datetime.fromtimestamp(job.created),
+            updated=datetime.fromtimestamp(job.updated),
+            result=job.result,
+            error=job.error,
+        )
+    
+    def _get_conversion_store(self) -> ConversionJobStore:
+        """Get conversion job store, shared with the running watcher if any."""
+        if self.watcher is not None:
+            return self.watcher.processor.conversions.store
+        if self._conversion_store is None:
+            self._conversion_store = ConversionJobStore(self.config.get_conversion_jobs_path())
+        return self._conversion_store
+    
+    def _latest_log_file(self) -> Optional[Path]:
+        """Get the most recently written log file."""
+        log_files = sorted(self.config.get_log_dir().glob("*.log"), key=lambda x: x.stat().st_mtime, reverse=True)
+        return log_files[0] if log_files else None
+    
+    async def _follow_logs(
+        self,
+        request: Request,
+        follower: Optional[LogFollower],
+        initial: List[str],
+        log_filter: LogFilter,
+        poll_interval: float = 1.0,
+    ) -> AsyncIterator[str]:
+        """Stream matching log lines as server-sent events until the client disconnects."""
+        for line in initial:
+            yield f"data: {line}\n\n"
         
-        return stats
+        idle = 0.0
+        while not await request.is_disconnected():
+            try:
+                if follower is None:
+                    log_path = await self.executor.run("logs", self._latest_log_file)
+                    follower = LogFollower(log_path, from_end=False) if log_path else None
+                
+                lines = await self.executor.run("logs", follower.read_new) if follower else []
+            except OperationTimeoutError:
+                # The headers are sent, so an error cannot be reported; skip this poll
+                lines = []
+            for line in lines:
+                if log_filter.matches(None if log_filter.empty else parse_line(line)):
+                    yield f"data: {line}\n\n"
+            
+            if lines:
+                idle = 0.0
+                continue
+            if idle >= 15.0:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(poll_interval)
+            idle += poll_interval
+    
+    @staticmethod
+    def _parse_event_types(types: Optional[str]) -> Optional[FrozenSet[str]]:
+        """Parse a comma-separated event type filter."""
+        if not types:
+            return None
+        return frozenset(t.strip() for t in types.split(",") if t.strip())
+    
+    async def _stream_events(
+        self,
+        request: Request,
+        client: EventStreamClient,
+        keep_alive: float = 15.0,
+    ) -> AsyncIterator[str]:
+        """Stream events to a client as server-sent events until it disconnects or is dropped."""
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(client.get(), keep_alive)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    yield "event: dropped\ndata: {}\n\n"
+                    return
+                yield f"event: {message[0]}\ndata: {message[1]}\n\n"
+        finally:
+            self.event_stream.disconnect(client)
+    
+    async def _relay_events(self, websocket: WebSocket, client: EventStreamClient) -> None:
+        """Send events to a WebSocket until the peer closes it or the client is dropped."""
+        receive = asyncio.ensure_future(websocket.receive_text())
+        try:
+            while True:
+                get = asyncio.ensure_future(client.get())
+                done, _ = await asyncio.wait({get, receive}, return_when=asyncio.FIRST_COMPLETED)
+                if receive in done:
+                    # Messages from the peer are ignored; a close ends the stream
+                    if receive.exception() is not None:
+                        get.cancel()
+                        return
+                    receive = asyncio.ensure_future(websocket.receive_text())
+                if get not in done:
+                    get.cancel()
+                    continue
+                
+                message = get.result()
+                if message is None:
+                    await websocket.close(code=1013, reason="Event buffer overflow")
+                    return
+                await websocket.send_text(message[1])
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receive.cancel()
+    
+    def _get_frontmatter_cache(self) -> FrontmatterCache:
+        """Get frontmatter cache, shared with the running watcher if any."""
+        if self.watcher is not None:
+            return self.watcher.processor.frontmatter
+        if self._frontmatter is None:
+            self._frontmatter = FrontmatterCache.from_config(self.config)
+        return self._frontmatter
+    
+    def _get_vault_index(self) -> VaultIndex:
+        """Get vault index, shared with the running watcher if any."""
+        if self.watcher is not None:
+            return self.watcher.index
+        if self._vault_index is None:
+            self._vault_index = VaultIndex.from_config(self.config)
+        return self._vault_index
+    
+    def _collect_vault_statistics(self, refresh: bool = False) -> Dict[str, Any]:
+        """Collect vault statistics from the vault index, reconciling it first if asked or never done."""
+        index = self._get_vault_index()
+        if refresh or index.reconciled_at() is None:
+            index.reconcile()
+        return index.statistics()
+    
+    def _describe_file_type(self, name: str, is_directory: bool) -> str:
+        """Get file type description of a directory entry."""
+        return self._get_file_type(Path(name), is_directory=is_directory)
     
-    def _get_file_type(self, file_path: Path) -> str:
+    def _get_file_type(self, file_path: Path, is_directory: Optional[bool] = None) -> str:
         """Get file type description."""
-        if self.config.is_model_file(file_path):
-            return "3D Model"
-        elif self.config.is_note_file(file_path):
-            return "Note"
-        elif self.config.is_document_file(file_path):
-            return "Document"
-        elif self.config.is_image_file(file_path):
-            return "Image"
-        elif file_path.is_dir():
+        label = FILE_TYPE_LABELS.get(self.config.classify(file_path))
+        if label:
+            return label
+        elif file_path.is_dir() if is_directory is None else is_directory:
             return "Directory"
         else:
             return "File"
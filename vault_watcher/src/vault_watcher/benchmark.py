@@ -0,0 +1,193 @@
+"""Performance benchmarks for Vault Watcher."""
+
+import argparse
+import json
+import re
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from .config import Config
+from .jsonl import JsonlWriter
+from .routing import RoutingTable
+
+
+console = Console()
+
+
+def _event(index: int) -> Dict[str, object]:
+    """Build a log record shaped like a file move."""
+    return {
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "op": "move",
+        "src": f"/vault/0_INBOX/[P:BENCH] part-{index}.stl",
+        "dst": f"/vault/1_PROJECTS/BENCH/models/src/[P:BENCH] part-{index}.stl",
+    }
+
+
+def _rewrite_event(log_path: Path, record: Dict[str, object]) -> None:
+    """Append a record by rewriting the whole file, as the standalone script used to."""
+    existing = log_path.read_text(encoding="utf-8") if log_path.exists() else ""
+    log_path.write_text(existing + json.dumps(record, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def _measure(write: Callable[[int], None], events: int, batches: int) -> List[float]:
+    """Get the mean cost per event in microseconds for consecutive batches."""
+    results = []
+    index = 0
+    for _ in range(batches):
+        started = time.perf_counter()
+        for _ in range(events):
+            write(index)
+            index += 1
+        results.append((time.perf_counter() - started) / events * 1e6)
+    return results
+
+
+def benchmark_jsonl(events: int = 2000, batches: int = 5) -> Dict[str, List[float]]:
+    """Compare per-event cost of the buffered writer and the rewrite approach as the log grows."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        
+        with JsonlWriter(directory / "buffered") as writer:
+            buffered = _measure(lambda index: writer.write(_event(index)), events, batches)
+        
+        rewrite_path = directory / "rewrite.log.jsonl"
+        rewrite = _measure(lambda index: _rewrite_event(rewrite_path, _event(index)), events, batches)
+    
+    return {"buffered": buffered, "rewrite": rewrite}
+
+
+_ASSIGNMENT_RE = re.compile(r"([PRC]):([A-Za-z0-9\-_]+)")
+_NAME_MARK_RE = re.compile(r"\[(P|R|C):([A-Za-z0-9\-_]+)\]")
+
+
+def _legacy_detect(config: Config, file_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Detect an assignment the way FileProcessor did before the routing table."""
+    parts = list(file_path.resolve().parts)
+    
+    if config.folders.projects in parts:
+        i = parts.index(config.folders.projects)
+        if i + 1 < len(parts):
+            return ("P", parts[i + 1])
+    
+    if config.folders.resources in parts and "parts" in parts:
+        i = parts.index("parts")
+        if i + 1 < len(parts):
+            return ("R", parts[i + 1])
+    
+    if config.folders.categories in parts:
+        i = parts.index(config.folders.categories)
+        if i + 1 < len(parts):
+            return ("C", parts[i + 1])
+    
+    assign_file = file_path.with_suffix(file_path.suffix + ".assign")
+    if assign_file.exists():
+        match = _ASSIGNMENT_RE.search(assign_file.read_text(encoding="utf-8", errors="ignore"))
+        if match:
+            return (match.group(1), match.group(2))
+    
+    match = _NAME_MARK_RE.search(file_path.name)
+    if match:
+        return (match.group(1), match.group(2))
+    
+    return (None, None)
+
+
+def _benchmark_config(vault_path: Path) -> Config:
+    """Build a default configuration for a scratch vault."""
+    sections = {
+        name: {} for name in Config.model_fields
+        if name not in ("general", "projects", "categories", "resources")
+    }
+    return Config(
+        general={"vault_path": str(vault_path)},
+        projects={"meta_template": ""},
+        categories={"meta_template": ""},
+        resources={"part_meta_template": ""},
+        **sections,
+    )
+
+
+def _synthetic_paths(config: Config, start: int, count: int) -> List[Path]:
+    """Build event paths spread over the routed folders and the inbox."""
+    vault_path = config.get_vault_path()
+    folders = config.folders
+    layouts = (
+        lambda i: vault_path / folders.projects / f"PRJ{i % 500}" / "models" / "src" / f"part-{i}.stl",
+        lambda i: vault_path / folders.resources / "parts" / f"PART{i % 500}" / f"datasheet-{i}.pdf",
+        lambda i: vault_path / folders.categories / f"CAT{i % 50}" / "incoming" / f"photo-{i}.jpg",
+        lambda i: vault_path / folders.inbox / f"[P:PRJ{i % 500}] part-{i}.stl",
+        lambda i: vault_path / folders.inbox / f"scan-{i}.pdf",
+    )
+    return [layouts[i % len(layouts)](i) for i in range(start, start + count)]
+
+
+def _chunks(total: int, size: int) -> Iterator[Tuple[int, int]]:
+    """Yield (start, count) pairs covering ``total`` items."""
+    for start in range(0, total, size):
+        yield start, min(size, total - start)
+
+
+def benchmark_routing(paths: int = 1_000_000, chunk_size: int = 100_000) -> Dict[str, float]:
+    """Compare per-path cost of assignment detection with and without the routing table."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = _benchmark_config(Path(temp_dir))
+        (config.get_vault_path() / config.folders.inbox).mkdir()
+        routing = RoutingTable(config)
+        detectors = {
+            "legacy": lambda file_path: _legacy_detect(config, file_path),
+            "routing": routing.detect,
+        }
+        
+        elapsed = {name: 0.0 for name in detectors}
+        for start, count in _chunks(paths, chunk_size):
+            batch = _synthetic_paths(config, start, count)
+            for name, detect in detectors.items():
+                started = time.perf_counter()
+                for file_path in batch:
+                    detect(file_path)
+                elapsed[name] += time.perf_counter() - started
+    
+    return {name: seconds / paths * 1e6 for name, seconds in elapsed.items()}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run benchmarks and print their cost tables."""
+    parser = argparse.ArgumentParser(description="Vault Watcher benchmarks")
+    parser.add_argument("--suite", choices=["all", "jsonl", "routing"], default="all", help="Benchmarks to run")
+    parser.add_argument("--events", type=int, default=2000, help="Events per batch")
+    parser.add_argument("--batches", type=int, default=5, help="Number of batches")
+    parser.add_argument("--paths", type=int, default=1_000_000, help="Synthetic paths for the routing benchmark")
+    args = parser.parse_args(argv)
+    
+    if args.suite in ("all", "jsonl"):
+        results = benchmark_jsonl(args.events, args.batches)
+        
+        table = Table(title="JSONL event log: cost per event as the day's log grows")
+        table.add_column("Events logged", justify="right")
+        table.add_column("Buffered append, µs/event", justify="right", style="green")
+        table.add_column("Read + rewrite, µs/event", justify="right", style="red")
+        for batch, (buffered, rewrite) in enumerate(zip(results["buffered"], results["rewrite"], strict=True), start=1):
+            table.add_row(f"{batch * args.events:,}", f"{buffered:.1f}", f"{rewrite:.1f}")
+        console.print(table)
+    
+    if args.suite in ("all", "routing"):
+        costs = benchmark_routing(args.paths)
+        
+        table = Table(title=f"Assignment detection over {args.paths:,} synthetic paths")
+        table.add_column("Detector")
+        table.add_column("µs/path", justify="right")
+        table.add_column("Paths/s", justify="right")
+        table.add_row("resolve() + component scan + .assign stat", f"{costs['legacy']:.2f}", f"{1e6 / costs['legacy']:,.0f}", style="red")
+        table.add_row("Routing table", f"{costs['routing']:.2f}", f"{1e6 / costs['routing']:,.0f}", style="green")
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
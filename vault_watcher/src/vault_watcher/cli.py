@@ -7,12 +7,13 @@ from typing import Optional
 import typer
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.panel import Panel
 from rich.text import Text
 
 from .config import Config
-from .core import VaultWatcher
+from .core import HashDatabase, VaultWatcher
+from .index import VaultIndex
 from .logging import setup_logging, get_logger, log_startup, log_shutdown
 
 app = typer.Typer(
@@ -126,6 +127,9 @@ def status(
     config_file: Optional[Path] = typer.Option(
         None, "--config", "-c", help="Path to configuration file"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", "-r", help="Rescan the vault before reporting"
+    ),
 ):
     """Show vault status and statistics."""
     
@@ -143,7 +147,7 @@ def status(
             sys.exit(1)
         
         # Collect statistics
-        stats = collect_vault_statistics(vault_path, config)
+        stats = collect_vault_statistics(vault_path, config, refresh=refresh)
         
         # Display status
         display_vault_status(vault_path, stats, config)
@@ -153,6 +157,70 @@ def status(
         sys.exit(1)
 
 
+@app.command()
+def scan(
+    config_file: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Path to configuration file"
+    ),
+    vault_path: Optional[Path] = typer.Option(
+        None, "--vault", "-v", help="Path to vault directory"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Run in dry-run mode (no file operations)"
+    ),
+):
+    """Process files added or changed while the watcher was not running."""
+    
+    try:
+        config = Config.from_toml(str(config_file)) if config_file else Config.from_default()
+        if vault_path:
+            config.general.vault_path = str(vault_path)
+        if dry_run:
+            config.general.dry_run = True
+        
+        if not config.validate_vault_path():
+            console.print(f"[red]Error: Vault path does not exist: {config.general.vault_path}[/red]")
+            sys.exit(1)
+        
+        watcher = VaultWatcher(config)
+        try:
+            recovered = watcher.processor.recover()
+            if recovered["completed"] or recovered["rolled_back"]:
+                console.print(
+                    f"[yellow]Recovered interrupted operations: {recovered['completed']} completed, "
+                    f"{recovered['rolled_back']} rolled back[/yellow]"
+                )
+            
+            with console.status("Comparing vault with the index..."):
+                pending = watcher.pending_files()
+            
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Processing files", total=len(pending))
+                summary = watcher.process_files(pending, lambda count: progress.advance(task, count))
+        finally:
+            watcher.scheduler.shutdown(wait=True)
+        
+        table = Table(title="Scan Results")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_row("Pending files", f"{summary['files']:,}")
+        table.add_row("Moved", f"{summary['moved']:,}")
+        table.add_row("Duration", f"{summary['duration_ms'] / 1000:.1f} s")
+        table.add_row("Throughput", f"{summary['files_per_second']:,.1f} files/s")
+        console.print(table)
+    
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
 @app.command()
 def validate(
     config_file: Optional[Path] = typer.Option(
@@ -224,49 +292,58 @@ def init(
         sys.exit(1)
 
 
-def collect_vault_statistics(vault_path: Path, config: Config) -> dict:
-    """Collect vault statistics."""
-    stats = {
-        "total_files": 0,
-        "total_size": 0,
-        "projects": 0,
-        "categories": 0,
-        "resources": 0,
-        "models": 0,
-        "notes": 0,
-        "documents": 0,
-        "images": 0,
-    }
-    
-    for file_path in vault_path.rglob("*"):
-        if file_path.is_file():
-            stats["total_files"] += 1
-            stats["total_size"] += file_path.stat().st_size
-            
-            if config.is_model_file(file_path):
-                stats["models"] += 1
-            elif config.is_note_file(file_path):
-                stats["notes"] += 1
-            elif config.is_document_file(file_path):
-                stats["documents"] += 1
-            elif config.is_image_file(file_path):
-                stats["images"] += 1
-    
-    # Count directories
-    projects_dir = vault_path / config.folders.projects
-    categories_dir = vault_path / config.folders.categories
-    resources_dir = vault_path / config.folders.resources
+@app.command("hash-export")
+def hash_export(
+    config_file: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Path to configuration file"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="JSON file to write (defaults to hash_database.file)"
+    ),
+):
+    """Export the hash database to JSON."""
     
-    if projects_dir.exists():
-        stats["projects"] = len([d for d in projects_dir.iterdir() if d.is_dir()])
+    try:
+        config = Config.from_toml(str(config_file)) if config_file else Config.from_default()
+        hash_db = HashDatabase(config)
+        target = output or config.get_hash_db_path()
+        count = hash_db.export_json(target)
+        console.print(f"[green]Exported {count:,} hashes to: {target}[/green]")
     
-    if categories_dir.exists():
-        stats["categories"] = len([d for d in categories_dir.iterdir() if d.is_dir()])
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+@app.command("hash-import")
+def hash_import(
+    source: Path = typer.Argument(..., help="JSON file with {digest: path} entries"),
+    config_file: Optional[Path] = typer.Option(
+        None, "--config", "-c", help="Path to configuration file"
+    ),
+):
+    """Import hashes from a JSON file into the hash database."""
     
-    if resources_dir.exists():
-        stats["resources"] = len([d for d in resources_dir.iterdir() if d.is_dir()])
+    try:
+        config = Config.from_toml(str(config_file)) if config_file else Config.from_default()
+        hash_db = HashDatabase(config)
+        count = hash_db.import_json(source)
+        console.print(f"[green]Imported {count:,} hashes from: {source}[/green]")
     
-    return stats
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+
+def collect_vault_statistics(vault_path: Path, config: Config, refresh: bool = False) -> dict:
+    """Collect vault statistics from the vault index."""
+    index = VaultIndex.from_config(config)
+    try:
+        if refresh or index.reconciled_at() is None:
+            index.reconcile()
+        return index.statistics()
+    finally:
+        index.close()
 
 
 def display_vault_status(vault_path: Path, stats: dict, config: Config):
@@ -409,6 +486,7 @@ gui_theme = "dark"
 gui_language = "ru"
 gui_window_size = [1200, 800]
 gui_auto_refresh_interval = 5
+gui_update_rate = 10
 
 [file_types]
 model_extensions = [".stl", ".obj", ".fbx", ".dae", ".ply", ".gltf", ".glb", ".3ds", ".blend", ".step", ".stp", ".iges", ".igs"]
@@ -2,13 +2,16 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import toml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from pydantic_settings import BaseSettings
 
 
+FILE_KINDS = ("model", "note", "document", "image", "other")
+
+
 class GeneralSettings(BaseModel):
     """General application settings."""
     
@@ -22,6 +25,8 @@ class GeneralSettings(BaseModel):
     gui_language: str = Field(default="ru", description="GUI language")
     gui_window_size: List[int] = Field(default=[1200, 800], description="GUI window size")
     gui_auto_refresh_interval: int = Field(default=5, description="GUI auto refresh interval")
+    gui_update_rate: int = Field(default=10, description="Maximum GUI updates per second from watcher events")
+    vault_index: str = Field(default="9_ADMIN/vault_index.sqlite3", description="Vault file index")
 
 
 class FileTypesSettings(BaseModel):
@@ -47,6 +52,19 @@ class FileTypesSettings(BaseModel):
         default=[".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"],
         description="Image file extensions"
     )
+    
+    def suffix_map(self) -> Dict[str, str]:
+        """Map lowercase suffixes to file kinds; a suffix listed for two kinds keeps the first."""
+        kinds: Dict[str, str] = {}
+        for kind, extensions in (
+            ("model", self.model_extensions),
+            ("note", self.note_extensions),
+            ("document", self.document_extensions),
+            ("image", self.image_extensions),
+        ):
+            for extension in extensions:
+                kinds.setdefault(extension.lower(), kind)
+        return kinds
 
 
 class FolderSettings(BaseModel):
@@ -97,6 +115,8 @@ class ProcessingSettings(BaseModel):
     enable_hash_deduplication: bool = Field(default=True, description="Enable hash deduplication")
     enable_auto_categorization: bool = Field(default=True, description="Enable auto categorization")
     enable_backup: bool = Field(default=True, description="Enable backup")
+    journal: str = Field(default="9_ADMIN/processing_journal.sqlite3", description="Journal of routing operations in flight")
+    temp_file_max_age: float = Field(default=3600.0, description="Seconds after which temporary files of interrupted copies are removed on recovery")
 
 
 class ThreeDConversionSettings(BaseModel):
@@ -111,14 +131,33 @@ class ThreeDConversionSettings(BaseModel):
         default=["FBX2glTF", "assimp", "blender"],
         description="Available conversion tools"
     )
+    tool_timeouts: Dict[str, int] = Field(
+        default={"FBX2glTF": 300, "assimp": 300, "blender": 900, "gltf-validator": 60, "gltfpack": 300},
+        description="Per-tool timeouts in seconds"
+    )
+    workers: int = Field(default=1, description="Concurrent conversion jobs")
+    max_retries: int = Field(default=2, description="Retries for a failed conversion job")
+    retry_delay: float = Field(default=30.0, description="Base delay between retries in seconds")
+    job_store: str = Field(default="9_ADMIN/conversion_jobs.sqlite3", description="Conversion job store")
+    job_retention_days: float = Field(default=30.0, description="Days to keep finished conversion jobs, 0 keeps them forever")
+    gltfpack_flags: List[str] = Field(
+        default=["-cc", "-tc", "-kn", "-km"],
+        description="gltfpack optimization flags"
+    )
+    enable_cache: bool = Field(default=True, description="Reuse converted models for identical sources")
+    cache_dir: str = Field(default="9_ADMIN/glb_cache", description="Conversion cache directory")
+    cache_max_mb: int = Field(default=2048, description="Conversion cache size limit in MB")
 
 
 class HashDatabaseSettings(BaseModel):
     """Hash database settings."""
     
-    file: str = Field(default="9_ADMIN/hash_index.json", description="Hash database file")
+    file: str = Field(default="9_ADMIN/hash_index.json", description="Hash database import/export file")
+    store: str = Field(default="9_ADMIN/hash_index.sqlite3", description="Hash database store")
     algorithm: str = Field(default="sha256", description="Hash algorithm")
     chunk_size: int = Field(default=1048576, description="Chunk size for hashing")
+    partial_block_size: int = Field(default=65536, description="Head/tail block size for partial hashing")
+    digest_cache_size: int = Field(default=100000, description="Max cached file digests, oldest are pruned")
 
 
 class LoggingSettings(BaseModel):
@@ -140,7 +179,27 @@ class APISettings(BaseModel):
         default=["http://localhost:3000"],
         description="CORS origins"
     )
-    rate_limit: int = Field(default=100, description="Rate limit")
+    rate_limit: int = Field(default=100, description="Requests per minute per client, 0 disables the limit")
+    event_buffer_size: int = Field(default=1000, description="Events buffered per streaming client before it is dropped")
+    executor_workers: int = Field(default=8, description="Threads for blocking work of API requests")
+    concurrency_limits: Dict[str, int] = Field(
+        default={
+            "vault_status": 1,
+            "vault_files": 4,
+            "frontmatter": 4,
+            "conversions": 4,
+            "logs": 2,
+            "validate": 1,
+            "watcher": 1,
+            "process": 2,
+            "process_batch": 2,
+            "metrics": 1,
+        },
+        description="Maximum concurrent calls per API operation; unlisted operations may use every worker"
+    )
+    request_timeout: float = Field(default=30.0, description="Seconds an API request may wait for blocking work")
+    job_timeout: float = Field(default=600.0, description="Seconds a background API job may run")
+    max_jobs: int = Field(default=1000, description="Background API jobs kept for status queries")
 
 
 class DatabaseSettings(BaseModel):
@@ -185,9 +244,13 @@ class PerformanceSettings(BaseModel):
     """Performance settings."""
     
     max_workers: int = Field(default=4, description="Max worker threads")
-    file_scan_interval: int = Field(default=30, description="File scan interval in seconds")
+    file_scan_interval: int = Field(default=0, description="Seconds between rescans of the inbox and ongoing folders for files missed by events, 0 to scan only on start")
     batch_size: int = Field(default=100, description="Batch size for operations")
+    queue_limit: int = Field(default=1000, description="Max queued files before submitters wait")
     memory_limit_mb: int = Field(default=512, description="Memory limit in MB")
+    event_quiet_period: float = Field(default=2.0, description="Seconds a file must stay unchanged before processing")
+    frontmatter_max_bytes: int = Field(default=65536, description="Max bytes of a note read looking for its frontmatter")
+    frontmatter_cache_size: int = Field(default=4096, description="Notes with parsed frontmatter kept in memory")
 
 
 class PluginSettings(BaseModel):
@@ -220,11 +283,18 @@ class Config(BaseSettings):
     performance: PerformanceSettings
     plugins: PluginSettings
     
+    _suffix_kinds: Dict[str, str] = PrivateAttr(default_factory=dict)
+    
     class Config:
         env_prefix = "VAULT_WATCHER_"
         env_file = ".env"
         env_file_encoding = "utf-8"
     
+    def model_post_init(self, __context: Any) -> None:
+        """Build the suffix to file kind map once the settings are loaded."""
+        super().model_post_init(__context)
+        self._suffix_kinds = self.file_types.suffix_map()
+    
     @classmethod
     def from_toml(cls, config_path: str) -> "Config":
         """Load configuration from TOML file."""
@@ -255,10 +325,30 @@ class Config(BaseSettings):
         """Get vault path as Path object."""
         return Path(self.general.vault_path)
     
+    def get_vault_index_path(self) -> Path:
+        """Get vault index path."""
+        return self.get_vault_path() / self.general.vault_index
+    
     def get_hash_db_path(self) -> Path:
         """Get hash database path."""
         return self.get_vault_path() / self.hash_database.file
     
+    def get_hash_store_path(self) -> Path:
+        """Get hash database store path."""
+        return self.get_vault_path() / self.hash_database.store
+    
+    def get_journal_path(self) -> Path:
+        """Get processing journal path."""
+        return self.get_vault_path() / self.processing.journal
+    
+    def get_conversion_jobs_path(self) -> Path:
+        """Get conversion job store path."""
+        return self.get_vault_path() / self.three_d_conversion.job_store
+    
+    def get_conversion_cache_path(self) -> Path:
+        """Get conversion cache directory."""
+        return self.get_vault_path() / self.three_d_conversion.cache_dir
+    
     def get_log_dir(self) -> Path:
         """Get log directory path."""
         return self.get_vault_path() / self.logging.directory
@@ -277,18 +367,22 @@ class Config(BaseSettings):
             self.file_types.image_extensions
         )
     
+    def classify(self, file_path: Union[str, Path]) -> str:
+        """Get the kind of a file from its suffix: one of ``FILE_KINDS``."""
+        return self._suffix_kinds.get(os.path.splitext(file_path)[1].lower(), "other")
+    
     def is_model_file(self, file_path: Path) -> bool:
         """Check if file is a 3D model."""
-        return file_path.suffix.lower() in self.file_types.model_extensions
+        return self.classify(file_path) == "model"
     
     def is_note_file(self, file_path: Path) -> bool:
         """Check if file is a note."""
-        return file_path.suffix.lower() in self.file_types.note_extensions
+        return self.classify(file_path) == "note"
     
     def is_document_file(self, file_path: Path) -> bool:
         """Check if file is a document."""
-        return file_path.suffix.lower() in self.file_types.document_extensions
+        return self.classify(file_path) == "document"
     
     def is_image_file(self, file_path: Path) -> bool:
         """Check if file is an image."""
-        return file_path.suffix.lower() in self.file_types.image_extensions
\ No newline at end of file
+        return self.classify(file_path) == "image"
\ No newline at end of file
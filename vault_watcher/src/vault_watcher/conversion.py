@@ -0,0 +1,423 @@
+"""Background 3D conversion job queue for Vault Watcher."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .config import Config
+from .events import EventBus
+from .logging import LoggerMixin, log_error, log_event
+from .storage import SQLiteStore
+
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+class ConversionError(Exception):
+    """Raised by a conversion handler when a job did not produce a model."""
+    
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class ConversionJob(NamedTuple):
+    """Conversion job record."""
+    
+    id: str
+    source: str
+    kind: str
+    code: str
+    status: str
+    tool: Optional[str]
+    attempts: int
+    error: Optional[str]
+    not_before: float
+    created: float
+    updated: float
+
+
+class ConversionJobStore(SQLiteStore):
+    """Persistent conversion job table."""
+    
+    def _create_schema(self) -> None:
+        """Create the jobs table."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " source TEXT NOT NULL,"
+            " kind TEXT NOT NULL,"
+            " code TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " tool TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " error TEXT,"
+            " not_before REAL NOT NULL,"
+            " created REAL NOT NULL,"
+            " updated REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, not_before)")
+    
+    def add(self, source: str, kind: str, code: str) -> str:
+        """Queue a job, reusing a pending job for the same source."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM jobs WHERE source = ? AND status IN ('queued', 'running')",
+                (source,),
+            ).fetchone()
+            if row:
+                return row[0]
+            
+            job_id = uuid.uuid4().hex
+            self._conn.execute(
+                "INSERT INTO jobs (id, source, kind, code, status, not_before, created, updated)"
+                " VALUES (?, ?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, source, kind, code, now, now, now),
+            )
+        return job_id
+    
+    def claim(self) -> Optional[ConversionJob]:
+        """Mark the oldest due queued job as running and return it."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' AND not_before <= ?"
+                " ORDER BY created LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated = ? WHERE id = ?",
+                (now, row[0]),
+            )
+        job = ConversionJob(*row)
+        return job._replace(status="running", attempts=job.attempts + 1, updated=now)
+    
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        tool: Optional[str] = None,
+        error: Optional[str] = None,
+        not_before: Optional[float] = None,
+    ) -> None:
+        """Record the outcome of a job attempt."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, tool = COALESCE(?, tool), error = ?,"
+                " not_before = COALESCE(?, not_before), updated = ? WHERE id = ?",
+                (status, tool, error, not_before, now, job_id),
+            )
+    
+    def requeue_running(self) -> int:
+        """Return jobs interrupted by a shutdown or crash to the queue."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'queued', updated = ? WHERE status = 'running'",
+                (time.time(),),
+            )
+        return cursor.rowcount
+    
+    def prune_finished(self, max_age: float) -> int:
+        """Delete done and failed jobs last updated more than ``max_age`` seconds ago."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated < ?",
+                (time.time() - max_age,),
+            )
+        return cursor.rowcount
+    
+    def get(self, job_id: str) -> Optional[ConversionJob]:
+        """Get a job by id."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return ConversionJob(*row) if row else None
+    
+    def recent(self, status: Optional[str] = None, limit: int = 100) -> List[ConversionJob]:
+        """List most recently updated jobs."""
+        query = "SELECT * FROM jobs"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY updated DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [ConversionJob(*row) for row in rows]
+    
+    def counts(self) -> Dict[str, int]:
+        """Count jobs by status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update(dict(rows))
+        return counts
+
+
+class ConversionCache(SQLiteStore):
+    """Content-addressed cache of converted GLB models with an LRU size cap.
+    
+    Entries are keyed by everything that determines the output (source digest,
+    converter chain with versions and conversion settings), so a model that is
+    routed into a second project is restored from the cache instead of being
+    converted again. Least recently used entries are evicted once the cache
+    grows beyond ``max_bytes``.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        super().__init__(directory / "index.sqlite3")
+    
+    @classmethod
+    def from_config(cls, config: Config) -> "ConversionCache":
+        """Create cache from 3D conversion settings."""
+        settings = config.three_d_conversion
+        return cls(config.get_conversion_cache_path(), settings.cache_max_mb * 1024 * 1024)
+    
+    def _create_schema(self) -> None:
+        """Create the entries table."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " tool TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+    
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from the inputs that determine a conversion result."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        """Get cache file path for a key."""
+        return self.directory / key[:2] / f"{key}.glb"
+    
+    def restore(self, key: str, dest_path: Path) -> Optional[str]:
+        """Place a cached model at ``dest_path`` and return the tool that produced it.
+        
+        The model is hard-linked when possible and copied otherwise. Returns None
+        on a cache miss.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT tool FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        entry_path = self._entry_path(key)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = dest_path.with_name(f".{dest_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(entry_path, temp_path)
+        except FileNotFoundError:
+            self._delete(key)
+            return None
+        except OSError:
+            shutil.copyfile(entry_path, temp_path)
+        os.replace(temp_path, dest_path)
+        
+        with self._lock:
+            self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+    
+    def put(self, key: str, glb_path: Path, tool: str) -> None:
+        """Store a converted model and evict old entries beyond the size cap."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fd, temp_name = tempfile.mkstemp(dir=str(entry_path.parent), suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(glb_path, temp_name)
+            os.replace(temp_name, entry_path)
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, tool, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, tool, entry_path.stat().st_size, time.time()),
+            )
+        self._evict()
+    
+    def total_size(self) -> int:
+        """Get total size of cached models in bytes."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    
+    def _delete(self, key: str) -> None:
+        """Remove an entry and its file."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._entry_path(key).unlink(missing_ok=True)
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        total = self.total_size()
+        while total > self.max_bytes:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT key, size FROM entries ORDER BY last_used LIMIT 1"
+                ).fetchone()
+            if row is None:
+                return
+            self._delete(row[0])
+            total -= row[1]
+
+
+class ConversionQueue(LoggerMixin):
+    """Background workers draining the persistent conversion job table.
+    
+    Routing only enqueues a job, so it returns immediately; conversions run on
+    ``workers`` threads of their own with retries and survive restarts.
+    """
+    
+    def __init__(
+        self,
+        store: ConversionJobStore,
+        handler: Callable[[ConversionJob], Optional[str]],
+        workers: int = 1,
+        max_retries: int = 2,
+        retry_delay: float = 30.0,
+        poll_interval: float = 1.0,
+        events: Optional[EventBus] = None,
+        retention: float = 0.0,
+    ):
+        self.store = store
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.events = events
+        self.retention = retention
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+    
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        handler: Callable[[ConversionJob], Optional[str]],
+        events: Optional[EventBus] = None,
+    ) -> "ConversionQueue":
+        """Create queue from 3D conversion settings."""
+        settings = config.three_d_conversion
+        return cls(
+            ConversionJobStore(config.get_conversion_jobs_path()),
+            handler,
+            workers=settings.workers,
+            max_retries=settings.max_retries,
+            retry_delay=settings.retry_delay,
+            events=events,
+            retention=settings.job_retention_days * 86400,
+        )
+    
+    def enqueue(self, source: Path, kind: str, code: str) -> str:
+        """Queue conversion of a model and return the job id."""
+        job_id = self.store.add(str(source), kind, code)
+        log_event(self.logger, "conversion_queued", job_id=job_id, source=str(source))
+        with self._condition:
+            self._condition.notify()
+        return job_id
+    
+    def start(self) -> None:
+        """Start worker threads, resuming jobs interrupted earlier and pruning old finished ones."""
+        if self._running:
+            return
+        requeued = self.store.requeue_running()
+        if requeued:
+            self.logger.info("conversion_jobs_resumed", jobs=requeued)
+        if self.retention > 0:
+            pruned = self.store.prune_finished(self.retention)
+            if pruned:
+                self.logger.info("conversion_jobs_pruned", jobs=pruned)
+        
+        self._running = True
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"Conversion-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self) -> None:
+        """Stop worker threads after their current job."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get queue status."""
+        return {"running": self._running, "workers": self.workers, "jobs": self.store.counts()}
+    
+    def _run(self) -> None:
+        """Claim and run jobs until stopped."""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+            
+            job = self.store.claim()
+            if job is None:
+                with self._condition:
+                    if self._running:
+                        self._condition.wait(self.poll_interval)
+                continue
+            
+            self._run_job(job)
+    
+    def _run_job(self, job: ConversionJob) -> None:
+        """Run one job attempt and record its outcome."""
+        started = time.monotonic()
+        try:
+            tool = self.handler(job)
+        except Exception as e:
+            retryable = getattr(e, "retryable", True)
+            if retryable and job.attempts <= self.max_retries:
+                self.store.finish(
+                    job.id,
+                    "queued",
+                    error=str(e),
+                    not_before=time.time() + self.retry_delay * job.attempts,
+                )
+                self.logger.warning("conversion_retry_scheduled", job_id=job.id, attempts=job.attempts, error=str(e))
+            else:
+                self.store.finish(job.id, "failed", error=str(e))
+                log_error(self.logger, "conversion_failed", e, job_id=job.id, source=job.source)
+                if self.events is not None:
+                    self.events.publish("failed", job.source, stage="conversion", job_id=job.id, error=str(e))
+            return
+        
+        self.store.finish(job.id, "done", tool=tool)
+        log_event(
+            self.logger,
+            "conversion_done",
+            job_id=job.id,
+            source=job.source,
+            tool=tool,
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+        )
\ No newline at end of file
@@ -1,56 +1,101 @@
 """Core functionality for Vault Watcher."""
 
+import filecmp
 import hashlib
-import json
-import re
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import uuid
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import yaml
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 from .config import Config
+from .conversion import ConversionCache, ConversionError, ConversionJob, ConversionQueue
+from .events import EventBus
+from .fileops import move_file, remove_temp_files, sweep_temp_files
+from .frontmatter import FrontmatterCache
+from .index import VaultIndex
+from .journal import ProcessingJournal
 from .logging import LoggerMixin, get_logger, log_event, log_error, log_file_operation
+from .metrics import ProcessingMetrics
+from .pipeline import EventPipeline
+from .routing import RoutingTable
+from .scheduler import ProcessingScheduler
+from .storage import DigestCache, HashStore
+
+
+@dataclass
+class FileFingerprint:
+    """Size and digests known for a file, filled in tier by tier."""
+    
+    size: int
+    partial: Optional[str] = None
+    digest: Optional[str] = None
 
 
 class HashDatabase:
-    """Hash database for file deduplication."""
+    """Hash database for file deduplication.
+    
+    Duplicate detection is tiered: the size index rules out most files without
+    reading them, a head/tail partial digest rules out most same-size files, and
+    the full digest is only computed when partial digests collide.
+    """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, metrics: Optional[ProcessingMetrics] = None):
         self.config = config
         self.logger = get_logger("HashDatabase")
+        self.metrics = metrics if metrics is not None else ProcessingMetrics()
         self.db_path = config.get_hash_db_path()
+        self.store = HashStore(config.get_hash_store_path())
+        self.digest_cache = DigestCache(config.get_hash_store_path(), config.hash_database.digest_cache_size)
+        self._size_locks = [threading.Lock() for _ in range(64)]
         self._load_database()
     
     def _load_database(self) -> None:
-        """Load hash database from file."""
-        if self.db_path.exists():
+        """Open hash store, importing the legacy JSON index on first run."""
+        if len(self.store) == 0 and self.db_path.exists():
             try:
-                with open(self.db_path, "r", encoding="utf-8") as f:
-                    self.db = json.load(f)
-                self.logger.info("hash_database_loaded", entries=len(self.db))
+                imported = self.import_json(self.db_path)
+                self.logger.info("hash_database_imported", entries=imported, source=str(self.db_path))
             except Exception as e:
                 log_error(self.logger, "hash_database_load_failed", e)
-                self.db = {}
-        else:
-            self.db = {}
+        self._backfill_sizes()
+        self.logger.info("hash_database_loaded", entries=len(self.store))
     
-    def _save_database(self) -> None:
-        """Save hash database to file."""
-        try:
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump(self.db, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            log_error(self.logger, "hash_database_save_failed", e)
+    def _backfill_sizes(self) -> None:
+        """Fill in sizes for entries imported without them."""
+        for path in self.store.missing("size"):
+            try:
+                size = Path(path).stat().st_size
+            except OSError:
+                size = -1
+            self.store.update(path, size=size)
+    
+    def import_json(self, json_path: Optional[Path] = None) -> int:
+        """Import entries from a JSON index file."""
+        imported = self.store.import_json(json_path or self.db_path)
+        self._backfill_sizes()
+        return imported
+    
+    def export_json(self, json_path: Optional[Path] = None) -> int:
+        """Export entries to a JSON index file, hashing entries without a digest."""
+        for path in self.store.missing("digest"):
+            file_path = Path(path)
+            if file_path.exists():
+                file_hash = self.file_digest(file_path)
+                if file_hash:
+                    self.store.update(path, digest=file_hash)
+        return self.store.export_json(json_path or self.db_path)
     
     def calculate_hash(self, file_path: Path) -> str:
         """Calculate hash of a file."""
@@ -58,7 +103,7 @@ class HashDatabase:
         chunk_size = self.config.hash_database.chunk_size
         
         try:
-            with open(file_path, "rb") as f:
+            with self.metrics.hash_seconds.labels("full").time(), open(file_path, "rb") as f:
                 while chunk := f.read(chunk_size):
                     hash_obj.update(chunk)
             return hash_obj.hexdigest()
@@ -66,107 +111,208 @@ class HashDatabase:
             log_error(self.logger, "hash_calculation_failed", e, file_path=str(file_path))
             return ""
     
-    def is_duplicate(self, file_path: Path) -> Optional[Path]:
-        """Check if file is a duplicate."""
-        file_hash = self.calculate_hash(file_path)
-        if not file_hash:
-            return None
-        
-        if file_hash in self.db:
-            existing_path = Path(self.db[file_hash])
-            if existing_path.exists():
-                return existing_path
+    def calculate_partial_hash(self, file_path: Path, size: int) -> str:
+        """Calculate hash of the head and tail blocks of a file."""
+        hash_obj = hashlib.new(self.config.hash_database.algorithm)
+        block_size = self.config.hash_database.partial_block_size
         
-        return None
+        try:
+            with self.metrics.hash_seconds.labels("partial").time(), open(file_path, "rb") as f:
+                hash_obj.update(f.read(block_size))
+                if size > 2 * block_size:
+                    f.seek(size - block_size)
+                hash_obj.update(f.read(block_size))
+            return hash_obj.hexdigest()
+        except Exception as e:
+            log_error(self.logger, "hash_calculation_failed", e, file_path=str(file_path))
+            return ""
     
-    def add_file(self, file_path: Path) -> None:
-        """Add file to hash database."""
+    def file_digest(self, file_path: Path) -> str:
+        """Get file digest, reading the file only if its stat identity is not cached."""
+        algorithm = self.config.hash_database.algorithm
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            log_error(self.logger, "hash_calculation_failed", e, file_path=str(file_path))
+            return ""
+        
+        cached = self.digest_cache.get(stat, algorithm)
+        if cached:
+            return cached
+        
         file_hash = self.calculate_hash(file_path)
         if file_hash:
-            self.db[file_hash] = str(file_path)
-            self._save_database()
-            log_event(self.logger, "file_added_to_hash_db", file_path=str(file_path), hash=file_hash)
+            self.remember_digest(file_path, file_hash, stat)
+        return file_hash
+    
+    def remember_digest(self, file_path: Path, file_hash: str, stat: Optional[os.stat_result] = None) -> None:
+        """Record a known digest for the file's current stat identity."""
+        try:
+            self.digest_cache.put(stat or file_path.stat(), self.config.hash_database.algorithm, file_hash)
+        except Exception as e:
+            log_error(self.logger, "digest_cache_save_failed", e, file_path=str(file_path))
+    
+    def find_duplicate(self, file_path: Path) -> Tuple[Optional[Path], Optional[FileFingerprint]]:
+        """Find a stored file with the same content.
+        
+        Returns the duplicate (if any) and the fingerprint computed on the way,
+        so it can be handed to ``add_file`` after the file is moved.
+        """
+        try:
+            fingerprint = FileFingerprint(size=file_path.stat().st_size)
+        except OSError as e:
+            log_error(self.logger, "hash_calculation_failed", e, file_path=str(file_path))
+            return None, None
+        
+        # Tier 1: size index
+        candidates = [
+            entry for entry in self.store.with_size(fingerprint.size)
+            if entry.path != str(file_path)
+        ]
+        if not candidates:
+            return None, fingerprint
+        
+        # Tier 2: head/tail partial digest
+        fingerprint.partial = self.calculate_partial_hash(file_path, fingerprint.size)
+        if not fingerprint.partial:
+            return None, fingerprint
+        
+        matches = []
+        for entry in candidates:
+            partial = entry.partial
+            if partial is None:
+                if not Path(entry.path).exists():
+                    continue
+                partial = self.calculate_partial_hash(Path(entry.path), fingerprint.size)
+                if partial:
+                    self.store.update(entry.path, partial=partial)
+            if partial == fingerprint.partial:
+                matches.append(entry)
+        
+        if not matches:
+            return None, fingerprint
+        
+        # Tier 3: full digest
+        fingerprint.digest = self.file_digest(file_path)
+        if not fingerprint.digest:
+            return None, fingerprint
+        
+        for entry in matches:
+            existing_path = Path(entry.path)
+            if not existing_path.exists():
+                continue
+            digest = entry.digest
+            if digest is None:
+                digest = self.file_digest(existing_path)
+                if digest:
+                    self.store.update(entry.path, digest=digest)
+            if digest == fingerprint.digest:
+                return existing_path, fingerprint
+        
+        return None, fingerprint
+    
+    def size_lock(self, file_path: Path) -> threading.Lock:
+        """Get the lock serializing dedup checks for files of this file's size.
+        
+        Files of different sizes can never be duplicates of each other, so only
+        same-size files need to wait for one another's check-and-register step.
+        """
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+        return self._size_locks[size % len(self._size_locks)]
+    
+    def is_duplicate(self, file_path: Path) -> Optional[Path]:
+        """Check if file is a duplicate."""
+        duplicate, _ = self.find_duplicate(file_path)
+        return duplicate
+    
+    def add_file(self, file_path: Path, fingerprint: Optional[FileFingerprint] = None) -> None:
+        """Add file to hash database.
+        
+        A fingerprint computed before a move can be passed in so the moved file
+        is not read again; a known digest is cached for the destination's stat
+        identity.
+        """
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            return
+        
+        if fingerprint is None or fingerprint.size != size:
+            fingerprint = FileFingerprint(size=size)
+        elif fingerprint.digest:
+            self.remember_digest(file_path, fingerprint.digest)
+        
+        try:
+            self.store.put(str(file_path), fingerprint.size, fingerprint.partial, fingerprint.digest)
+        except Exception as e:
+            log_error(self.logger, "hash_database_save_failed", e)
+            return
+        log_event(self.logger, "file_added_to_hash_db", file_path=str(file_path), hash=fingerprint.digest)
 
 
 class FileProcessor:
     """File processing and categorization."""
     
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        events: Optional[EventBus] = None,
+        metrics: Optional[ProcessingMetrics] = None,
+    ):
         self.config = config
         self.logger = get_logger("FileProcessor")
-        self.hash_db = HashDatabase(config)
-        
-        # Regular expressions for file categorization
-        self.assignment_re = re.compile(r"([PRC]):([A-Za-z0-9\\-_]+)")
-        self.name_mark_re = re.compile(r"\\[(P|R|C):([A-Za-z0-9\\-_]+)\\]")
-        self.frontmatter_re = re.compile(r"^---\\n(.*?)\\n---", re.S)
+        self.events = events if events is not None else EventBus()
+        self.metrics = metrics if metrics is not None else ProcessingMetrics()
+        self.events.subscribe(self.metrics.count_event)
+        self.hash_db = HashDatabase(config, self.metrics)
+        self.conversions = ConversionQueue.from_config(config, self._run_conversion_job, self.events)
+        self.conversion_cache = ConversionCache.from_config(config) if config.three_d_conversion.enable_cache else None
+        self._tool_versions: Dict[str, str] = {}
+        self.frontmatter = FrontmatterCache.from_config(config)
+        self.journal = ProcessingJournal.from_config(config)
+        self.routing = RoutingTable(config)
     
     def detect_assignment(self, file_path: Path) -> Tuple[Optional[str], Optional[str]]:
         """Detect file assignment from path or filename."""
-        # Check path structure
-        parts = [p.name for p in file_path.resolve().parts]
-        
-        if self.config.folders.projects in parts:
-            i = parts.index(self.config.folders.projects)
-            if i + 1 < len(parts):
-                return ("P", parts[i + 1])
-        
-        if self.config.folders.resources in parts and "parts" in parts:
-            i = parts.index("parts")
-            if i + 1 < len(parts):
-                return ("R", parts[i + 1])
-        
-        if self.config.folders.categories in parts:
-            i = parts.index(self.config.folders.categories)
-            if i + 1 < len(parts):
-                return ("C", parts[i + 1])
-        
-        # Check assignment file
-        assign_file = file_path.with_suffix(file_path.suffix + ".assign")
-        if assign_file.exists():
-            try:
-                content = assign_file.read_text(encoding="utf-8", errors="ignore")
-                match = self.assignment_re.search(content)
-                if match:
-                    return (match.group(1), match.group(2))
-            except Exception as e:
-                log_error(self.logger, "assignment_file_read_failed", e, file_path=str(assign_file))
-        
-        # Check filename for marks
-        match = self.name_mark_re.search(file_path.name)
-        if match:
-            return (match.group(1), match.group(2))
-        
-        return (None, None)
+        return self.routing.detect(file_path)
+    
+    def is_routed(self, file_path: Path) -> bool:
+        """Check whether a file already lies in the folder of a project, part or category."""
+        kind, _ = self.routing.match_folder(file_path)
+        return kind is not None
     
     def process_note_file(self, file_path: Path) -> Optional[Path]:
         """Process note file with frontmatter."""
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            match = self.frontmatter_re.search(content)
+            frontmatter = self.frontmatter.get(file_path)
             
-            if match:
-                frontmatter = yaml.safe_load(match.group(1)) or {}
-                
-                # Handle project notes
-                if frontmatter.get("type") == "note" and frontmatter.get("project"):
-                    project_code = frontmatter["project"]
-                    dest_path = self.config.get_vault_path() / self.config.folders.projects / project_code / "notes" / file_path.name
-                    return self._move_file(file_path, dest_path)
-                
-                # Handle category notes
-                if frontmatter.get("type") == "note" and frontmatter.get("category"):
-                    category_code = frontmatter["category"]
-                    dest_path = self.config.get_vault_path() / self.config.folders.categories / category_code / "notes" / file_path.name
-                    return self._move_file(file_path, dest_path)
+            # Handle project notes
+            if frontmatter.get("type") == "note" and frontmatter.get("project"):
+                project_code = frontmatter["project"]
+                dest_path = self.config.get_vault_path() / self.config.folders.projects / project_code / "notes" / file_path.name
+                return self._move_file(file_path, dest_path)
+            
+            # Handle category notes
+            if frontmatter.get("type") == "note" and frontmatter.get("category"):
+                category_code = frontmatter["category"]
+                dest_path = self.config.get_vault_path() / self.config.folders.categories / category_code / "notes" / file_path.name
+                return self._move_file(file_path, dest_path)
         
         except Exception as e:
             log_error(self.logger, "note_processing_failed", e, file_path=str(file_path))
+            self.events.publish("failed", file_path, stage="note", error=str(e))
         
         return None
     
     def process_file(self, file_path: Path) -> Optional[Path]:
-        """Process any file."""
+        """Process any file and publish where it ended up.
+        
+        ``processed`` is only published for files that were routed; files left
+        in place, duplicates and failures have events of their own or none.
+        """
         if not file_path.exists() or file_path.is_dir():
             return None
         
@@ -174,8 +320,20 @@ class FileProcessor:
         if file_path.name.startswith("."):
             return None
         
+        try:
+            with self.metrics.process_seconds.time():
+                moved_path = self._route_file(file_path)
+        except Exception as e:
+            self.events.publish("failed", file_path, stage="routing", error=str(e))
+            raise
+        if moved_path is not None:
+            self.events.publish("processed", file_path, moved_path)
+        return moved_path
+    
+    def _route_file(self, file_path: Path) -> Optional[Path]:
+        """Route a file to its destination folder."""
         # Process note files
-        if self.config.is_note_file(file_path):
+        if self.config.classify(file_path) == "note":
             return self.process_note_file(file_path)
         
         # Detect assignment
@@ -183,44 +341,107 @@ class FileProcessor:
         if not kind or not code:
             return None
         
-        # Check for duplicates
-        if self.config.processing.enable_hash_deduplication:
-            duplicate = self.hash_db.is_duplicate(file_path)
-            if duplicate:
-                self.logger.info("duplicate_file_found", original=str(duplicate), duplicate=str(file_path))
-                file_path.unlink(missing_ok=True)
-                return None
-        
         # Determine destination
         dest_path = self._get_destination_path(file_path, kind, code)
         if not dest_path:
             return None
         
-        # Move file
-        moved_path = self._move_file(file_path, dest_path)
-        if moved_path:
-            # Add to hash database
-            if self.config.processing.enable_hash_deduplication:
-                self.hash_db.add_file(moved_path)
+        # Already routed (e.g. the event for a file we just moved)
+        if dest_path.resolve() == file_path.resolve():
+            return None
+        
+        dedup = self.config.processing.enable_hash_deduplication
+        with self.hash_db.size_lock(file_path) if dedup else nullcontext():
+            # Check for duplicates
+            fingerprint = None
+            if dedup:
+                duplicate, fingerprint = self.hash_db.find_duplicate(file_path)
+                self.metrics.dedup_checks.labels("hit" if duplicate else "miss").inc()
+                if duplicate:
+                    self.logger.info("duplicate_file_found", original=str(duplicate), duplicate=str(file_path))
+                    file_path.unlink(missing_ok=True)
+                    self.events.publish("deduplicated", file_path, original=str(duplicate))
+                    return None
+            
+            # Move file, journaling each step so an interrupted routing can be recovered
+            entry_id = None if self.config.general.dry_run else self.journal.begin(file_path, dest_path, kind, code)
+            moved_path = self._move_file(file_path, dest_path, entry_id)
             
-            # Process 3D models
-            if self.config.processing.enable_3d_conversion and self.config.is_model_file(moved_path):
-                self._process_3d_model(moved_path, kind, code)
+            # Add to hash database
+            if moved_path and dedup:
+                self.hash_db.add_file(moved_path, fingerprint)
+                if entry_id is not None:
+                    self.journal.advance(entry_id, "recorded")
+        
+        # Process 3D models
+        if moved_path and self.config.processing.enable_3d_conversion and self.config.classify(moved_path) == "model":
+            self._process_3d_model(moved_path, kind, code)
         
+        if moved_path and entry_id is not None:
+            self.journal.finish(entry_id)
         return moved_path
     
+    def recover(self) -> Dict[str, int]:
+        """Finish or roll back routing operations interrupted by a crash.
+        
+        A move whose file reached the destination is completed: a leftover
+        source copy is removed and the remaining steps are run. A move that did
+        not get there is rolled back by leaving the source in place for the next
+        scan. Temporary files of interrupted copies are removed either way, and
+        stale ones anywhere in the destination folders are swept up afterwards.
+        """
+        counts = {"completed": 0, "rolled_back": 0, "temp_files_removed": 0}
+        for entry in self.journal.pending():
+            src_path, dest_path = Path(entry.src), Path(entry.dest)
+            try:
+                counts["temp_files_removed"] += remove_temp_files(dest_path)
+                if entry.step == "moving" and not self._resume_move(src_path, dest_path):
+                    counts["rolled_back"] += 1
+                else:
+                    self._finish_routing(dest_path, entry.kind, entry.code, entry.step)
+                    counts["completed"] += 1
+                self.journal.finish(entry.id)
+            except Exception as e:
+                log_error(self.logger, "journal_recovery_failed", e, src=entry.src, dest=entry.dest)
+        
+        vault_path = self.config.get_vault_path()
+        folders = self.config.folders
+        roots = [vault_path / folder for folder in (folders.projects, folders.categories, folders.resources)]
+        counts["temp_files_removed"] += sweep_temp_files(roots, self.config.processing.temp_file_max_age)
+        return counts
+    
+    def _resume_move(self, src_path: Path, dest_path: Path) -> bool:
+        """Check whether an interrupted move reached its destination, removing the source if it is left over."""
+        if not dest_path.exists():
+            return False
+        if src_path.exists():
+            # The destination is replaced atomically, so matching contents mean only the unlink was missed
+            if not filecmp.cmp(src_path, dest_path, shallow=False):
+                return False
+            src_path.unlink()
+        return True
+    
+    def _finish_routing(self, dest_path: Path, kind: Optional[str], code: Optional[str], step: str) -> None:
+        """Run the routing steps that follow a move and were not journaled as done."""
+        if kind is None or code is None:
+            return
+        if step != "recorded" and self.config.processing.enable_hash_deduplication:
+            self.hash_db.add_file(dest_path)
+        if self.config.processing.enable_3d_conversion and self.config.classify(dest_path) == "model":
+            self._process_3d_model(dest_path, kind, code)
+    
     def _get_destination_path(self, file_path: Path, kind: str, code: str) -> Optional[Path]:
         """Get destination path for file."""
         vault_path = self.config.get_vault_path()
         
         if kind == "P":  # Project
-            if self.config.is_model_file(file_path):
+            if self.config.classify(file_path) == "model":
                 return vault_path / self.config.folders.projects / code / "models" / "src" / file_path.name
             else:
                 return vault_path / self.config.folders.projects / code / "assets" / file_path.name
         
         elif kind == "R":  # Resource/Part
-            if self.config.is_model_file(file_path):
+            if self.config.classify(file_path) == "model":
                 return vault_path / self.config.folders.resources / "parts" / code / "models" / "src" / file_path.name
             else:
                 return vault_path / self.config.folders.resources / "parts" / code / file_path.name
@@ -230,62 +451,135 @@ class FileProcessor:
         
         return None
     
-    def _move_file(self, src_path: Path, dest_path: Path) -> Optional[Path]:
-        """Move file atomically."""
+    def _move_file(self, src_path: Path, dest_path: Path, entry_id: Optional[int] = None) -> Optional[Path]:
+        """Move file atomically.
+        
+        The move is journaled under ``entry_id``, or under an entry of its own
+        that is closed as soon as the file is in place.
+        """
         if self.config.general.dry_run:
             self.logger.info("dry_run_move", src=str(src_path), dest=str(dest_path))
             return dest_path
         
-        try:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Use atomic move
-            with tempfile.NamedTemporaryFile(dir=str(dest_path.parent), delete=False) as tf:
-                temp_path = Path(tf.name)
-            
-            shutil.copy2(src_path, temp_path)
-            temp_path.replace(dest_path)
-            
-            # Remove original
-            try:
-                src_path.unlink()
-            except Exception:
-                pass
-            
-            log_file_operation(self.logger, "file_moved", dest_path, src=str(src_path))
-            return dest_path
+        own_entry = entry_id is None
+        if own_entry:
+            entry_id = self.journal.begin(src_path, dest_path)
         
+        try:
+            started = time.monotonic()
+            method = move_file(src_path, dest_path, self.config.hash_database.chunk_size)
+            self.metrics.move_seconds.labels(method).observe(time.monotonic() - started)
+            log_file_operation(self.logger, "file_moved", dest_path, src=str(src_path), method=method)
         except Exception as e:
             log_error(self.logger, "file_move_failed", e, src=str(src_path), dest=str(dest_path))
+            self.journal.finish(entry_id)
+            self.events.publish("failed", src_path, dest_path, stage="move", error=str(e))
             return None
+        
+        if own_entry:
+            self.journal.finish(entry_id)
+        else:
+            self.journal.advance(entry_id, "moved")
+        self.events.publish("moved", src_path, dest_path, method=method)
+        return dest_path
     
-    def _process_3d_model(self, model_path: Path, kind: str, code: str) -> None:
-        """Process 3D model conversion."""
+    def _process_3d_model(self, model_path: Path, kind: str, code: str) -> Optional[str]:
+        """Queue 3D model conversion and return the job id."""
+        if kind not in ("P", "R"):
+            return None
+        
         try:
-            # Determine GLB output path
-            if kind == "P":
-                glb_path = model_path.parent.parent / "glb" / f"{model_path.stem}.glb"
-            else:  # kind == "R"
-                glb_path = model_path.parent.parent / "glb" / f"{model_path.stem}.glb"
+            return self.conversions.enqueue(model_path, kind, code)
+        except Exception as e:
+            log_error(self.logger, "3d_model_processing_failed", e, model_path=str(model_path))
+            self.events.publish("failed", model_path, stage="conversion", error=str(e))
+            return None
+    
+    def _run_conversion_job(self, job: ConversionJob) -> str:
+        """Convert a queued model, sanitize it and update meta files."""
+        model_path = Path(job.source)
+        if not model_path.exists():
+            raise ConversionError(f"source model missing: {model_path}", retryable=False)
+        
+        glb_path = model_path.parent.parent / "glb" / f"{model_path.stem}.glb"
+        
+        # Reuse a previous conversion of the same source
+        cache_key = self._conversion_cache_key(model_path) if self.conversion_cache is not None else None
+        tool = self.conversion_cache.restore(cache_key, glb_path) if cache_key else None
+        cached = tool is not None
+        
+        if not cached:
+            # A model restored from the cache shares its inode; never convert into it in place
+            if glb_path.exists() and glb_path.stat().st_nlink > 1:
+                glb_path.unlink()
             
             # Convert to GLB
             success, tool, output = self._convert_to_glb(model_path, glb_path)
+            if not success or not glb_path.exists():
+                raise ConversionError(f"{tool}: {output}".strip(), retryable=tool != "none")
             
-            if success and glb_path.exists():
-                # Sanitize GLB
-                self._sanitize_gltf(glb_path)
-                
-                # Update meta files
-                self._update_meta_files(kind, code, glb_path, model_path.stem)
+            # Sanitize GLB
+            self._sanitize_gltf(glb_path)
             
-            log_event(self.logger, "3d_model_processed", 
-                     model_path=str(model_path), 
-                     glb_path=str(glb_path), 
-                     success=success, 
-                     tool=tool)
+            if cache_key:
+                try:
+                    self.conversion_cache.put(cache_key, glb_path, tool)
+                except Exception as e:
+                    log_error(self.logger, "conversion_cache_save_failed", e, glb_path=str(glb_path))
+        
+        # Update meta files
+        self._update_meta_files(job.kind, job.code, glb_path, model_path.stem)
+        
+        log_event(self.logger, "3d_model_processed",
+                 model_path=str(model_path),
+                 glb_path=str(glb_path),
+                 success=True,
+                 tool=tool,
+                 cached=cached)
+        self.events.publish("converted", model_path, glb_path, tool=tool, cached=cached)
+        return tool
+    
+    def _conversion_cache_key(self, model_path: Path) -> Optional[str]:
+        """Build the conversion cache key for a model, or None if nothing can convert it."""
+        settings = self.config.three_d_conversion
+        tools = [
+            [tool, self._tool_version(tool)]
+            for tool in settings.conversion_tools
+            if self._is_tool_available(tool)
+        ]
+        digest = self.hash_db.file_digest(model_path)
+        if not tools or not digest:
+            return None
         
-        except Exception as e:
-            log_error(self.logger, "3d_model_processing_failed", e, model_path=str(model_path))
+        packer = None
+        if settings.enable_gltfpack and self._is_tool_available("gltfpack"):
+            packer = [self._tool_version("gltfpack"), settings.gltfpack_flags]
+        
+        return ConversionCache.make_key(
+            source=digest,
+            suffix=model_path.suffix.lower(),
+            tools=tools,
+            packer=packer,
+            axis=settings.axis,
+            units=settings.units,
+            scale=settings.default_scale,
+        )
+    
+    def _tool_version(self, tool: str) -> str:
+        """Get version banner of a conversion tool, cached for the process lifetime."""
+        version = self._tool_versions.get(tool)
+        if version is None:
+            args = {"assimp": ["version"], "gltfpack": []}.get(tool, ["--version"])
+            try:
+                result = subprocess.run(
+                    [tool, *args], capture_output=True, text=True, check=False, timeout=30
+                )
+                lines = (result.stdout or result.stderr).strip().splitlines()
+                version = lines[0].strip() if lines else "unknown"
+            except Exception:
+                version = "unknown"
+            self._tool_versions[tool] = version
+        return version
     
     def _convert_to_glb(self, src_path: Path, dest_path: Path) -> Tuple[bool, str, str]:
         """Convert 3D model to GLB format."""
@@ -294,13 +588,19 @@ class FileProcessor:
         # Try conversion tools in order of preference
         tools = self.config.three_d_conversion.conversion_tools
         
+        failure = ("none", "no converter available")
         for tool in tools:
             if self._is_tool_available(tool):
+                started = time.monotonic()
                 success, output = self._run_conversion_tool(tool, src_path, dest_path)
+                self.metrics.conversion_seconds.labels(tool, "ok" if success else "failed").observe(
+                    time.monotonic() - started
+                )
                 if success:
                     return True, tool, output
+                failure = (tool, output)
         
-        return False, "none", "no converter available"
+        return False, *failure
     
     def _is_tool_available(self, tool: str) -> bool:
         """Check if conversion tool is available."""
@@ -308,6 +608,7 @@ class FileProcessor:
     
     def _run_conversion_tool(self, tool: str, src_path: Path, dest_path: Path) -> Tuple[bool, str]:
         """Run conversion tool."""
+        script_path = None
         try:
             if tool == "FBX2glTF":
                 cmd = ["FBX2glTF", "-i", str(src_path), "-o", str(dest_path.with_suffix("")), "--binary", "--draco"]
@@ -315,19 +616,29 @@ class FileProcessor:
                 cmd = ["assimp", "export", str(src_path), str(dest_path)]
             elif tool == "blender":
                 # Create Blender script
-                script_path = dest_path.parent / "_blender_convert.py"
-                script_path.write_text(self._get_blender_script(), encoding="utf-8")
+                with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False, encoding="utf-8") as script:
+                    script.write(self._get_blender_script())
+                script_path = Path(script.name)
                 cmd = ["blender", "-b", "-P", str(script_path), "--", str(src_path), str(dest_path)]
             else:
                 return False, f"unknown tool: {tool}"
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=self._tool_timeout(tool))
             return True, result.stdout
         
+        except subprocess.TimeoutExpired:
+            return False, f"{tool} timed out after {self._tool_timeout(tool)}s"
         except subprocess.CalledProcessError as e:
             return False, e.stdout
         except Exception as e:
             return False, str(e)
+        finally:
+            if script_path:
+                script_path.unlink(missing_ok=True)
+    
+    def _tool_timeout(self, tool: str) -> Optional[int]:
+        """Get timeout configured for a tool."""
+        return self.config.three_d_conversion.tool_timeouts.get(tool)
     
     def _get_blender_script(self) -> str:
         """Get Blender conversion script."""
@@ -363,7 +674,11 @@ bpy.ops.export_scene.gltf(filepath=out_glb, export_format='GLB')
         """Sanitize GLB file."""
         if self.config.three_d_conversion.enable_validator and self._is_tool_available("gltf-validator"):
             try:
-                subprocess.run(["gltf-validator", "--format", "STD", str(glb_path)], check=False)
+                subprocess.run(
+                    ["gltf-validator", "--format", "STD", str(glb_path)],
+                    check=False,
+                    timeout=self._tool_timeout("gltf-validator"),
+                )
             except Exception:
                 pass
         
@@ -372,8 +687,8 @@ bpy.ops.export_scene.gltf(filepath=out_glb, export_format='GLB')
                 packed_path = glb_path.with_name(f"{glb_path.stem}.packed.glb")
                 result = subprocess.run([
                     "gltfpack", "-i", str(glb_path), "-o", str(packed_path),
-                    "-cc", "-tc", "-kn", "-km"
-                ], capture_output=True, text=True, check=True)
+                    *self.config.three_d_conversion.gltfpack_flags
+                ], capture_output=True, text=True, check=True, timeout=self._tool_timeout("gltfpack"))
                 
                 if packed_path.exists():
                     packed_path.replace(glb_path)
@@ -412,39 +727,155 @@ bpy.ops.export_scene.gltf(filepath=out_glb, export_format='GLB')
 class VaultWatcher(LoggerMixin):
     """Main vault watcher class."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, metrics: Optional[ProcessingMetrics] = None):
         self.config = config
-        self.processor = FileProcessor(config)
+        self.events = EventBus()
+        self.metrics = metrics if metrics is not None else ProcessingMetrics()
+        self.processor = FileProcessor(config, self.events, self.metrics)
         self.observer = Observer()
-        self.handler = VaultEventHandler(self.processor, self.logger)
+        self.index = VaultIndex.from_config(config)
+        self.scheduler = ProcessingScheduler.from_config(self.processor.process_file, config)
+        self.pipeline = EventPipeline(
+            self._dispatch,
+            quiet_period=config.performance.event_quiet_period,
+        )
+        self.handler = VaultEventHandler(self.pipeline, self.logger, self.index, self.processor.routing)
+        self._stopped = threading.Event()
         self._setup_watched_directories()
+        self.metrics.track(self.get_metrics, self.processor.conversions.store.counts)
     
-    def _setup_watched_directories(self) -> None:
-        """Setup directories to watch."""
+    def _watched_directories(self) -> List[Path]:
+        """Get directories whose files are routed."""
         vault_path = self.config.get_vault_path()
-        watch_dirs = [
+        return [
             vault_path / self.config.folders.inbox,
             vault_path / self.config.folders.ongoing,
             vault_path / self.config.folders.projects,
             vault_path / self.config.folders.categories,
             vault_path / self.config.folders.resources,
         ]
-        
-        for directory in watch_dirs:
+    
+    def _setup_watched_directories(self) -> None:
+        """Setup directories to watch."""
+        for directory in self._watched_directories():
             if directory.exists():
                 self.observer.schedule(self.handler, str(directory), recursive=True)
                 self.logger.info("directory_watch_added", directory=str(directory))
     
     def start(self) -> None:
         """Start watching for file changes."""
+        log_event(self.logger, "processing_journal_recovered", **self.processor.recover())
+        self.processor.conversions.start()
+        self.pipeline.start()
         self.observer.start()
+        self._stopped.clear()
+        threading.Thread(target=self._scan_periodically, name="VaultScan", daemon=True).start()
         self.logger.info("vault_watcher_started")
     
+    def _dispatch(self, file_path: Path) -> None:
+        """Index a settled file and schedule it for processing."""
+        try:
+            self.index.update(file_path)
+        except Exception as e:
+            log_error(self.logger, "vault_index_update_failed", e, file_path=str(file_path))
+        self.scheduler.submit(file_path)
+    
+    def pending_files(self, incoming_only: bool = False) -> List[Path]:
+        """Reconcile the vault index and get the files that still need processing.
+        
+        Everything still lying in the inbox and ongoing folders is pending, as
+        are files added or changed in the other watched folders since the index
+        last saw them, unless they already sit in the folder of their
+        assignment. The first reconciliation only fills the index: the vault
+        is taken as organized. ``incoming_only`` walks just the inbox and
+        ongoing folders instead of the whole vault.
+        """
+        incoming = (self.config.folders.inbox, self.config.folders.ongoing)
+        first = self.index.reconciled_at() is None and not incoming_only
+        changed: List[Path] = []
+        reconciled = self.index.reconcile(changed, scope=incoming if incoming_only else None)
+        log_event(self.logger, "vault_index_reconciled", first=first, **reconciled)
+        
+        pending: List[Path] = []
+        if not first:
+            watched = self._watched_directories()
+            pending = [
+                path for path in changed
+                if any(path.is_relative_to(directory) for directory in watched) and not self.processor.is_routed(path)
+            ]
+        for folder in incoming:
+            pending.extend(self.index.files(folder))
+        
+        # Files still being written are left to the event pipeline's quiet period
+        settled_before = time.time() - self.config.performance.event_quiet_period
+        return [path for path in dict.fromkeys(pending) if self._settled(path, settled_before)]
+    
+    @staticmethod
+    def _settled(file_path: Path, settled_before: float) -> bool:
+        """Check whether a file exists and was last modified before a time."""
+        try:
+            return file_path.stat().st_mtime < settled_before
+        except OSError:
+            return False
+    
+    def process_files(
+        self,
+        file_paths: List[Path],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Process files on the worker pool in batches and report throughput."""
+        started = time.monotonic()
+        results = self.scheduler.run_batch(file_paths, progress)
+        duration = time.monotonic() - started
+        
+        # Record moves so the next scan does not see the destinations as new
+        for file_path, result in zip(file_paths, results, strict=True):
+            if result is not None:
+                try:
+                    self.index.update(file_path)
+                    self.index.update(result)
+                except Exception as e:
+                    log_error(self.logger, "vault_index_update_failed", e, file_path=str(result))
+        return {
+            "files": len(file_paths),
+            "moved": sum(1 for result in results if result is not None),
+            "duration_ms": round(duration * 1000, 1),
+            "files_per_second": round(len(file_paths) / duration, 1) if duration > 0 else 0.0,
+        }
+    
+    def scan(self, progress: Optional[Callable[[int], None]] = None, incoming_only: bool = False) -> Dict[str, Any]:
+        """Process files that were missed by file system events."""
+        return self.process_files(self.pending_files(incoming_only), progress)
+    
+    def _scan_periodically(self) -> None:
+        """Scan the vault once on start, then the inbox and ongoing folders every ``file_scan_interval`` seconds if set."""
+        interval = self.config.performance.file_scan_interval
+        incoming_only = False
+        while not self._stopped.is_set():
+            try:
+                log_event(self.logger, "vault_scan_completed", **self.scan(incoming_only=incoming_only))
+            except Exception as e:
+                log_error(self.logger, "vault_scan_failed", e)
+            if interval <= 0 or self._stopped.wait(interval):
+                return
+            incoming_only = True
+    
     def stop(self) -> None:
         """Stop watching for file changes."""
+        self._stopped.set()
         self.observer.stop()
         self.observer.join()
-        self.logger.info("vault_watcher_stopped")
+        self.pipeline.stop()
+        self.scheduler.shutdown(wait=True)
+        self.processor.conversions.stop()
+        self.metrics.untrack()
+        self.logger.info("vault_watcher_stopped", **self.get_metrics())
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """Get event pipeline and worker pool metrics."""
+        metrics = self.pipeline.get_metrics()
+        metrics.update({f"pool_{key}": value for key, value in self.scheduler.get_metrics().items()})
+        return metrics
     
     def run(self) -> None:
         """Run the watcher in a loop."""
@@ -457,22 +888,72 @@ class VaultWatcher(LoggerMixin):
 
 
 class VaultEventHandler(FileSystemEventHandler):
-    """File system event handler."""
+    """File system event handler feeding the debounced event pipeline and the vault index."""
     
-    def __init__(self, processor: FileProcessor, logger):
-        self.processor = processor
+    def __init__(
+        self,
+        pipeline: EventPipeline,
+        logger,
+        index: Optional[VaultIndex] = None,
+        routing: Optional[RoutingTable] = None,
+    ):
+        self.pipeline = pipeline
         self.logger = logger
+        self.index = index
+        self.routing = routing
+    
+    def dispatch(self, event) -> None:
+        """Invalidate cached routing for the paths of every event before handling it."""
+        if self.routing is not None:
+            self.routing.invalidate(Path(event.src_path), event.is_directory)
+            if getattr(event, "dest_path", None):
+                self.routing.invalidate(Path(event.dest_path), event.is_directory)
+        super().dispatch(event)
     
     def on_created(self, event) -> None:
         """Handle file creation events."""
-        if not event.is_directory:
+        if event.is_directory:
+            self._update_index(Path(event.src_path))
+        else:
             file_path = Path(event.src_path)
             self.logger.info("file_created", file_path=str(file_path))
-            self.processor.process_file(file_path)
+            self.pipeline.submit(file_path)
     
     def on_modified(self, event) -> None:
         """Handle file modification events."""
         if not event.is_directory:
             file_path = Path(event.src_path)
-            self.logger.info("file_modified", file_path=str(file_path))
-            self.processor.process_file(file_path)
\ No newline at end of file
+            self.logger.debug("file_modified", file_path=str(file_path))
+            self.pipeline.submit(file_path)
+    
+    def on_moved(self, event) -> None:
+        """Handle files renamed into watched folders."""
+        self._remove_from_index(Path(event.src_path))
+        if event.is_directory:
+            self._update_index(Path(event.dest_path))
+        else:
+            file_path = Path(event.dest_path)
+            self.logger.info("file_moved_in", file_path=str(file_path))
+            self.pipeline.submit(file_path)
+    
+    def on_deleted(self, event) -> None:
+        """Handle file and directory deletion events."""
+        self._remove_from_index(Path(event.src_path))
+    
+    def _update_index(self, path: Path) -> None:
+        """Record a path in the vault index."""
+        if self.index is None:
+            return
+        try:
+            self.index.update(path)
+        except Exception as e:
+            log_error(self.logger, "vault_index_update_failed", e, file_path=str(path))
+    
+    def _remove_from_index(self, path: Path) -> None:
+        """Drop a path from the vault index."""
+        if self.index is None:
+            return
+        try:
+            self.index.remove(path)
+        except Exception as e:
+            log_error(self.logger, "vault_index_update_failed", e, file_path=str(path))
\ No newline at end of file
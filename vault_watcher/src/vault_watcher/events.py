@@ -0,0 +1,82 @@
+"""In-process event bus for Vault Watcher."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .logging import LoggerMixin, log_error
+
+
+# What the watcher did to a file
+EVENT_TYPES = ("processed", "moved", "deduplicated", "converted", "failed")
+
+
+class VaultEvent(NamedTuple):
+    """Outcome of a watcher operation on a file."""
+    
+    type: str
+    path: str
+    dest: Optional[str]
+    timestamp: float
+    details: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-serializable dict."""
+        return {"type": self.type, "path": self.path, "dest": self.dest, "timestamp": self.timestamp, **self.details}
+
+
+Subscriber = Callable[[VaultEvent], None]
+
+
+class EventBus(LoggerMixin):
+    """Synchronous publish/subscribe of watcher events.
+    
+    Subscribers are called on the publishing thread, which is a worker pool or
+    conversion thread, so they must return quickly: hand the event to a queue
+    or a Qt signal. A failing subscriber is logged and never reaches the
+    publisher.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[Subscriber, Optional[FrozenSet[str]]]] = []
+    
+    def subscribe(self, callback: Subscriber, types: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """Call ``callback`` for published events, optionally only of some types; returns an unsubscribe function."""
+        selected = frozenset(types) if types is not None else None
+        if selected is not None and not selected <= set(EVENT_TYPES):
+            raise ValueError(f"Unknown event types: {sorted(selected - set(EVENT_TYPES))}")
+        with self._lock:
+            self._subscribers = self._subscribers + [(callback, selected)]
+        return lambda: self.unsubscribe(callback)
+    
+    def unsubscribe(self, callback: Subscriber) -> None:
+        """Stop calling a subscriber."""
+        with self._lock:
+            self._subscribers = [entry for entry in self._subscribers if entry[0] != callback]
+    
+    def publish(
+        self,
+        event_type: str,
+        path: Union[str, Path],
+        dest: Optional[Union[str, Path]] = None,
+        **details: Any,
+    ) -> VaultEvent:
+        """Deliver an event to the subscribers of its type."""
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        event = VaultEvent(event_type, str(path), str(dest) if dest is not None else None, time.time(), details)
+        
+        # The list is replaced, never mutated, so it can be iterated without the lock
+        for callback, types in self._subscribers:
+            if types is not None and event_type not in types:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                log_error(self.logger, "event_subscriber_failed", e, event_type=event_type, path=event.path)
+        return event
+    
+    def __len__(self) -> int:
+        return len(self._subscribers)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""Fan-out of watcher events to streaming API clients."""
+
+import asyncio
+import json
+from typing import Callable, FrozenSet, Optional, Set, Tuple
+
+from .events import EVENT_TYPES, EventBus, VaultEvent
+from .logging import LoggerMixin, log_event
+
+
+# Serialized event as it is queued for clients: (type, JSON)
+Message = Tuple[str, str]
+
+
+class EventStreamClient:
+    """Bounded buffer of serialized events for one streaming client."""
+    
+    def __init__(self, max_events: int, types: Optional[FrozenSet[str]] = None):
+        self.types = types
+        self.dropped = False
+        self._queue: "asyncio.Queue[Optional[Message]]" = asyncio.Queue(max_events)
+    
+    def wants(self, event_type: str) -> bool:
+        """Check whether the client subscribed to a type of event."""
+        return self.types is None or event_type in self.types
+    
+    def offer(self, message: Message) -> bool:
+        """Queue a message; returns False if the buffer is full."""
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+    
+    def drop(self) -> None:
+        """Discard buffered messages and end the stream."""
+        self.dropped = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+    
+    async def get(self) -> Optional[Message]:
+        """Wait for the next message; None once the client was dropped."""
+        return await self._queue.get()
+
+
+class EventBroadcaster(LoggerMixin):
+    """Fan-out of bus events to any number of streaming clients.
+    
+    One bus subscription serves every client: an event is serialized once on
+    the publishing thread and handed to the event loop, which queues the same
+    string for each client. Each client buffers at most ``max_events``; a client
+    that falls that far behind is a slow consumer and is dropped instead of
+    letting memory grow.
+    """
+    
+    def __init__(self, max_events: int = 1000):
+        self.max_events = max_events
+        self._clients: Set[EventStreamClient] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+    
+    def attach(self, bus: EventBus) -> None:
+        """Start relaying the events of a bus; must be called on the event loop."""
+        self.detach()
+        self._loop = asyncio.get_running_loop()
+        self._unsubscribe = bus.subscribe(self._publish)
+    
+    def detach(self) -> None:
+        """Stop relaying bus events; connected clients stay connected."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+    
+    def connect(self, types: Optional[FrozenSet[str]] = None) -> EventStreamClient:
+        """Register a client, optionally for some event types only."""
+        if types is not None and not types <= set(EVENT_TYPES):
+            raise ValueError(f"Unknown event types: {sorted(types - set(EVENT_TYPES))}")
+        client = EventStreamClient(self.max_events, types)
+        self._clients.add(client)
+        return client
+    
+    def disconnect(self, client: EventStreamClient) -> None:
+        """Forget a client."""
+        self._clients.discard(client)
+    
+    def _publish(self, event: VaultEvent) -> None:
+        """Serialize an event and pass it to the event loop."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self._clients:
+            return
+        message = (event.type, json.dumps(event.to_dict(), ensure_ascii=False, default=str))
+        try:
+            loop.call_soon_threadsafe(self._deliver, message)
+        except RuntimeError:
+            # The loop closed between the check and the call
+            pass
+    
+    def _deliver(self, message: Message) -> None:
+        """Queue a message for every interested client, dropping the ones that are full."""
+        for client in list(self._clients):
+            if not client.wants(message[0]) or client.offer(message):
+                continue
+            client.drop()
+            self._clients.discard(client)
+            log_event(self.logger, "event_stream_client_dropped", buffered=self.max_events)
+    
+    def __len__(self) -> int:
+        return len(self._clients)
\ No newline at end of file
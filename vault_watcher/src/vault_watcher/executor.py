@@ -0,0 +1,176 @@
+"""Executor for blocking work of the Vault Watcher API."""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set
+
+from .config import Config
+from .logging import LoggerMixin, log_error
+
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+class OperationTimeoutError(TimeoutError):
+    """A blocking operation did not finish within its timeout."""
+    
+    def __init__(self, operation: str, timeout: float):
+        super().__init__(f"{operation} did not finish within {timeout:g}s")
+        self.operation = operation
+        self.timeout = timeout
+
+
+class BlockingExecutor(LoggerMixin):
+    """Thread pool that keeps blocking file system work off the event loop.
+    
+    Every call names an operation. An operation runs at most its concurrency
+    limit of calls at once, so a burst of expensive requests (a vault walk, a
+    large listing) cannot take every worker and stall cheap ones. A call waits
+    for a slot and a worker within its timeout; when the timeout passes the
+    caller gets ``OperationTimeoutError`` while the thread finishes on its own and
+    only then frees the slot.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 8,
+        limits: Optional[Dict[str, int]] = None,
+        timeout: float = 30.0,
+    ):
+        self.max_workers = max_workers
+        self.limits = dict(limits or {})
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="APIWorker")
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    @classmethod
+    def from_config(cls, config: Config) -> "BlockingExecutor":
+        """Create executor from API settings."""
+        settings = config.api
+        return cls(settings.executor_workers, settings.concurrency_limits, settings.request_timeout)
+    
+    async def run(self, operation: str, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run ``func(*args)`` in the pool; ``timeout`` defaults to the request timeout and 0 disables it."""
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout > 0 else None
+        semaphore = self._semaphore(operation)
+        
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self._remaining(loop, deadline))
+        except asyncio.TimeoutError:
+            raise OperationTimeoutError(operation, timeout) from None
+        
+        future = loop.run_in_executor(self._pool, partial(func, *args))
+        future.add_done_callback(lambda _: semaphore.release())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self._remaining(loop, deadline))
+        except asyncio.TimeoutError:
+            raise OperationTimeoutError(operation, timeout) from None
+    
+    def _semaphore(self, operation: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting an operation."""
+        semaphore = self._semaphores.get(operation)
+        if semaphore is None:
+            semaphore = self._semaphores[operation] = asyncio.Semaphore(self.limits.get(operation, self.max_workers))
+        return semaphore
+    
+    @staticmethod
+    def _remaining(loop: asyncio.AbstractEventLoop, deadline: Optional[float]) -> Optional[float]:
+        """Get the time left until a deadline, None for no deadline."""
+        return None if deadline is None else max(0.0, deadline - loop.time())
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._pool.shutdown(wait=wait)
+
+
+class Job(NamedTuple):
+    """Long API operation run in the background."""
+    
+    id: str
+    operation: str
+    status: str
+    created: float
+    updated: float
+    result: Any = None
+    error: Optional[str] = None
+
+
+class BackgroundJobs(LoggerMixin):
+    """Long API operations run as jobs polled by id.
+    
+    A request submits the operation and returns at once with the job id; the
+    operation runs on the executor under its concurrency limit. Finished jobs
+    stay available until ``max_jobs`` newer ones push them out.
+    """
+    
+    def __init__(self, executor: BlockingExecutor, max_jobs: int = 1000, timeout: float = 600.0):
+        self.executor = executor
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @classmethod
+    def from_config(cls, config: Config, executor: BlockingExecutor) -> "BackgroundJobs":
+        """Create job registry from API settings."""
+        return cls(executor, config.api.max_jobs, config.api.job_timeout)
+    
+    def submit(self, operation: str, func: Callable[..., Any], *args: Any) -> Job:
+        """Queue ``func(*args)`` as a job; must be called on the event loop."""
+        now = time.time()
+        job = Job(uuid.uuid4().hex, operation, "queued", now, now)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        
+        task = asyncio.get_running_loop().create_task(self._run(job.id, func, args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    async def _run(self, job_id: str, func: Callable[..., Any], args: tuple) -> None:
+        """Run a job and record its outcome."""
+        def call():
+            self._update(job_id, status="running")
+            return func(*args)
+        
+        job = self.get(job_id)
+        try:
+            result = await self.executor.run(job.operation, call, timeout=self.timeout)
+        except Exception as e:
+            log_error(self.logger, "api_job_failed", e, job_id=job_id, operation=job.operation)
+            self._update(job_id, status="failed", error=str(e))
+            return
+        self._update(job_id, status="done", result=result)
+    
+    def _update(self, job_id: str, **changes: Any) -> None:
+        """Record a change of a job."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs[job_id] = job._replace(updated=time.time(), **changes)
+    
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond ``max_jobs``."""
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [job.id for job in self._jobs.values() if job.status in ("done", "failed")][:excess]:
+            del self._jobs[job_id]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""File move engine for Vault Watcher."""
+
+import errno
+import glob
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable
+
+
+# Errors meaning the kernel or filesystem cannot do a zero-copy transfer
+_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+# Temporary files of interrupted copies: ``.<name>.<random>.tmp`` from move_file
+# and ``tmp<random>`` from the NamedTemporaryFile copy of earlier versions
+TEMP_FILE_RE = re.compile(r"^(\..+\.[a-z0-9_]{8}\.tmp|tmp[a-z0-9_]{8})$")
+
+
+def move_file(src_path: Path, dest_path: Path, chunk_size: int = 1048576) -> str:
+    """Move a file, replacing the destination, and return the method used.
+    
+    On the same filesystem the file is renamed, which is atomic and does not
+    touch its data. Across filesystems it is copied into a temporary file next
+    to the destination (``copy_file_range``, then ``sendfile``, then a buffered
+    copy), synced and renamed into place before the source is removed.
+    Returns ``"rename"``, ``"copy_file_range"``, ``"sendfile"`` or ``"copy"``.
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if _same_device(src_path, dest_path.parent):
+        try:
+            os.replace(src_path, dest_path)
+            return "rename"
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+    
+    fd, temp_name = tempfile.mkstemp(dir=str(dest_path.parent), prefix=f".{dest_path.name}.", suffix=".tmp")
+    try:
+        with open(src_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+            method = _copy_data(src, dst, os.fstat(src.fileno()).st_size, chunk_size)
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copystat(src_path, temp_name)
+        os.replace(temp_name, dest_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    
+    _fsync_directory(dest_path.parent)
+    src_path.unlink()
+    return method
+
+
+def remove_temp_files(dest_path: Path) -> int:
+    """Remove temporary files left next to a destination by an interrupted move."""
+    removed = 0
+    for temp_path in dest_path.parent.glob(f".{glob.escape(dest_path.name)}.*.tmp"):
+        try:
+            temp_path.unlink()
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def sweep_temp_files(roots: Iterable[Path], max_age: float) -> int:
+    """Remove temporary files of interrupted copies older than ``max_age`` seconds below some directories.
+    
+    Catches what ``remove_temp_files`` cannot: copies that crashed before they
+    were journaled and leftovers of the previous move implementation.
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    for root in roots:
+        for directory, _, names in os.walk(root):
+            for name in names:
+                if not TEMP_FILE_RE.match(name):
+                    continue
+                temp_path = os.path.join(directory, name)
+                try:
+                    if os.lstat(temp_path).st_mtime < cutoff:
+                        os.unlink(temp_path)
+                        removed += 1
+                except OSError:
+                    continue
+    return removed
+
+
+def _same_device(src_path: Path, dest_dir: Path) -> bool:
+    """Check whether a file and a directory are on the same filesystem."""
+    return os.stat(src_path).st_dev == os.stat(dest_dir).st_dev
+
+
+def _copy_data(src, dst, size: int, chunk_size: int) -> str:
+    """Copy file contents, preferring in-kernel transfers."""
+    if hasattr(os, "copy_file_range") and _copy_in_kernel(os.copy_file_range, src, dst, size):
+        return "copy_file_range"
+    if hasattr(os, "sendfile") and _copy_in_kernel(_sendfile, src, dst, size):
+        return "sendfile"
+    
+    src.seek(0)
+    dst.seek(0)
+    dst.truncate()
+    shutil.copyfileobj(src, dst, chunk_size)
+    return "copy"
+
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    """``sendfile`` with the argument order of ``copy_file_range``."""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+def _copy_in_kernel(copy, src, dst, size: int) -> bool:
+    """Copy with a zero-copy primitive; False if it is not supported here."""
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    copied = 0
+    try:
+        while True:
+            sent = copy(src_fd, dst_fd, max(size - copied, 1 << 20))
+            if sent == 0:
+                break
+            copied += sent
+    except OSError as e:
+        if e.errno in _UNSUPPORTED and copied == 0:
+            return False
+        raise
+    return True
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory where the platform allows it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Streaming frontmatter reader and cache for Vault Watcher."""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+
+DELIMITER = b"---"
+
+
+def read_frontmatter_block(file_path: Path, max_bytes: int = 65536) -> Optional[str]:
+    """Read the YAML block between the opening and closing ``---`` of a note.
+    
+    Only the frontmatter is read: the file is consumed line by line and reading
+    stops at the closing delimiter, so the body of the note is never decoded.
+    Returns None when the note has no frontmatter or the block is not closed
+    within ``max_bytes``.
+    """
+    with open(file_path, "rb") as f:
+        if f.readline(len(DELIMITER) + 3).rstrip(b"\r\n") != DELIMITER:
+            return None
+        
+        lines = []
+        remaining = max_bytes
+        while remaining > 0:
+            line = f.readline(remaining)
+            if not line:
+                return None
+            if line.startswith(DELIMITER):
+                return b"".join(lines).decode("utf-8", errors="ignore")
+            lines.append(line)
+            remaining -= len(line)
+    return None
+
+
+def parse_frontmatter(file_path: Path, max_bytes: int = 65536) -> Dict[str, Any]:
+    """Parse the frontmatter of a note; notes without one give an empty dict."""
+    block = read_frontmatter_block(file_path, max_bytes)
+    if block is None:
+        return {}
+    data = yaml.safe_load(block)
+    return data if isinstance(data, dict) else {}
+
+
+class FrontmatterCache:
+    """Parsed frontmatter cached by path and validated by mtime and size.
+    
+    A single instance is shared by everything that reads note metadata, so a
+    note is parsed once per change however many components look at it. Entries
+    are evicted least recently used first. YAML errors are raised to the caller
+    and not cached.
+    """
+    
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 65536):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+    
+    @classmethod
+    def from_config(cls, config) -> "FrontmatterCache":
+        """Create a cache sized by the performance settings."""
+        return cls(config.performance.frontmatter_cache_size, config.performance.frontmatter_max_bytes)
+    
+    def get(self, file_path: Path) -> Dict[str, Any]:
+        """Get the frontmatter of a note, parsing it only if it changed."""
+        stat = os.stat(file_path)
+        key = str(file_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == version:
+                self._entries.move_to_end(key)
+                return dict(cached[1])
+        
+        data = parse_frontmatter(file_path, self.max_bytes)
+        with self._lock:
+            self._entries[key] = (version, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(data)
+    
+    def invalidate(self, file_path: Path) -> None:
+        """Drop the cached entry of a note."""
+        with self._lock:
+            self._entries.pop(str(file_path), None)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
\ No newline at end of file
@@ -1,39 +1,88 @@
 """GUI for Vault Watcher using PyQt6."""
 
+import os
 import sys
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
+from PyQt6.QtCore import (
+    QAbstractItemModel, QModelIndex, QObject, QRunnable, QSortFilterProxyModel,
+    QThread, QThreadPool, pyqtSignal, Qt, QTimer
+)
 from PyQt6.QtGui import QAction, QFont, QIcon, QPalette, QPixmap
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QSplitter, QTreeWidget, QTreeWidgetItem, QTextEdit, QPushButton,
+    QSplitter, QTreeView, QTextEdit, QPushButton,
     QLabel, QStatusBar, QMenuBar, QToolBar, QFileDialog, QMessageBox,
     QProgressBar, QTabWidget, QTableWidget, QTableWidgetItem,
     QGroupBox, QFormLayout, QLineEdit, QCheckBox, QSpinBox,
-    QComboBox, QTextBrowser, QFrame, QScrollArea
+    QComboBox, QTextBrowser, QFrame, QScrollArea, QStyle
 )
 
+
 from .config import Config
 from .core import VaultWatcher
+from .events import VaultEvent
 from .logging import get_logger
 
 
+FILE_TYPE_LABELS = {"model": "3D Модель", "note": "Заметка", "document": "Документ", "image": "Изображение"}
+FILE_TYPE_ICONS = {
+    "model": QStyle.StandardPixmap.SP_ComputerIcon,
+    "note": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    "document": QStyle.StandardPixmap.SP_FileDialogContentsView,
+    "image": QStyle.StandardPixmap.SP_FileDialogInfoView,
+}
+FOLDER_LABEL = "Папка"
+# Model roles: raw values the tree is sorted by, and the full path of a node
+SORT_ROLE = Qt.ItemDataRole.UserRole
+PATH_ROLE = Qt.ItemDataRole.UserRole + 1
+# Delay that collapses a burst of events in one folder into a single listing
+REFRESH_DELAY_MS = 200
+EVENT_LABELS = {
+    "processed": "Обработан",
+    "moved": "Перемещён",
+    "deduplicated": "Удалён дубликат",
+    "converted": "Сконвертирован",
+    "failed": "Ошибка",
+}
+# Log lines written per batch of watcher events; the rest are summarized
+MAX_LOG_LINES_PER_BATCH = 50
+
+
+def describe_event(event: VaultEvent) -> str:
+    """Describe a watcher event for the log pane."""
+    message = f"{EVENT_LABELS.get(event.type, event.type)}: {event.path}"
+    if event.dest:
+        message += f" → {event.dest}"
+    if "error" in event.details:
+        message += f" ({event.details['error']})"
+    return message
+
+
 class VaultWatcherThread(QThread):
-    """Thread for running vault watcher."""
+    """Thread for running vault watcher.
+    
+    Events published by the watcher are queued as they happen and emitted as
+    one batch per frame, at most ``gui_update_rate`` frames a second, so a
+    burst of processing costs the UI thread one update instead of thousands.
+    """
     
     log_signal = pyqtSignal(str)
     status_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
+    events_signal = pyqtSignal(list)
     
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
         self.watcher = VaultWatcher(config)
         self.running = False
+        self._events: Deque[VaultEvent] = deque()
+        self.watcher.events.subscribe(self._events.append)
     
     def run(self):
         """Run the vault watcher."""
@@ -43,156 +92,424 @@ class VaultWatcherThread(QThread):
             self.watcher.start()
             self.status_signal.emit("Наблюдатель запущен")
             
+            frame = 1.0 / max(1, self.config.general.gui_update_rate)
             while self.running:
-                time.sleep(1)
+                time.sleep(frame)
+                self.emit_events()
         
         except Exception as e:
             self.error_signal.emit(f"Ошибка: {str(e)}")
         finally:
             self.watcher.stop()
+            self.emit_events()
             self.status_signal.emit("Наблюдатель остановлен")
     
+    def emit_events(self):
+        """Emit the events queued since the last frame as one batch."""
+        batch = []
+        while self._events:
+            batch.append(self._events.popleft())
+        if batch:
+            self.events_signal.emit(batch)
+    
     def stop(self):
         """Stop the vault watcher."""
         self.running = False
 
 
-class FileTreeWidget(QTreeWidget):
+def format_size(size_bytes: int) -> str:
+    """Format file size."""
+    if size_bytes == 0:
+        return "0 B"
+    
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024 and i < len(size_names) - 1:
+        size_bytes /= 1024.0
+        i += 1
+    
+    return f"{size_bytes:.1f} {size_names[i]}"
+
+
+def list_directory(path: str) -> List[Tuple[str, bool, int]]:
+    """List a directory as (name, is_dir, size) entries sorted by name."""
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                size = 0 if is_dir else entry.stat().st_size
+            except OSError:
+                continue
+            entries.append((entry.name, is_dir, size))
+    entries.sort()
+    return entries
+
+
+class FileNode:
+    """Entry of the file tree; directories get their children when first expanded."""
+    
+    __slots__ = ("path", "name", "is_dir", "size", "kind", "parent", "children", "row", "loaded", "generation")
+    
+    def __init__(
+        self,
+        path: str,
+        name: str,
+        is_dir: bool,
+        size: int = 0,
+        kind: Optional[str] = None,
+        parent: Optional["FileNode"] = None,
+    ):
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.size = size
+        self.kind = kind
+        self.parent = parent
+        self.children: List["FileNode"] = []
+        self.row = 0
+        self.loaded = False
+        # Id of the latest listing requested for the directory, 0 if never requested
+        self.generation = 0
+
+
+class DirectoryListing(QObject):
+    """Signals of directory listing tasks."""
+    
+    listed = pyqtSignal(str, int, object)
+
+
+class DirectoryListTask(QRunnable):
+    """List a directory in the thread pool and report the entries."""
+    
+    def __init__(self, path: str, generation: int, signals: DirectoryListing):
+        super().__init__()
+        self.path = path
+        self.generation = generation
+        self.signals = signals
+    
+    def run(self):
+        """List the directory; unreadable directories give None."""
+        try:
+            entries = list_directory(self.path)
+        except OSError:
+            entries = None
+        self.signals.listed.emit(self.path, self.generation, entries)
+
+
+class VaultTreeModel(QAbstractItemModel):
+    """Lazy model of the vault file tree.
+    
+    A directory is listed when it is first expanded, in a thread pool, and the
+    entries are applied on the UI thread. File system events re-list only the
+    loaded directories they touch, after a short delay that collapses bursts,
+    and the difference with the current children is applied row by row, so
+    expanded folders and the selection survive updates.
+    """
+    
+    HEADERS = ["Файлы", "Размер", "Тип"]
+    
+    def __init__(self, config: Config, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.config = config
+        self.vault_path: Optional[Path] = None
+        self._root = FileNode("", "", True)
+        self._vault_node: Optional[FileNode] = None
+        self._nodes: Dict[str, FileNode] = {}
+        self._generation = 0
+        self._icons: Dict[Any, QIcon] = {}
+        self._stale: Set[str] = set()
+        
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self._listing = DirectoryListing(self)
+        self._listing.listed.connect(self._apply_listing)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh_stale)
+    
+    def set_vault(self, vault_path: Path) -> None:
+        """Show a vault: its root and the main folders, none of them listed yet."""
+        self.beginResetModel()
+        self.vault_path = vault_path
+        self._root.children = []
+        self._nodes = {}
+        self._stale.clear()
+        self._vault_node = None
+        
+        if vault_path.exists():
+            vault_node = FileNode(str(vault_path), vault_path.name, True, parent=self._root)
+            vault_node.loaded = True
+            for folder_name, display_name in self._main_folders():
+                folder_path = vault_path / folder_name
+                if folder_path.exists():
+                    folder_node = FileNode(str(folder_path), display_name, True, parent=vault_node)
+                    folder_node.row = len(vault_node.children)
+                    vault_node.children.append(folder_node)
+                    self._nodes[folder_node.path] = folder_node
+            self._root.children = [vault_node]
+            self._vault_node = vault_node
+        self.endResetModel()
+    
+    def _main_folders(self) -> List[Tuple[str, str]]:
+        """Get the main folders of the vault with their display names."""
+        return [
+            (self.config.folders.inbox, "Входящие"),
+            (self.config.folders.ongoing, "В работе"),
+            (self.config.folders.projects, "Проекты"),
+            (self.config.folders.categories, "Категории"),
+            (self.config.folders.resources, "Ресурсы"),
+            (self.config.folders.admin, "Администрирование"),
+        ]
+    
+    def refresh(self) -> None:
+        """Re-list every loaded directory in the background."""
+        for node in list(self._nodes.values()):
+            if node.loaded:
+                self._request_listing(node)
+    
+    def apply_event(self, event_type: str, src_path: str, dest_path: str = "") -> None:
+        """Schedule re-listing of the loaded directories a watcher event touched."""
+        for path in (src_path, dest_path):
+            if not path:
+                continue
+            node = self._nodes.get(os.path.dirname(path))
+            if node is not None and node.loaded:
+                self._stale.add(node.path)
+        if self._stale and not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+    
+    def _refresh_stale(self) -> None:
+        """Re-list directories collected from file system events."""
+        stale, self._stale = self._stale, set()
+        for path in stale:
+            node = self._nodes.get(path)
+            if node is not None:
+                self._request_listing(node)
+    
+    def _request_listing(self, node: FileNode) -> None:
+        """List a directory in the thread pool; only the latest request is applied."""
+        self._generation += 1
+        node.generation = self._generation
+        self.pool.start(DirectoryListTask(node.path, node.generation, self._listing))
+    
+    def _apply_listing(self, path: str, generation: int, entries: Optional[List[Tuple[str, bool, int]]]) -> None:
+        """Merge listed entries into the children of a directory."""
+        node = self._nodes.get(path)
+        if node is None or node.generation != generation:
+            return
+        node.loaded = True
+        entries = entries or []
+        parent_index = self._index_for(node)
+        
+        if not node.children:
+            if entries:
+                self.beginInsertRows(parent_index, 0, len(entries) - 1)
+                node.children = [self._make_node(node, *entry) for entry in entries]
+                self._renumber(node, 0)
+                self.endInsertRows()
+            return
+        
+        listed = {name: is_dir for name, is_dir, _ in entries}
+        for row in reversed(range(len(node.children))):
+            child = node.children[row]
+            if listed.get(child.name) != child.is_dir:
+                self.beginRemoveRows(parent_index, row, row)
+                del node.children[row]
+                self._forget(child)
+                self._renumber(node, row)
+                self.endRemoveRows()
+        
+        # Children are now a subset of the sorted entries, so one merge pass places the new ones
+        row = 0
+        for name, is_dir, size in entries:
+            if row < len(node.children) and node.children[row].name == name:
+                child = node.children[row]
+                if child.size != size:
+                    child.size = size
+                    self.dataChanged.emit(self.createIndex(row, 1, child), self.createIndex(row, 2, child))
+            else:
+                self.beginInsertRows(parent_index, row, row)
+                node.children.insert(row, self._make_node(node, name, is_dir, size))
+                self._renumber(node, row)
+                self.endInsertRows()
+            row += 1
+    
+    def _make_node(self, parent: FileNode, name: str, is_dir: bool, size: int) -> FileNode:
+        """Create a child node and register directories for lookups by path."""
+        kind = None if is_dir else self.config.classify(name)
+        node = FileNode(os.path.join(parent.path, name), name, is_dir, size, kind, parent)
+        if is_dir:
+            self._nodes[node.path] = node
+        return node
+    
+    def _forget(self, node: FileNode) -> None:
+        """Unregister a removed node and everything below it."""
+        if node.is_dir:
+            self._nodes.pop(node.path, None)
+            for child in node.children:
+                self._forget(child)
+    
+    @staticmethod
+    def _renumber(node: FileNode, start: int) -> None:
+        """Update the stored rows of children from a position on."""
+        for row in range(start, len(node.children)):
+            node.children[row].row = row
+    
+    def _node(self, index: QModelIndex) -> FileNode:
+        """Get the node of an index; the invalid index is the invisible root."""
+        return index.internalPointer() if index.isValid() else self._root
+    
+    def _index_for(self, node: FileNode) -> QModelIndex:
+        """Get the index of a node."""
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        node = self._node(parent)
+        return node.is_dir and (not node.loaded or bool(node.children))
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self._node(parent)
+        return node.is_dir and node.generation == 0 and not node.loaded
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        node = self._node(parent)
+        if node.path in self._nodes:
+            self._request_listing(node)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return node.name
+            if column == 1:
+                return "" if node.is_dir else format_size(node.size)
+            return FOLDER_LABEL if node.is_dir else FILE_TYPE_LABELS.get(node.kind, "Файл")
+        if role == Qt.ItemDataRole.DecorationRole and column == 0:
+            return self._icon(node)
+        if role == SORT_ROLE:
+            if column == 1:
+                return node.size
+            return self.data(index).lower()
+        if role == PATH_ROLE:
+            return node.path
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def _icon(self, node: FileNode) -> QIcon:
+        """Get the icon of a node, created once per kind."""
+        if node.is_dir:
+            pixmap = QStyle.StandardPixmap.SP_DirIcon
+        else:
+            pixmap = FILE_TYPE_ICONS.get(node.kind, QStyle.StandardPixmap.SP_FileIcon)
+        icon = self._icons.get(pixmap)
+        if icon is None:
+            icon = self._icons[pixmap] = QApplication.style().standardIcon(pixmap)
+        return icon
+
+
+class FileTreeWidget(QTreeView):
     """File tree widget for displaying vault structure."""
     
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
+        self.tree_model = VaultTreeModel(config, self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.tree_model)
+        self.proxy_model.setSortRole(SORT_ROLE)
+        self.setModel(self.proxy_model)
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the UI."""
-        self.setHeaderLabels(["Файлы", "Размер", "Тип"])
         self.setColumnWidth(0, 300)
         self.setColumnWidth(1, 100)
         self.setColumnWidth(2, 100)
+        self.setUniformRowHeights(True)
         
         # Enable sorting
         self.setSortingEnabled(True)
+        self.sortByColumn(0, Qt.SortOrder.AscendingOrder)
         
         # Context menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
     
     def refresh_tree(self):
-        """Refresh the file tree."""
-        self.clear()
+        """Refresh the file tree, re-listing only the folders already loaded."""
         vault_path = self.config.get_vault_path()
-        
-        if not vault_path.exists():
+        if self.tree_model.vault_path == vault_path:
+            self.tree_model.refresh()
             return
         
-        # Add root item
-        root_item = QTreeWidgetItem(self, [vault_path.name, "", "Папка"])
-        root_item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-        
-        # Add main folders
-        folders = [
-            (self.config.folders.inbox, "Входящие"),
-            (self.config.folders.ongoing, "В работе"),
-            (self.config.folders.projects, "Проекты"),
-            (self.config.folders.categories, "Категории"),
-            (self.config.folders.resources, "Ресурсы"),
-            (self.config.folders.admin, "Администрирование"),
-        ]
-        
-        for folder_name, display_name in folders:
-            folder_path = vault_path / folder_name
-            if folder_path.exists():
-                folder_item = QTreeWidgetItem(root_item, [display_name, "", "Папка"])
-                folder_item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-                self._populate_folder(folder_item, folder_path)
-        
-        self.expandItem(root_item)
+        self.tree_model.set_vault(vault_path)
+        self.expand(self.proxy_model.index(0, 0))
     
-    def _populate_folder(self, parent_item: QTreeWidgetItem, folder_path: Path):
-        """Populate folder with files and subfolders."""
-        try:
-            for item_path in sorted(folder_path.iterdir()):
-                if item_path.is_dir():
-                    item = QTreeWidgetItem(parent_item, [item_path.name, "", "Папка"])
-                    item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-                    self._populate_folder(item, item_path)
-                else:
-                    size = item_path.stat().st_size
-                    size_str = self._format_size(size)
-                    file_type = self._get_file_type(item_path)
-                    
-                    item = QTreeWidgetItem(parent_item, [item_path.name, size_str, file_type])
-                    item.setIcon(0, self._get_file_icon(item_path))
-        except PermissionError:
-            pass
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size."""
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
-    
-    def _get_file_type(self, file_path: Path) -> str:
-        """Get file type description."""
-        if self.config.is_model_file(file_path):
-            return "3D Модель"
-        elif self.config.is_note_file(file_path):
-            return "Заметка"
-        elif self.config.is_document_file(file_path):
-            return "Документ"
-        elif self.config.is_image_file(file_path):
-            return "Изображение"
-        else:
-            return "Файл"
-    
-    def _get_file_icon(self, file_path: Path) -> QIcon:
-        """Get file icon."""
-        if self.config.is_model_file(file_path):
-            return self.style().standardIcon(self.style().StandardPixmap.SP_ComputerIcon)
-        elif self.config.is_note_file(file_path):
-            return self.style().standardIcon(self.style().StandardPixmap.SP_FileDialogDetailedView)
-        elif self.config.is_document_file(file_path):
-            return self.style().standardIcon(self.style().StandardPixmap.SP_FileDialogContentsView)
-        elif self.config.is_image_file(file_path):
-            return self.style().standardIcon(self.style().StandardPixmap.SP_FileDialogInfoView)
-        else:
-            return self.style().standardIcon(self.style().StandardPixmap.SP_FileIcon)
+    def apply_file_event(self, event_type: str, src_path: str, dest_path: str):
+        """Update the tree for a watcher event."""
+        self.tree_model.apply_event(event_type, src_path, dest_path)
     
     def show_context_menu(self, position):
         """Show context menu."""
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
         
+        path = Path(index.data(PATH_ROLE))
         menu = QMenuBar(self)
         
         # Add actions based on item type
-        if item.text(2) == "Папка":
+        if index.siblingAtColumn(2).data() == FOLDER_LABEL:
             open_action = QAction("Открыть папку", self)
-            open_action.triggered.connect(lambda: self._open_folder(item))
+            open_action.triggered.connect(lambda: self._open_folder(path))
             menu.addAction(open_action)
         else:
             open_action = QAction("Открыть файл", self)
-            open_action.triggered.connect(lambda: self._open_file(item))
+            open_action.triggered.connect(lambda: self._open_file(path))
             menu.addAction(open_action)
         
         menu.exec(self.mapToGlobal(position))
     
-    def _open_folder(self, item: QTreeWidgetItem):
+    def _open_folder(self, path: Path):
         """Open folder in file manager."""
         # Implementation for opening folder
         pass
     
-    def _open_file(self, item: QTreeWidgetItem):
+    def _open_file(self, path: Path):
         """Open file with default application."""
         # Implementation for opening file
         pass
@@ -230,6 +547,13 @@ class LogWidget(QTextEdit):
         # Auto-scroll to bottom
         scrollbar = self.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
+    
+    def add_events(self, events: List[VaultEvent]):
+        """Add log messages for a batch of watcher events."""
+        for event in events[:MAX_LOG_LINES_PER_BATCH]:
+            self.add_log(describe_event(event), "ERROR" if event.type == "failed" else "INFO")
+        if len(events) > MAX_LOG_LINES_PER_BATCH:
+            self.add_log(f"... и ещё {len(events) - MAX_LOG_LINES_PER_BATCH} событий")
 
 
 class StatusWidget(QWidget):
@@ -238,6 +562,8 @@ class StatusWidget(QWidget):
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
+        self.processed_count = 0
+        self.failed_count = 0
         self.setup_ui()
     
     def setup_ui(self):
@@ -251,11 +577,13 @@ class StatusWidget(QWidget):
         self.vault_path_label = QLabel(self.config.general.vault_path)
         self.watcher_status_label = QLabel("Остановлен")
         self.file_count_label = QLabel("0")
+        self.failed_count_label = QLabel("0")
         self.last_activity_label = QLabel("Нет активности")
         
         status_layout.addRow("Путь к хранилищу:", self.vault_path_label)
         status_layout.addRow("Статус наблюдателя:", self.watcher_status_label)
         status_layout.addRow("Файлов обработано:", self.file_count_label)
+        status_layout.addRow("Ошибок:", self.failed_count_label)
         status_layout.addRow("Последняя активность:", self.last_activity_label)
         
         layout.addWidget(status_group)
@@ -277,6 +605,18 @@ class StatusWidget(QWidget):
         """Update last activity."""
         self.last_activity_label.setText(activity)
     
+    def record_events(self, events: List[VaultEvent]):
+        """Update counters and last activity from a batch of watcher events."""
+        if not events:
+            return
+        self.processed_count += sum(1 for event in events if event.type == "processed")
+        self.failed_count += sum(1 for event in events if event.type == "failed")
+        self.update_file_count(self.processed_count)
+        self.failed_count_label.setText(str(self.failed_count))
+        
+        last = events[-1]
+        self.update_last_activity(f"{time.strftime('%H:%M:%S', time.localtime(last.timestamp))} {describe_event(last)}")
+    
     def show_progress(self, visible: bool):
         """Show/hide progress bar."""
         self.progress_bar.setVisible(visible)
@@ -576,6 +916,7 @@ class VaultWatcherGUI(QMainWindow):
         self.watcher_thread.log_signal.connect(self.log_widget.add_log)
         self.watcher_thread.status_signal.connect(self.status_widget.update_status)
         self.watcher_thread.error_signal.connect(self.show_error)
+        self.watcher_thread.events_signal.connect(self.apply_watcher_events)
         
         self.watcher_thread.start()
         self.start_stop_button.setText("Остановить")
@@ -596,6 +937,13 @@ class VaultWatcherGUI(QMainWindow):
         else:
             self.start_watcher()
     
+    def apply_watcher_events(self, events: List[VaultEvent]):
+        """Apply a batch of watcher events to the tree, status counters and log."""
+        for event in events:
+            self.file_tree.apply_file_event(event.type, event.path, event.dest or "")
+        self.status_widget.record_events(events)
+        self.log_widget.add_events(events)
+    
     def refresh_file_tree(self):
         """Refresh the file tree."""
         self.file_tree.refresh_tree()
@@ -0,0 +1,277 @@
+"""Persistent vault index for Vault Watcher."""
+
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .config import FILE_KINDS, Config
+from .storage import SQLiteStore
+
+
+class VaultIndex(SQLiteStore):
+    """Index of vault files kept current from file system events.
+    
+    Per-kind file counts and sizes are maintained by triggers on every insert,
+    update and delete, so statistics are a handful of row reads no matter how
+    large the vault is. ``reconcile`` walks the vault once to pick up changes
+    made while nothing was watching. The admin folder holds the watcher's own
+    databases, logs and caches and is never indexed.
+    """
+    
+    def __init__(self, db_path: Path, config: Config):
+        self.config = config
+        self.vault_path = config.get_vault_path()
+        self.sections = {
+            config.folders.projects: "projects",
+            config.folders.categories: "categories",
+            config.folders.resources: "resources",
+        }
+        super().__init__(db_path)
+        try:
+            own = db_path.relative_to(self.vault_path).as_posix()
+        except ValueError:
+            own = None
+        self._own_files = {own, f"{own}-wal", f"{own}-shm", f"{own}-journal"} if own else set()
+        self._admin = config.folders.admin
+    
+    @classmethod
+    def from_config(cls, config: Config) -> "VaultIndex":
+        """Create index at the configured location."""
+        return cls(config.get_vault_index_path(), config)
+    
+    def _create_schema(self) -> None:
+        """Create tables and the triggers maintaining per-kind totals."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS totals ("
+            " kind TEXT PRIMARY KEY,"
+            " files INTEGER NOT NULL,"
+            " size INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS folders (path TEXT PRIMARY KEY, section TEXT NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO totals (kind, files, size) VALUES (?, 0, 0)",
+            ((kind,) for kind in FILE_KINDS),
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS files_insert AFTER INSERT ON files BEGIN"
+            " UPDATE totals SET files = files + 1, size = size + NEW.size WHERE kind = NEW.kind;"
+            " END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS files_delete AFTER DELETE ON files BEGIN"
+            " UPDATE totals SET files = files - 1, size = size - OLD.size WHERE kind = OLD.kind;"
+            " END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS files_update AFTER UPDATE ON files BEGIN"
+            " UPDATE totals SET files = files - 1, size = size - OLD.size WHERE kind = OLD.kind;"
+            " UPDATE totals SET files = files + 1, size = size + NEW.size WHERE kind = NEW.kind;"
+            " END"
+        )
+    
+    def update(self, path: Path) -> None:
+        """Record the current state of a file or directory tree."""
+        rel = self._relative(path)
+        if rel is None:
+            return
+        
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.remove(path)
+            return
+        
+        if stat.S_ISDIR(st.st_mode):
+            folders = {rel}
+            files = list(self._walk(path, folders))
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    for folder in folders:
+                        self._put_folder(folder)
+                    for entry in files:
+                        self._put(*entry)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        else:
+            with self._lock:
+                self._put(rel, self.config.classify(path), st.st_size, st.st_mtime_ns)
+    
+    def remove(self, path: Path) -> None:
+        """Forget a file or everything below a directory."""
+        rel = self._relative(path)
+        if rel is None:
+            return
+        
+        low, high = f"{rel}/", f"{rel}0"
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM files WHERE path = ? OR (path >= ? AND path < ?)", (rel, low, high))
+            self._conn.execute("DELETE FROM folders WHERE path = ? OR (path >= ? AND path < ?)", (rel, low, high))
+            self._conn.execute("COMMIT")
+    
+    def reconcile(
+        self,
+        changed: Optional[List[Path]] = None,
+        scope: Optional[Sequence[str]] = None,
+    ) -> Dict[str, int]:
+        """Bring the index in line with the vault after a period without events.
+        
+        Paths of added and updated files are appended to ``changed`` if given.
+        ``scope`` limits the walk to some top-level vault folders; only a walk
+        of the whole vault counts as a full reconciliation.
+        """
+        started = time.monotonic()
+        folders: Set[str] = set()
+        if scope is None:
+            files = list(self._walk(self.vault_path, folders))
+            with self._lock:
+                known = {
+                    path: (size, mtime_ns)
+                    for path, size, mtime_ns in self._conn.execute("SELECT path, size, mtime_ns FROM files")
+                }
+        else:
+            files = []
+            known = {}
+            for folder in scope:
+                files.extend(self._walk(self.vault_path / folder, folders))
+                with self._lock:
+                    known.update(
+                        (path, (size, mtime_ns))
+                        for path, size, mtime_ns in self._conn.execute(
+                            "SELECT path, size, mtime_ns FROM files WHERE path >= ? AND path < ?",
+                            (f"{folder}/", f"{folder}0"),
+                        )
+                    )
+        
+        changes = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                if scope is None:
+                    self._conn.execute("DELETE FROM folders")
+                for folder in folders:
+                    self._put_folder(folder)
+                for rel, kind, size, mtime_ns in files:
+                    previous = known.pop(rel, None)
+                    if previous == (size, mtime_ns):
+                        continue
+                    changes["updated" if previous else "added"] += 1
+                    self._put(rel, kind, size, mtime_ns)
+                    if changed is not None:
+                        changed.append(self.vault_path / rel)
+                
+                self._conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in known))
+                changes["removed"] = len(known)
+                if scope is None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('reconciled_at', ?)",
+                        (str(time.time()),),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        changes["duration_ms"] = round((time.monotonic() - started) * 1000, 1)
+        return changes
+    
+    def files(self, folder: str) -> List[Path]:
+        """Get indexed files below a vault folder."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM files WHERE path >= ? AND path < ? ORDER BY path", (f"{folder}/", f"{folder}0")
+            ).fetchall()
+        return [self.vault_path / path for path, in rows]
+    
+    def reconciled_at(self) -> Optional[float]:
+        """Get the time of the last full reconciliation."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'reconciled_at'").fetchone()
+        return float(row[0]) if row else None
+    
+    def statistics(self) -> Dict[str, Any]:
+        """Get file counts by kind, total size and vault section counts."""
+        with self._lock:
+            totals = {kind: (files, size) for kind, files, size in self._conn.execute("SELECT * FROM totals")}
+            sections = dict(self._conn.execute("SELECT section, COUNT(*) FROM folders GROUP BY section").fetchall())
+        
+        return {
+            "total_files": sum(files for files, _ in totals.values()),
+            "total_size": sum(size for _, size in totals.values()),
+            "projects": sections.get("projects", 0),
+            "categories": sections.get("categories", 0),
+            "resources": sections.get("resources", 0),
+            "models": totals["model"][0],
+            "notes": totals["note"][0],
+            "documents": totals["document"][0],
+            "images": totals["image"][0],
+        }
+    
+    def _relative(self, path: Path) -> Optional[str]:
+        """Get the index key of a path, or None if it is not indexed."""
+        try:
+            rel = Path(path).relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return None
+        if rel == "." or rel in self._own_files:
+            return None
+        if rel == self._admin or rel.startswith(f"{self._admin}/"):
+            return None
+        return rel
+    
+    def _put(self, rel: str, kind: str, size: int, mtime_ns: int) -> None:
+        """Insert or update a file row; the caller holds the lock."""
+        self._conn.execute(
+            "INSERT INTO files (path, kind, size, mtime_ns) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (path) DO UPDATE SET"
+            " kind = excluded.kind, size = excluded.size, mtime_ns = excluded.mtime_ns",
+            (rel, kind, size, mtime_ns),
+        )
+    
+    def _put_folder(self, rel: str) -> None:
+        """Record a project, category or resource directory; the caller holds the lock."""
+        parent, _, name = rel.rpartition("/")
+        section = self.sections.get(parent)
+        if section and name:
+            self._conn.execute("INSERT OR REPLACE INTO folders (path, section) VALUES (?, ?)", (rel, section))
+    
+    def _walk(self, directory: Path, folders: Set[str]) -> Iterator[Tuple[str, str, int, int]]:
+        """Yield (path, kind, size, mtime_ns) for files below a directory, collecting subdirectories."""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError:
+                continue
+            
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        rel = self._relative(Path(entry.path))
+                        if rel:
+                            stack.append(Path(entry.path))
+                            folders.add(rel)
+                    elif entry.is_file():
+                        rel = self._relative(Path(entry.path))
+                        if rel is None:
+                            continue
+                        st = entry.stat()
+                        yield rel, self.config.classify(entry.name), st.st_size, st.st_mtime_ns
+                except OSError:
+                    continue
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""Write-ahead journal of file routing operations for Vault Watcher."""
+
+import os
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from .config import Config
+from .storage import SQLiteStore
+
+
+# Routing steps in order; an entry records the last step that was started or done
+JOURNAL_STEPS = ("moving", "moved", "recorded")
+
+
+class JournalEntry(NamedTuple):
+    """Routing operation in flight."""
+    
+    id: int
+    src: str
+    dest: str
+    kind: Optional[str]
+    code: Optional[str]
+    step: str
+    pid: int
+    started: float
+    updated: float
+    process: str = ""
+
+
+class ProcessingJournal(SQLiteStore):
+    """Journal of routing operations that are not finished yet.
+    
+    An entry is written before a file is moved and advanced after each step
+    (move, hash database update); it is removed once the conversion is queued.
+    Entries left behind by a crash tell the recovery pass which operations to
+    finish or roll back. The table only ever holds operations in flight, so it
+    stays a few rows long.
+    """
+    
+    @classmethod
+    def from_config(cls, config: Config) -> "ProcessingJournal":
+        """Create journal at the configured location."""
+        return cls(config.get_journal_path())
+    
+    def _create_schema(self) -> None:
+        """Create the operations table."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS operations ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " src TEXT NOT NULL,"
+            " dest TEXT NOT NULL,"
+            " kind TEXT,"
+            " code TEXT,"
+            " step TEXT NOT NULL,"
+            " pid INTEGER NOT NULL,"
+            " started REAL NOT NULL,"
+            " updated REAL NOT NULL,"
+            " process TEXT NOT NULL DEFAULT ''"
+            ")"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(operations)")}
+        if "process" not in columns:
+            self._conn.execute("ALTER TABLE operations ADD COLUMN process TEXT NOT NULL DEFAULT ''")
+    
+    def begin(self, src: Path, dest: Path, kind: Optional[str] = None, code: Optional[str] = None) -> int:
+        """Record the intent to move a file and return the entry id."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO operations (src, dest, kind, code, step, pid, started, updated, process)"
+                " VALUES (?, ?, ?, ?, 'moving', ?, ?, ?, ?)",
+                (str(src), str(dest), kind, code, os.getpid(), now, now, process_identity(os.getpid())),
+            )
+        return cursor.lastrowid
+    
+    def advance(self, entry_id: int, step: str) -> None:
+        """Record that an operation completed a step."""
+        if step not in JOURNAL_STEPS:
+            raise ValueError(f"Unknown journal step: {step}")
+        with self._lock:
+            self._conn.execute("UPDATE operations SET step = ?, updated = ? WHERE id = ?", (step, time.time(), entry_id))
+    
+    def finish(self, entry_id: int) -> None:
+        """Forget a finished or abandoned operation."""
+        with self._lock:
+            self._conn.execute("DELETE FROM operations WHERE id = ?", (entry_id,))
+    
+    def pending(self) -> List[JournalEntry]:
+        """Get operations left unfinished by processes that are no longer running."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, src, dest, kind, code, step, pid, started, updated, process FROM operations ORDER BY id"
+            ).fetchall()
+        return [
+            entry for entry in map(JournalEntry._make, rows)
+            if not _is_other_live_process(entry.pid, entry.process)
+        ]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+
+
+def process_identity(pid: int) -> str:
+    """Identify a process beyond its pid: boot id and start time, empty where /proc is unavailable.
+    
+    A pid is reused after a reboot or container restart; the boot id and the
+    start time in clock ticks since boot are not.
+    """
+    try:
+        boot_id = Path("/proc/sys/kernel/random/boot_id").read_text().strip()
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return ""
+    # The command name may contain spaces; fields after it are space separated
+    fields = stat[stat.rfind(")") + 2:].split()
+    return f"{boot_id}:{fields[19]}"
+
+
+def _is_other_live_process(pid: int, process: str = "") -> bool:
+    """Check whether a pid belongs to another process that is still running.
+    
+    With a recorded process identity the pid must also still belong to the
+    same process, not to a later one that reused it.
+    """
+    if pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    except OSError:
+        return False
+    return not process or process_identity(pid) in (process, "")
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""Buffered JSONL writer with daily rotation for Vault Watcher."""
+
+import json
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+
+class JsonlWriter:
+    """Append-only JSON Lines writer with buffering and daily files.
+    
+    Records are serialized on ``write`` and kept in memory until
+    ``buffer_size`` records are pending or ``flush_interval`` seconds have
+    passed, then appended to ``<directory>/<YYYY-MM-DD><suffix>`` with a single
+    write. The file stays open in append mode, so the cost of a record does
+    not depend on the size of the day's log. A new file is started when the
+    date changes.
+    """
+    
+    def __init__(
+        self,
+        directory: Path,
+        suffix: str = ".log.jsonl",
+        buffer_size: int = 256,
+        flush_interval: float = 1.0,
+        today: Callable[[], date] = date.today,
+    ):
+        self.directory = directory
+        self.suffix = suffix
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = flush_interval
+        self._today = today
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._buffer_date: Optional[date] = None
+        self._file: Optional[TextIO] = None
+        self._file_date: Optional[date] = None
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="JsonlWriter", daemon=True)
+            self._flusher.start()
+    
+    @property
+    def current_path(self) -> Path:
+        """Get the file records written now go to."""
+        return self.directory / f"{self._today().isoformat()}{self.suffix}"
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """Queue a record for writing."""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        today = self._today()
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError("write to closed JsonlWriter")
+            # Records buffered before midnight belong to the previous day's file
+            if self._buffer and self._buffer_date != today:
+                self._flush_locked()
+            if not self._buffer:
+                self._buffer_date = today
+            self._buffer.append(line)
+            if len(self._buffer) >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+    
+    def flush(self) -> None:
+        """Write pending records to disk."""
+        with self._lock:
+            self._flush_locked()
+    
+    def close(self) -> None:
+        """Flush pending records, stop the flush thread and close the file."""
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._flush_locked()
+            self._closed.set()
+            if self._file:
+                self._file.close()
+                self._file = None
+        if self._flusher and self._flusher is not threading.current_thread():
+            self._flusher.join()
+    
+    def __enter__(self) -> "JsonlWriter":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _flush_locked(self) -> None:
+        """Append the buffer to its day's file; the caller holds the lock."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        
+        day = self._buffer_date or self._today()
+        if self._file is None or self._file_date != day:
+            if self._file:
+                self._file.close()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.directory / f"{day.isoformat()}{self.suffix}", "a", encoding="utf-8")
+            self._file_date = day
+        
+        self._file.write("".join(self._buffer))
+        self._file.flush()
+        self._buffer.clear()
+    
+    def _flush_periodically(self) -> None:
+        """Flush on a timer so quiet periods do not hold records back."""
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if not self._closed.is_set():
+                    self._flush_locked()
\ No newline at end of file
@@ -0,0 +1,233 @@
+"""Cached, paginated directory listings for Vault Watcher."""
+
+import base64
+import binascii
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+SORT_FIELDS = ("name", "size", "modified", "type")
+
+
+class ListingEntry(NamedTuple):
+    """Directory entry as returned by a listing."""
+    
+    name: str
+    is_directory: bool
+    size: int
+    mtime_ns: int
+    file_type: str
+
+
+class ListingPage(NamedTuple):
+    """One page of a directory listing."""
+    
+    entries: List[ListingEntry]
+    total: int
+    next_cursor: Optional[str]
+    etag: str
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class DirectoryListing:
+    """Directory listings cached by directory identity and modification time.
+    
+    A directory is scanned once per change of its mtime; filtered and sorted
+    views are cached on top of the scan, and pages are cut from them with
+    keyset cursors. The ETag of a page is derived from the directory's mtime and
+    the query, so clients polling an unchanged directory can be answered with
+    304 without touching the file system beyond a single ``stat``. Size or mtime
+    changes of files that leave the directory's mtime alone are picked up on the
+    next change of the directory.
+    """
+    
+    def __init__(self, file_type: Callable[[str, bool], str], max_views: int = 64):
+        self.file_type = file_type
+        self.max_views = max_views
+        self._lock = threading.Lock()
+        self._scans: "OrderedDict[str, Tuple[Tuple[int, int, int], List[ListingEntry]]]" = OrderedDict()
+        self._views: "OrderedDict[Tuple[Any, ...], Tuple[List[ListingEntry], List[Tuple[Any, ...]]]]" = OrderedDict()
+    
+    def page(
+        self,
+        directory: Path,
+        cursor: Optional[str] = None,
+        limit: int = 200,
+        file_type: Optional[str] = None,
+        suffixes: Sequence[str] = (),
+        sort: str = "name",
+        order: str = "asc",
+    ) -> ListingPage:
+        """Get one page of a directory listing."""
+        version = self._version(directory)
+        query = self._normalize_query(cursor, limit, file_type, suffixes, sort, order)
+        cursor, limit, file_type, suffixes, sort, order = query
+        
+        entries, keys = self._view(directory, version, file_type, suffixes, sort, order)
+        after = self.decode_cursor(cursor) if cursor else None
+        
+        try:
+            if order == "asc":
+                start = bisect_right(keys, after) if after is not None else 0
+                selected = entries[start:start + limit]
+                more = start + limit < len(entries)
+            else:
+                end = bisect_left(keys, after) if after is not None else len(entries)
+                selected = entries[max(0, end - limit):end][::-1]
+                more = end - limit > 0
+        except TypeError as e:
+            raise InvalidCursorError("Cursor does not match the sort order") from e
+        
+        next_cursor = None
+        if more and selected:
+            next_cursor = self.encode_cursor(self.sort_key(selected[-1], sort, order))
+        return ListingPage(selected, len(entries), next_cursor, self._etag(directory, version, query))
+    
+    def etag_for(
+        self,
+        directory: Path,
+        cursor: Optional[str] = None,
+        limit: int = 200,
+        file_type: Optional[str] = None,
+        suffixes: Sequence[str] = (),
+        sort: str = "name",
+        order: str = "asc",
+    ) -> str:
+        """Get the ETag ``page`` would return, without listing the directory."""
+        query = self._normalize_query(cursor, limit, file_type, suffixes, sort, order)
+        return self._etag(directory, self._version(directory), query)
+    
+    @staticmethod
+    def _version(directory: Path) -> Tuple[int, int, int]:
+        """Get the identity and modification time of a directory."""
+        stat = os.stat(directory)
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+    
+    def _normalize_query(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        file_type: Optional[str],
+        suffixes: Sequence[str],
+        sort: str,
+        order: str,
+    ) -> Tuple[Any, ...]:
+        """Validate and normalize listing parameters."""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort}")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Unsupported sort order: {order}")
+        normalized = tuple(sorted({self._normalize_suffix(suffix) for suffix in suffixes if suffix.strip()}))
+        return (cursor, limit, file_type.lower() if file_type else None, normalized, sort, order)
+    
+    @staticmethod
+    def _etag(directory: Path, version: Tuple[int, int, int], query: Tuple[Any, ...]) -> str:
+        """Build a weak ETag for a directory version and query."""
+        payload = json.dumps([str(directory), version, query])
+        return f'W/"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"'
+    
+    @staticmethod
+    def sort_key(entry: ListingEntry, sort: str, order: str) -> Tuple[Any, ...]:
+        """Get the unique sort key of an entry; directories come first in either order."""
+        rank = int(not entry.is_directory) if order == "asc" else int(entry.is_directory)
+        value: Any = {
+            "name": entry.name.lower(),
+            "size": entry.size,
+            "modified": entry.mtime_ns,
+            "type": entry.file_type,
+        }[sort]
+        return (rank, value, entry.name)
+    
+    @staticmethod
+    def encode_cursor(key: Tuple[Any, ...]) -> str:
+        """Encode a sort key as an opaque cursor."""
+        return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+        """Decode a cursor produced by ``encode_cursor``."""
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        if not isinstance(key, list) or len(key) != 3:
+            raise InvalidCursorError("Invalid cursor")
+        return tuple(key)
+    
+    @staticmethod
+    def _normalize_suffix(suffix: str) -> str:
+        """Normalize a suffix filter to the ``.ext`` form."""
+        suffix = suffix.strip().lower()
+        return suffix if suffix.startswith(".") else f".{suffix}"
+    
+    def _view(
+        self,
+        directory: Path,
+        version: Tuple[int, int, int],
+        file_type: Optional[str],
+        suffixes: Tuple[str, ...],
+        sort: str,
+        order: str,
+    ) -> Tuple[List[ListingEntry], List[Tuple[Any, ...]]]:
+        """Get filtered entries sorted ascending by key, with their keys."""
+        view_key = (str(directory), version, file_type, suffixes, sort, order)
+        with self._lock:
+            view = self._views.get(view_key)
+            if view is not None:
+                self._views.move_to_end(view_key)
+                return view
+        
+        entries = [
+            entry for entry in self._scan(directory, version)
+            if (file_type is None or entry.file_type.lower() == file_type)
+            and (not suffixes or os.path.splitext(entry.name)[1].lower() in suffixes)
+        ]
+        entries.sort(key=lambda entry: self.sort_key(entry, sort, order))
+        view = (entries, [self.sort_key(entry, sort, order) for entry in entries])
+        
+        with self._lock:
+            self._views[view_key] = view
+            while len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+        return view
+    
+    def _scan(self, directory: Path, version: Tuple[int, int, int]) -> List[ListingEntry]:
+        """Get all entries of a directory, scanning it only when it changed."""
+        key = str(directory)
+        with self._lock:
+            cached = self._scans.get(key)
+            if cached is not None and cached[0] == version:
+                self._scans.move_to_end(key)
+                return cached[1]
+        
+        entries = []
+        with os.scandir(directory) as scanner:
+            for item in scanner:
+                try:
+                    is_directory = item.is_dir()
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append(ListingEntry(
+                    name=item.name,
+                    is_directory=is_directory,
+                    size=0 if is_directory else stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    file_type=self.file_type(item.name, is_directory),
+                ))
+        
+        with self._lock:
+            self._scans[key] = (version, entries)
+            self._scans.move_to_end(key)
+            while len(self._scans) > self.max_views:
+                self._scans.popitem(last=False)
+        return entries
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""Log tailing and filtering for Vault Watcher."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40, "critical": 50}
+
+
+class LogFilter:
+    """Filter for structlog JSON log lines.
+    
+    ``level`` is a minimum level, ``event`` must match exactly, ``file_path`` is
+    a substring of the record's ``file_path`` and ``since``/``until`` bound its
+    timestamp. Lines that are not JSON only pass an empty filter.
+    """
+    
+    def __init__(
+        self,
+        level: Optional[str] = None,
+        event: Optional[str] = None,
+        file_path: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ):
+        if level is not None and level.lower() not in LEVELS:
+            raise ValueError(f"Unknown log level: {level}")
+        self.level = LEVELS[level.lower()] if level else None
+        self.event = event
+        self.file_path = file_path
+        self.since = _as_utc(since) if since else None
+        self.until = _as_utc(until) if until else None
+    
+    @property
+    def empty(self) -> bool:
+        """Whether the filter accepts every line."""
+        return not any(value is not None for value in (self.level, self.event, self.file_path, self.since, self.until))
+    
+    def matches(self, record: Optional[Dict[str, Any]]) -> bool:
+        """Check a parsed log record against the filter."""
+        if record is None:
+            return self.empty
+        
+        if self.level is not None and LEVELS.get(str(record.get("level", "")).lower(), 0) < self.level:
+            return False
+        if self.event is not None and record.get("event") != self.event:
+            return False
+        if self.file_path is not None and self.file_path not in str(record.get("file_path", "")):
+            return False
+        if self.since is not None or self.until is not None:
+            timestamp = record_time(record)
+            if timestamp is None:
+                return False
+            if self.since is not None and timestamp < self.since:
+                return False
+            if self.until is not None and timestamp > self.until:
+                return False
+        return True
+    
+    def before_range(self, record: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a record is older than ``since``; earlier lines cannot match either."""
+        if self.since is None or record is None:
+            return False
+        timestamp = record_time(record)
+        return timestamp is not None and timestamp < self.since
+
+
+def parse_line(line: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON log line, or return None for other lines."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def record_time(record: Dict[str, Any]) -> Optional[datetime]:
+    """Get the timestamp of a log record as an aware UTC datetime."""
+    try:
+        return _as_utc(datetime.fromisoformat(str(record["timestamp"]).replace("Z", "+00:00")))
+    except (KeyError, ValueError):
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, which is what the log timestamps use."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def iter_lines_reversed(log_path: Path, block_size: int = 65536) -> Iterator[str]:
+    """Yield the lines of a file from last to first, reading it backwards in blocks."""
+    with open(log_path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode("utf-8", errors="replace").rstrip("\r")
+        if remainder.strip():
+            yield remainder.decode("utf-8", errors="replace").rstrip("\r")
+
+
+def tail(log_path: Path, limit: int, log_filter: Optional[LogFilter] = None) -> List[str]:
+    """Get the last ``limit`` matching lines in file order.
+    
+    Only the end of the file is read: without a filter the cost is
+    proportional to ``limit``; with ``since`` the scan stops at the first older
+    record.
+    """
+    log_filter = log_filter or LogFilter()
+    lines: List[str] = []
+    if limit <= 0:
+        return lines
+    
+    for line in iter_lines_reversed(log_path):
+        record = None if log_filter.empty else parse_line(line)
+        if log_filter.before_range(record):
+            break
+        if log_filter.matches(record):
+            lines.append(line)
+            if len(lines) >= limit:
+                break
+    
+    lines.reverse()
+    return lines
+
+
+class LogFollower:
+    """Incremental reader returning lines appended to a log file.
+    
+    The follower remembers its offset, so each poll reads only new data. When
+    the file is rotated or truncated it starts over on the new file.
+    """
+    
+    def __init__(self, log_path: Path, from_end: bool = True):
+        self.log_path = log_path
+        self._identity = None
+        self._offset = 0
+        self._partial = b""
+        if from_end:
+            try:
+                stat = os.stat(log_path)
+                self._identity = (stat.st_dev, stat.st_ino)
+                self._offset = stat.st_size
+            except OSError:
+                pass
+    
+    def read_new(self) -> List[str]:
+        """Read complete lines appended since the last call."""
+        try:
+            stat = os.stat(self.log_path)
+        except OSError:
+            return []
+        
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self._identity or stat.st_size < self._offset:
+            self._identity = identity
+            self._offset = 0
+            self._partial = b""
+        if stat.st_size == self._offset:
+            return []
+        
+        with open(self.log_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+        self._offset += len(data)
+        
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        return [line.decode("utf-8", errors="replace").rstrip("\r") for line in lines if line.strip()]
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Prometheus metrics for Vault Watcher."""
+
+from typing import Callable, Dict, Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from .events import EVENT_TYPES, VaultEvent
+
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Reading, hashing and moving a file: from a page cache hit to a large copy across disks
+FILE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# Running a converter process
+CONVERSION_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+# Event pipeline counters of VaultWatcher.get_metrics, by the stage they count
+PIPELINE_STAGES = {
+    "events_received": "received",
+    "events_coalesced": "coalesced",
+    "events_dropped": "dropped",
+    "events_processed": "processed",
+}
+
+
+class ProcessingMetrics(Collector):
+    """Counters and latency histograms of file processing in a registry of their own.
+    
+    Recording a value takes a lock and a few increments; nothing is formatted
+    until ``render`` is called for a scrape. Queue depths are not updated per
+    file at all: they are read from the watcher's own counters while a scrape
+    collects them.
+    """
+    
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        self.registry = registry if registry is not None else CollectorRegistry()
+        self._counters: Optional[Callable[[], Dict[str, int]]] = None
+        self._conversion_jobs: Optional[Callable[[], Dict[str, int]]] = None
+        
+        self.process_seconds = Histogram(
+            "vault_watcher_process_seconds", "Time to route a file",
+            buckets=FILE_BUCKETS, registry=self.registry,
+        )
+        self.hash_seconds = Histogram(
+            "vault_watcher_hash_seconds", "Time to hash a file, by partial (head and tail) or full digest",
+            ["scope"], buckets=FILE_BUCKETS, registry=self.registry,
+        )
+        self.move_seconds = Histogram(
+            "vault_watcher_move_seconds", "Time to move a file into place, by move method",
+            ["method"], buckets=FILE_BUCKETS, registry=self.registry,
+        )
+        self.conversion_seconds = Histogram(
+            "vault_watcher_conversion_seconds", "Time to run a conversion tool, by tool and outcome",
+            ["tool", "outcome"], buckets=CONVERSION_BUCKETS, registry=self.registry,
+        )
+        self.dedup_checks = Counter(
+            "vault_watcher_dedup_checks", "Duplicate checks, by result (hit or miss)",
+            ["result"], registry=self.registry,
+        )
+        self.events = Counter(
+            "vault_watcher_events", "Watcher events published, by type",
+            ["type"], registry=self.registry,
+        )
+        for event_type in EVENT_TYPES:
+            self.events.labels(event_type)
+        self.registry.register(self)
+    
+    def count_event(self, event: VaultEvent) -> None:
+        """Count a published event; meant as an event bus subscriber."""
+        self.events.labels(event.type).inc()
+    
+    def track(
+        self,
+        counters: Callable[[], Dict[str, int]],
+        conversion_jobs: Optional[Callable[[], Dict[str, int]]] = None,
+    ) -> None:
+        """Report pipeline and worker pool counters and conversion jobs by status at each scrape."""
+        self._counters = counters
+        self._conversion_jobs = conversion_jobs
+    
+    def untrack(self) -> None:
+        """Stop reporting queue depths."""
+        self._counters = None
+        self._conversion_jobs = None
+    
+    def collect(self) -> Iterator:
+        """Read queue depths for a scrape."""
+        counters, conversion_jobs = self._counters, self._conversion_jobs
+        if counters is not None:
+            values = counters()
+            stages = CounterMetricFamily(
+                "vault_watcher_pipeline_events", "File system events seen by the event pipeline, by stage",
+                labels=["stage"],
+            )
+            for key, stage in PIPELINE_STAGES.items():
+                stages.add_metric([stage], values.get(key, 0))
+            yield stages
+            
+            depth = GaugeMetricFamily(
+                "vault_watcher_queue_depth", "Files waiting in a processing stage", labels=["queue"]
+            )
+            depth.add_metric(["pipeline"], values.get("pending", 0))
+            depth.add_metric(["pool"], values.get("pool_queued", 0))
+            yield depth
+            yield GaugeMetricFamily("vault_watcher_pool_running", "Files being processed", values.get("pool_running", 0))
+            yield GaugeMetricFamily("vault_watcher_pool_workers", "Processing worker threads", values.get("pool_workers", 0))
+        
+        if conversion_jobs is not None:
+            jobs = GaugeMetricFamily(
+                "vault_watcher_conversion_jobs", "3D conversion jobs, by status", labels=["status"]
+            )
+            for status, count in conversion_jobs().items():
+                jobs.add_metric([status], count)
+            yield jobs
+    
+    def render(self) -> bytes:
+        """Render the registry in the Prometheus text format."""
+        return generate_latest(self.registry)
\ No newline at end of file
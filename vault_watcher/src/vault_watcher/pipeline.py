@@ -0,0 +1,153 @@
+"""Debounced event pipeline for Vault Watcher."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .logging import LoggerMixin, log_error
+
+
+class PendingPath:
+    """Coalesced state of a path waiting to settle."""
+    
+    def __init__(self, now: float, signature: Optional[Tuple[int, int]]):
+        self.last_event = now
+        self.signature = signature
+        self.stable_since = now
+
+
+class EventPipeline(LoggerMixin):
+    """Coalesce file events per path and dispatch once the file has settled.
+    
+    Every event for a path only refreshes its pending entry. A background thread
+    polls pending paths and dispatches a path once no event arrived and its size
+    and mtime stayed unchanged for ``quiet_period`` seconds, so a large copy
+    into the inbox results in a single dispatch of the complete file.
+    """
+    
+    def __init__(
+        self,
+        dispatch: Callable[[Path], Any],
+        quiet_period: float = 2.0,
+        poll_interval: float = 0.5,
+    ):
+        self.dispatch = dispatch
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self._pending: Dict[Path, PendingPath] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._metrics = {
+            "events_received": 0,
+            "events_coalesced": 0,
+            "events_processed": 0,
+            "events_dropped": 0,
+        }
+    
+    def submit(self, file_path: Path) -> None:
+        """Register an event for a path."""
+        signature = self._signature(file_path)
+        now = time.monotonic()
+        with self._condition:
+            self._metrics["events_received"] += 1
+            pending = self._pending.get(file_path)
+            if pending is None:
+                self._pending[file_path] = PendingPath(now, signature)
+            else:
+                pending.last_event = now
+                if signature != pending.signature:
+                    pending.signature = signature
+                    pending.stable_since = now
+                self._metrics["events_coalesced"] += 1
+            self._condition.notify()
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """Get event counters."""
+        with self._condition:
+            return {**self._metrics, "pending": len(self._pending)}
+    
+    def start(self) -> None:
+        """Start the dispatch thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="EventPipeline", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the dispatch thread; pending paths are left undispatched."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def _run(self) -> None:
+        """Poll pending paths and dispatch settled ones."""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+                self._condition.wait(self.poll_interval)
+            
+            for file_path in self._collect_settled():
+                self._dispatch(file_path)
+    
+    def _collect_settled(self) -> List[Path]:
+        """Remove and return paths that settled since the last poll.
+        
+        Files are stat'ed without holding the lock, so the observer thread can
+        keep submitting events during a slow sweep; a path that got a new event
+        meanwhile is left for the next poll.
+        """
+        now = time.monotonic()
+        settled = []
+        
+        with self._condition:
+            candidates = [
+                (file_path, pending, pending.last_event)
+                for file_path, pending in self._pending.items()
+                if now - pending.last_event >= self.quiet_period
+            ]
+        signatures = [self._signature(file_path) for file_path, _, _ in candidates]
+        
+        with self._condition:
+            for (file_path, pending, last_event), signature in zip(candidates, signatures, strict=True):
+                if self._pending.get(file_path) is not pending or pending.last_event != last_event:
+                    continue
+                if signature is None:
+                    del self._pending[file_path]
+                    self._metrics["events_dropped"] += 1
+                elif signature != pending.signature:
+                    pending.signature = signature
+                    pending.stable_since = now
+                elif now - pending.stable_since >= self.quiet_period:
+                    del self._pending[file_path]
+                    settled.append(file_path)
+        
+        return settled
+    
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        """Get (size, mtime) of a file, or None if it is gone."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+    
+    def _dispatch(self, file_path: Path) -> None:
+        """Hand a settled path to the dispatch callback."""
+        with self._condition:
+            self._metrics["events_processed"] += 1
+        try:
+            self.dispatch(file_path)
+        except Exception as e:
+            log_error(self.logger, "event_dispatch_failed", e, file_path=str(file_path))
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Request rate limiting for the Vault Watcher API."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+
+class RateLimiter:
+    """Token bucket per client allowing ``rate`` requests per ``period`` seconds.
+    
+    A client may burst up to ``rate`` requests, after which tokens come back
+    evenly over the period. Buckets of the least recently seen clients are
+    forgotten beyond ``max_clients``, which only makes those clients start
+    over with a full bucket.
+    """
+    
+    def __init__(self, rate: int, period: float = 60.0, max_clients: int = 10000):
+        self.rate = rate
+        self.period = period
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+    
+    def acquire(self, client: str, cost: float = 1.0) -> float:
+        """Take tokens for a request; returns 0 if allowed, else seconds until it would be."""
+        now = time.monotonic()
+        refill = self.rate / self.period
+        with self._lock:
+            tokens, updated = self._buckets.get(client, (float(self.rate), now))
+            tokens = min(float(self.rate), tokens + (now - updated) * refill)
+            
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[client] = (tokens, now)
+            self._buckets.move_to_end(client)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return 0.0 if allowed else (cost - tokens) / refill
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buckets)
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""Routing table for file assignment detection in Vault Watcher."""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .config import Config
+from .logging import LoggerMixin, log_error
+
+
+ASSIGN_SUFFIX = ".assign"
+# Trie key standing for any single path component, captured as the assignment code
+WILDCARD = "*"
+
+Assignment = Tuple[Optional[str], Optional[str]]
+
+
+class RoutingTable(LoggerMixin):
+    """Assignment detection compiled from the folder settings.
+    
+    Folder rules (``<projects>/<code>/...``, ``<resources>/parts/<code>/...``,
+    ``<categories>/<code>/...``) are compiled into a trie over path components
+    relative to the vault root, which is resolved once; a lookup is a string
+    prefix check and one dictionary step per component. ``.assign`` files are
+    read once per directory and answered from a cache that file system events
+    invalidate through ``invalidate``.
+    """
+    
+    assignment_re = re.compile(r"([PRC]):([A-Za-z0-9\-_]+)")
+    name_mark_re = re.compile(r"\[(P|R|C):([A-Za-z0-9\-_]+)\]")
+    
+    def __init__(self, config: Config, max_directories: int = 4096):
+        self.max_directories = max_directories
+        vault_path = config.get_vault_path()
+        self._roots = tuple(dict.fromkeys(
+            os.path.join(str(root), "") for root in (vault_path.absolute(), vault_path.resolve())
+        ))
+        self._trie = self._compile({
+            (config.folders.projects, WILDCARD): "P",
+            (config.folders.resources, "parts", WILDCARD): "R",
+            (config.folders.categories, WILDCARD): "C",
+        })
+        self._lock = threading.Lock()
+        self._assignments: "OrderedDict[str, Dict[str, Tuple[str, str]]]" = OrderedDict()
+    
+    @staticmethod
+    def _compile(rules: Dict[Tuple[str, ...], str]) -> dict:
+        """Build a trie of nested dicts; a leaf holds the assignment kind under ``None``."""
+        trie: dict = {}
+        for components, kind in rules.items():
+            node = trie
+            for component in components:
+                node = node.setdefault(component, {})
+            node[None] = kind
+        return trie
+    
+    def detect(self, file_path: Path) -> Assignment:
+        """Detect file assignment from its folder, an ``.assign`` file or its name."""
+        assignment = self.match_folder(file_path)
+        if assignment[0]:
+            return assignment
+        
+        assignment = self.assignment_file(file_path)
+        if assignment:
+            return assignment
+        
+        match = self.name_mark_re.search(file_path.name)
+        if match:
+            return (match.group(1), match.group(2))
+        
+        return (None, None)
+    
+    def match_folder(self, file_path: Path) -> Assignment:
+        """Match the file's location in the vault against the folder rules."""
+        parts = self._relative_parts(file_path)
+        node = self._trie
+        # The last part is the file name, never a folder or code
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is None:
+                child = node.get(WILDCARD)
+                if child is None:
+                    break
+                if None in child:
+                    return (child[None], part)
+            node = child
+        return (None, None)
+    
+    def assignment_file(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        """Get the assignment from a sibling ``<name>.assign`` file."""
+        directory = os.path.dirname(os.fspath(file_path))
+        with self._lock:
+            assignments = self._assignments.get(directory)
+            if assignments is not None:
+                self._assignments.move_to_end(directory)
+        
+        if assignments is None:
+            assignments = self._read_assignments(directory)
+            with self._lock:
+                self._assignments[directory] = assignments
+                while len(self._assignments) > self.max_directories:
+                    self._assignments.popitem(last=False)
+        return assignments.get(file_path.name)
+    
+    def invalidate(self, path: Path, is_directory: bool = False) -> None:
+        """Forget cached ``.assign`` files affected by a change to a path."""
+        path_str = os.fspath(path)
+        with self._lock:
+            if path_str.endswith(ASSIGN_SUFFIX):
+                self._assignments.pop(os.path.dirname(path_str), None)
+            if not is_directory:
+                return
+            # A directory that was moved or deleted takes its cached subdirectories with it
+            prefix = os.path.join(path_str, "")
+            for directory in [d for d in self._assignments if d == path_str or d.startswith(prefix)]:
+                del self._assignments[directory]
+    
+    def _read_assignments(self, directory: str) -> Dict[str, Tuple[str, str]]:
+        """Parse every ``.assign`` file of a directory, keyed by the name of the file it assigns."""
+        assignments: Dict[str, Tuple[str, str]] = {}
+        try:
+            entries = [entry for entry in os.scandir(directory) if entry.name.endswith(ASSIGN_SUFFIX)]
+        except OSError:
+            return assignments
+        
+        for entry in entries:
+            try:
+                with open(entry.path, encoding="utf-8", errors="ignore") as f:
+                    match = self.assignment_re.search(f.read())
+            except OSError as e:
+                log_error(self.logger, "assignment_file_read_failed", e, file_path=entry.path)
+                continue
+            if match:
+                assignments[entry.name[:-len(ASSIGN_SUFFIX)]] = (match.group(1), match.group(2))
+        return assignments
+    
+    def _relative_parts(self, file_path: Path) -> Tuple[str, ...]:
+        """Split a path into components relative to the vault root; paths outside give ()."""
+        path_str = os.fspath(file_path)
+        for root in self._roots:
+            if path_str.startswith(root):
+                return tuple(path_str[len(root):].split(os.sep))
+        
+        # Relative or symlinked paths need a real resolve
+        resolved = os.path.realpath(path_str)
+        for root in self._roots:
+            if resolved.startswith(root):
+                return tuple(resolved[len(root):].split(os.sep))
+        return ()
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""Worker pool scheduling for Vault Watcher."""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .config import Config
+from .logging import LoggerMixin, log_error
+
+
+class SchedulerFullError(Exception):
+    """Raised when the scheduler queue is full and the caller chose not to wait."""
+
+
+class ProcessingScheduler(LoggerMixin):
+    """Bounded worker pool for file processing with per-path ordering.
+    
+    Work for the same path is kept in a per-path FIFO that is drained by at most
+    one worker at a time, so two events for one file never race. The total
+    number of queued and running items is capped at ``queue_limit``; ``submit``
+    blocks (or raises ``SchedulerFullError``) once the cap is reached.
+    """
+    
+    def __init__(
+        self,
+        worker: Callable[[Path], Any],
+        max_workers: int = 4,
+        queue_limit: int = 1000,
+        batch_size: int = 100,
+    ):
+        self.worker = worker
+        self.max_workers = max(1, max_workers)
+        self.queue_limit = max(1, queue_limit)
+        self.batch_size = max(1, batch_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="FileProcessor"
+        )
+        self._slots = threading.BoundedSemaphore(self.queue_limit)
+        self._lock = threading.Lock()
+        self._queues: Dict[Path, Deque[Tuple[Path, Future]]] = {}
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "running": 0,
+        }
+    
+    @classmethod
+    def from_config(cls, worker: Callable[[Path], Any], config: Config) -> "ProcessingScheduler":
+        """Create scheduler sized by performance settings.
+        
+        Each worker streams files through a ``chunk_size`` buffer, so the worker
+        count is also capped to keep those buffers within ``memory_limit_mb``.
+        """
+        performance = config.performance
+        memory_workers = (performance.memory_limit_mb * 1024 * 1024) // max(1, config.hash_database.chunk_size)
+        return cls(
+            worker,
+            max_workers=min(performance.max_workers, max(1, memory_workers)),
+            queue_limit=performance.queue_limit,
+            batch_size=performance.batch_size,
+        )
+    
+    def submit(self, file_path: Path, block: bool = True, timeout: Optional[float] = None) -> Future:
+        """Schedule a path for processing."""
+        if not self._slots.acquire(blocking=block, timeout=timeout if block else None):
+            raise SchedulerFullError(f"Processing queue is full ({self.queue_limit} items)")
+        
+        future: Future = Future()
+        with self._lock:
+            self._metrics["submitted"] += 1
+            queue = self._queues.get(file_path)
+            if queue is not None:
+                queue.append((file_path, future))
+                return future
+            self._queues[file_path] = deque([(file_path, future)])
+        
+        try:
+            self._executor.submit(self._drain, file_path)
+        except RuntimeError as e:
+            # Callers that queued behind this path meanwhile never get a drain either
+            with self._lock:
+                queued = self._queues.pop(file_path, deque())
+                self._metrics["failed"] += len(queued)
+            for _, queued_future in queued:
+                self._slots.release()
+                queued_future.set_exception(e)
+        return future
+    
+    def run_batch(
+        self,
+        file_paths: Iterable[Path],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> List[Any]:
+        """Process paths in batches of ``batch_size`` and return their results in order.
+        
+        ``progress`` is called with the number of paths finished after each batch.
+        """
+        results: List[Any] = []
+        batch: List[Future] = []
+        
+        for file_path in file_paths:
+            batch.append(self.submit(file_path))
+            if len(batch) >= self.batch_size:
+                results.extend(self._collect(batch))
+                if progress:
+                    progress(len(batch))
+                batch = []
+        
+        results.extend(self._collect(batch))
+        if progress and batch:
+            progress(len(batch))
+        return results
+    
+    @staticmethod
+    def _collect(futures: List[Future]) -> List[Any]:
+        """Wait for futures, mapping failures to None."""
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception:
+                results.append(None)
+        return results
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """Get scheduler counters."""
+        with self._lock:
+            queued = sum(len(queue) for queue in self._queues.values())
+            return {**self._metrics, "queued": queued - self._metrics["running"], "workers": self.max_workers}
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and optionally wait for queued items."""
+        self._executor.shutdown(wait=wait)
+    
+    def _drain(self, key: Path) -> None:
+        """Process queued items for one path in submission order."""
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                file_path, future = queue[0]
+                self._metrics["running"] += 1
+            
+            outcome = "failed"
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(self.worker(file_path))
+                        outcome = "completed"
+                    except Exception as e:
+                        log_error(self.logger, "file_processing_failed", e, file_path=str(file_path))
+                        future.set_exception(e)
+                else:
+                    outcome = "completed"
+            finally:
+                self._slots.release()
+            
+            with self._lock:
+                self._metrics["running"] -= 1
+                self._metrics[outcome] += 1
+                queue.popleft()
+                if not queue:
+                    del self._queues[key]
+                    return
\ No newline at end of file
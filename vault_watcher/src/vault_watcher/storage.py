@@ -0,0 +1,292 @@
+"""Persistent storage backends for Vault Watcher."""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class SQLiteStore(ABC):
+    """Base class for stores kept in a local SQLite file in WAL mode."""
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+    
+    @abstractmethod
+    def _create_schema(self) -> None:
+        """Create tables used by the store."""
+    
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# One fixed statement per column, so no SQL is ever built from caller input
+UPDATE_COLUMN = {
+    "size": "UPDATE files SET size = ?, updated = ? WHERE path = ?",
+    "partial": "UPDATE files SET partial = ?, updated = ? WHERE path = ?",
+    "digest": "UPDATE files SET digest = ?, updated = ? WHERE path = ?",
+}
+SELECT_MISSING = {
+    "size": "SELECT path FROM files WHERE size IS NULL",
+    "digest": "SELECT path FROM files WHERE digest IS NULL",
+}
+
+
+class StoredFile(NamedTuple):
+    """Hash store entry."""
+    
+    path: str
+    size: Optional[int]
+    partial: Optional[str]
+    digest: Optional[str]
+
+
+class HashStore(SQLiteStore):
+    """SQLite-backed hash index with incremental, crash-safe writes.
+    
+    Every ``put`` is a single-row upsert committed through the write-ahead log,
+    so adding a file costs O(log n) regardless of the index size. Entries are
+    indexed by size and digest; partial and full digests may be left empty and
+    filled in lazily, only when a size collision makes them necessary.
+    """
+    
+    def _create_schema(self) -> None:
+        """Create the files table, migrating the digest-keyed layout if present."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER,"
+            " partial TEXT,"
+            " digest TEXT,"
+            " updated REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS files_size ON files (size)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS files_digest ON files (digest)")
+        
+        legacy = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'hashes'"
+        ).fetchone()
+        if legacy:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "INSERT OR IGNORE INTO files (path, digest, updated)"
+                " SELECT path, digest, updated FROM hashes"
+            )
+            self._conn.execute("DROP TABLE hashes")
+            self._conn.execute("COMMIT")
+    
+    def get(self, digest: str) -> Optional[str]:
+        """Get a stored path for a digest."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path FROM files WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(
+        self,
+        path: str,
+        size: Optional[int],
+        partial: Optional[str] = None,
+        digest: Optional[str] = None,
+    ) -> None:
+        """Insert or replace the entry for a path."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, partial, digest, updated)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (path, size, partial, digest, time.time()),
+            )
+    
+    def update(self, path: str, **fields: Any) -> None:
+        """Update size, partial or digest of an existing entry."""
+        columns = [name for name in UPDATE_COLUMN if name in fields]
+        if not columns:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for name in columns:
+                    self._conn.execute(UPDATE_COLUMN[name], (fields[name], now, path))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def delete(self, path: str) -> None:
+        """Remove the entry for a path."""
+        with self._lock:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+    
+    def with_size(self, size: int) -> List[StoredFile]:
+        """Get entries whose files have the given size."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, partial, digest FROM files WHERE size = ?", (size,)
+            ).fetchall()
+        return [StoredFile(*row) for row in rows]
+    
+    def missing(self, column: str) -> List[str]:
+        """Get paths of entries whose ``size`` or ``digest`` is not known yet."""
+        if column not in SELECT_MISSING:
+            raise ValueError(f"Unsupported column: {column}")
+        with self._lock:
+            rows = self._conn.execute(SELECT_MISSING[column]).fetchall()
+        return [row[0] for row in rows]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over (digest, path) pairs of entries with a known digest."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT digest, path FROM files WHERE digest IS NOT NULL ORDER BY digest"
+            ).fetchall()
+        yield from rows
+    
+    def import_json(self, json_path: Path) -> int:
+        """Import entries from a legacy ``{digest: path}`` JSON file.
+        
+        Sizes are left empty and are expected to be filled in by the caller.
+        """
+        with open(json_path, "r", encoding="utf-8") as f:
+            data: Dict[str, str] = json.load(f)
+        
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, size, partial, digest, updated)"
+                    " VALUES (?, NULL, NULL, ?, ?)",
+                    ((str(path), digest, now) for digest, path in data.items()),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(data)
+    
+    def export_json(self, json_path: Path) -> int:
+        """Export entries to a ``{digest: path}`` JSON file atomically."""
+        data = dict(self.items())
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fd, temp_name = tempfile.mkstemp(dir=str(json_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, json_path)
+        except Exception:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return len(data)
+
+
+class DigestCache(SQLiteStore):
+    """Persistent digest cache keyed by file stat identity.
+    
+    A cached digest is valid while the file keeps the same device, inode, size
+    and modification time, so unchanged files are never read twice, including
+    across restarts and same-filesystem renames.
+    
+    Only the latest version of an inode is kept, and the table is capped at
+    ``max_entries`` rows: the oldest entries, mostly of deleted files, are
+    pruned on open and every ``PRUNE_INTERVAL`` writes.
+    """
+    
+    PRUNE_INTERVAL = 1000
+    
+    def __init__(self, db_path: Path, max_entries: int = 100000):
+        self.max_entries = max(1, max_entries)
+        self._writes = 0
+        super().__init__(db_path)
+        self.prune()
+    
+    def _create_schema(self) -> None:
+        """Create the digests table."""
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            " device INTEGER NOT NULL,"
+            " inode INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " algorithm TEXT NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " stored REAL NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (device, inode, size, mtime_ns, algorithm)"
+            ")"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(digests)")}
+        if "stored" not in columns:
+            self._conn.execute("ALTER TABLE digests ADD COLUMN stored REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS digests_stored ON digests (stored)")
+    
+    @staticmethod
+    def _key(stat: os.stat_result, algorithm: str) -> Tuple[int, int, int, int, str]:
+        """Build cache key from a stat result."""
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, algorithm)
+    
+    def get(self, stat: os.stat_result, algorithm: str) -> Optional[str]:
+        """Get cached digest for a stat identity."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM digests"
+                " WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ? AND algorithm = ?",
+                self._key(stat, algorithm),
+            ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, stat: os.stat_result, algorithm: str, digest: str) -> None:
+        """Store digest for a stat identity, replacing older versions of the inode."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "DELETE FROM digests WHERE device = ? AND inode = ? AND algorithm = ?",
+                    (stat.st_dev, stat.st_ino, algorithm),
+                )
+                self._conn.execute(
+                    "INSERT INTO digests"
+                    " (device, inode, size, mtime_ns, algorithm, digest, stored) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*self._key(stat, algorithm), digest, time.time()),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes += 1
+            due = self._writes >= self.PRUNE_INTERVAL
+        if due:
+            self.prune()
+    
+    def prune(self) -> int:
+        """Drop the oldest entries beyond ``max_entries`` and return how many were removed."""
+        with self._lock:
+            self._writes = 0
+            cursor = self._conn.execute(
+                "DELETE FROM digests WHERE rowid IN ("
+                " SELECT rowid FROM digests ORDER BY stored DESC, rowid DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
+        return cursor.rowcount
\ No newline at end of file
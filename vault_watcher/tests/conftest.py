@@ -0,0 +1,33 @@
+"""Shared fixtures for Vault Watcher tests."""
+
+import pytest
+
+from vault_watcher.config import Config
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Configuration for a fresh vault in a temporary directory."""
+    vault_path = tmp_path / "vault"
+    for folder in ["0_INBOX", "_ONGOING", "1_PROJECTS", "2_CATEGORIES", "3_RESOURCES", "9_ADMIN"]:
+        (vault_path / folder).mkdir(parents=True)
+    
+    return Config(
+        general={"vault_path": str(vault_path)},
+        file_types={},
+        folders={},
+        projects={"meta_template": "test"},
+        categories={"meta_template": "test"},
+        resources={"part_meta_template": "test"},
+        processing={"enable_3d_conversion": False},
+        three_d_conversion={},
+        hash_database={"partial_block_size": 16},
+        logging={},
+        api={},
+        database={},
+        redis={},
+        notifications={},
+        security={},
+        performance={},
+        plugins={},
+    )
\ No newline at end of file
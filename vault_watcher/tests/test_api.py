@@ -0,0 +1,290 @@
+"""Tests for api module."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from vault_watcher.api import VaultWatcherAPI
+from vault_watcher.events import EventBus
+from vault_watcher.logtail import LogFilter
+
+
+@pytest.fixture
+def client(config):
+    """API client for the test vault."""
+    return TestClient(VaultWatcherAPI(config).app)
+
+
+class TestVaultFiles:
+    """Test the /vault/files endpoint."""
+    
+    def test_paginates(self, config, client):
+        """Test files are returned in pages linked by cursors."""
+        models = config.get_vault_path() / "1_PROJECTS" / "ABC" / "models" / "src"
+        models.mkdir(parents=True)
+        for index in range(5):
+            (models / f"part{index}.stl").write_bytes(b"solid")
+        
+        params = {"path": "1_PROJECTS/ABC/models/src", "limit": 2}
+        first = client.get("/vault/files", params=params).json()
+        second = client.get("/vault/files", params={**params, "cursor": first["next_cursor"]}).json()
+        
+        assert first["total"] == 5
+        assert [item["name"] for item in first["items"] + second["items"]] == [f"part{i}.stl" for i in range(4)]
+        assert second["items"][0]["file_type"] == "3D Model"
+    
+    def test_not_modified(self, client):
+        """Test a matching If-None-Match is answered with 304."""
+        response = client.get("/vault/files")
+        etag = response.headers["etag"]
+        
+        cached = client.get("/vault/files", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+    
+    def test_rejects_paths_outside_vault(self, client):
+        """Test listing is confined to the vault."""
+        assert client.get("/vault/files", params={"path": "../"}).status_code == 400
+        assert client.get("/vault/files", params={"path": "missing"}).status_code == 404
+
+class TestLogs:
+    """Test the /logs endpoint."""
+    
+    def test_filters_tail(self, config, client):
+        """Test logs are filtered on structured fields."""
+        log_dir = config.get_log_dir()
+        log_dir.mkdir(parents=True)
+        lines = [
+            '{"event": "file_moved", "level": "info", "timestamp": "2026-01-01T00:00:00Z"}',
+            '{"event": "file_move_failed", "level": "error", "timestamp": "2026-01-01T00:00:01Z"}',
+            '{"event": "file_moved", "level": "info", "timestamp": "2026-01-01T00:00:02Z"}',
+        ]
+        (log_dir / "vault_watcher.log").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        
+        assert client.get("/logs", params={"limit": 2}).json() == {"logs": lines[1:]}
+        assert client.get("/logs", params={"level": "error"}).json() == {"logs": [lines[1]]}
+        assert client.get("/logs", params={"event": "file_moved", "since": "2026-01-01T00:00:01"}).json() == {"logs": [lines[2]]}
+        assert client.get("/logs", params={"level": "loud"}).status_code == 400
+
+class TestFrontmatter:
+    """Test the /vault/frontmatter endpoint."""
+    
+    def test_returns_frontmatter(self, config, client):
+        """Test the frontmatter of a note is parsed."""
+        (config.get_vault_path() / "note.md").write_text("---\ntype: note\nproject: ABC\n---\nbody\n", encoding="utf-8")
+        
+        response = client.get("/vault/frontmatter", params={"path": "note.md"})
+        assert response.json()["frontmatter"] == {"type": "note", "project": "ABC"}
+        assert client.get("/vault/frontmatter", params={"path": "missing.md"}).status_code == 404
+
+class TestEvents:
+    """Test the /events endpoints."""
+    
+    def test_websocket(self, config):
+        """Test events of the running watcher are streamed over a WebSocket."""
+        api = VaultWatcherAPI(config)
+        with TestClient(api.app) as client:
+            client.post("/watcher/start")
+            try:
+                with client.websocket_connect("/events?types=moved,failed") as websocket:
+                    api.watcher.events.publish("processed", "a.stl")
+                    api.watcher.events.publish("moved", "a.stl", "b.stl", method="rename")
+                    message = websocket.receive_json()
+            finally:
+                client.post("/watcher/stop")
+        
+        assert message["type"] == "moved"
+        assert message["dest"] == "b.stl"
+        assert message["method"] == "rename"
+        assert len(api.event_stream) == 0
+    
+    def test_server_sent_events(self, config):
+        """Test events are formatted as server-sent events and the client is released afterwards."""
+        api = VaultWatcherAPI(config)
+        
+        class ConnectedRequest:
+            async def is_disconnected(self):
+                return False
+        
+        async def run():
+            bus = EventBus()
+            api.event_stream.attach(bus)
+            stream = api._stream_events(ConnectedRequest(), api.event_stream.connect())
+            bus.publish("deduplicated", "a.stl", original="b.stl")
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+        
+        chunk = asyncio.run(run())
+        event, data = chunk.splitlines()[:2]
+        assert event == "event: deduplicated"
+        assert json.loads(data[len("data: "):])["original"] == "b.stl"
+        assert len(api.event_stream) == 0
+    
+    def test_rejects_unknown_types(self, client):
+        """Test unknown event types are rejected."""
+        assert client.get("/events", params={"types": "renamed"}).status_code == 400
+
+
+class TestBlockingWork:
+    """Test blocking work of endpoints runs on the executor."""
+    
+    def test_vault_status_refresh(self, config):
+        """Test refresh reconciles the index with files added while nothing was watching."""
+        client = TestClient(VaultWatcherAPI(config).app)
+        before = client.get("/vault/status").json()["total_files"]
+        (config.get_vault_path() / "0_INBOX" / "added.pdf").write_bytes(b"%PDF")
+        
+        assert client.get("/vault/status").json()["total_files"] == before
+        assert client.get("/vault/status", params={"refresh": True}).json()["total_files"] == before + 1
+    
+    def test_timeout(self, config):
+        """Test a request whose work outlives the request timeout is answered with 504."""
+        config.api.request_timeout = 0.05
+        api = VaultWatcherAPI(config)
+        api._collect_vault_statistics = lambda refresh: time.sleep(0.5)
+        client = TestClient(api.app)
+        
+        assert client.get("/vault/status").status_code == 504
+        assert client.get("/health").status_code == 200
+    
+    def test_follow_logs_survives_timeout(self, config):
+        """Test a log poll that times out is skipped instead of ending the stream."""
+        config.api.request_timeout = 0.05
+        api = VaultWatcherAPI(config)
+        polls = []
+        
+        def latest_log_file():
+            polls.append(1)
+            if len(polls) == 1:
+                time.sleep(0.2)
+            return None
+        
+        api._latest_log_file = latest_log_file
+        
+        class ConnectedRequest:
+            async def is_disconnected(self):
+                return len(polls) >= 2
+        
+        async def run():
+            return [chunk async for chunk in api._follow_logs(ConnectedRequest(), None, ["first"], LogFilter(), 0.01)]
+        
+        assert asyncio.run(run()) == ["data: first\n\n"]
+        assert len(polls) == 2
+    
+    def test_executor_shut_down_with_app(self, config):
+        """Test the executor's threads are stopped when the app shuts down."""
+        api = VaultWatcherAPI(config)
+        with TestClient(api.app) as client:
+            assert client.get("/vault/status").status_code == 200
+        
+        assert api.executor._pool._shutdown
+    
+    def test_process_file_job(self, config):
+        """Test file processing is queued as a job polled through its status URL."""
+        dropped = config.get_vault_path() / "0_INBOX" / "[P:ABC] part.stl"
+        dropped.write_bytes(b"solid part")
+        api = VaultWatcherAPI(config)
+        with TestClient(api.app) as client:
+            client.post("/watcher/start")
+            try:
+                response = client.post("/files/process", params={"file_path": "0_INBOX/[P:ABC] part.stl"})
+                assert response.status_code == 202
+                status_url = response.json()["status_url"]
+                
+                for _ in range(100):
+                    job = client.get(status_url).json()
+                    if job["status"] in ("done", "failed"):
+                        break
+                    time.sleep(0.05)
+                pool = client.get("/watcher/status").json()["events"]
+            finally:
+                client.post("/watcher/stop")
+        
+        assert job["status"] == "done"
+        assert job["result"]["destination_path"].endswith("1_PROJECTS/ABC/models/src/[P:ABC] part.stl")
+        # Ordered with watcher events for the same path on the processing pool
+        assert pool["pool_submitted"] >= 1
+        assert client.get("/files/process/missing").status_code == 404
+    
+    def test_process_batch(self, config):
+        """Test a batch streams one NDJSON line per unique file and a summary."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        (inbox / "[P:ABC] a.stl").write_bytes(b"solid a")
+        (inbox / "[P:ABC] b.stl").write_bytes(b"solid b")
+        api = VaultWatcherAPI(config)
+        with TestClient(api.app) as client:
+            assert client.post("/files/process:batch", json={"glob": "*.stl"}).status_code == 400
+            client.post("/watcher/start")
+            try:
+                response = client.post("/files/process:batch", json={
+                    "paths": ["0_INBOX/[P:ABC] a.stl", "../outside.stl", "0_INBOX/missing.stl"],
+                    "glob": "0_INBOX/*.stl",
+                })
+            finally:
+                client.post("/watcher/stop")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        statuses = {line["file_path"]: line["status"] for line in lines[:-1]}
+        assert statuses == {
+            "../outside.stl": "rejected",
+            "0_INBOX/missing.stl": "rejected",
+            "0_INBOX/[P:ABC] a.stl": "moved",
+            "0_INBOX/[P:ABC] b.stl": "moved",
+        }
+        assert lines[-1]["summary"] == {
+            "files": 2, "duplicates": 1, "moved": 2, "unchanged": 0, "failed": 0, "rejected": 2,
+        }
+
+
+class TestMetrics:
+    """Test the metrics endpoint."""
+    
+    def test_metrics(self, config):
+        """Test metrics are served in the Prometheus text format, with queues while the watcher runs."""
+        api = VaultWatcherAPI(config)
+        with TestClient(api.app) as client:
+            idle = client.get("/metrics")
+            client.post("/watcher/start")
+            try:
+                running = client.get("/metrics").text
+            finally:
+                client.post("/watcher/stop")
+        
+        assert idle.status_code == 200
+        assert idle.headers["content-type"].startswith("text/plain")
+        assert "vault_watcher_process_seconds_count 0.0" in idle.text
+        assert "vault_watcher_queue_depth" not in idle.text
+        assert 'vault_watcher_queue_depth{queue="pool"}' in running
+        assert 'vault_watcher_conversion_jobs{status="queued"}' in running
+
+
+class TestRateLimit:
+    """Test the API rate limit."""
+    
+    def test_limit(self, config):
+        """Test requests beyond the limit get 429 with Retry-After."""
+        config.api.rate_limit = 2
+        client = TestClient(VaultWatcherAPI(config).app)
+        
+        assert [client.get("/").status_code for _ in range(3)] == [200, 200, 429]
+        assert int(client.get("/").headers["Retry-After"]) >= 1
+    
+    def test_probes_exempt(self, config):
+        """Test health checks and metric scrapes are never limited."""
+        config.api.rate_limit = 1
+        client = TestClient(VaultWatcherAPI(config).app)
+        
+        assert all(client.get(path).status_code == 200 for path in ("/health", "/metrics") for _ in range(3))
+    
+    def test_disabled(self, config):
+        """Test a zero limit lets every request through."""
+        config.api.rate_limit = 0
+        client = TestClient(VaultWatcherAPI(config).app)
+        
+        assert all(client.get("/").status_code == 200 for _ in range(5))
\ No newline at end of file
@@ -62,6 +62,32 @@ class TestFileTypesSettings:
         
         assert settings.model_extensions == [".custom"]
         assert settings.note_extensions == [".txt"]
+    
+    def test_suffix_map(self):
+        """Test suffixes map to their kind, lowercased, first kind winning."""
+        settings = FileTypesSettings(model_extensions=[".STL"], note_extensions=[".md", ".stl"])
+        kinds = settings.suffix_map()
+        
+        assert kinds[".stl"] == "model"
+        assert kinds[".md"] == "note"
+        assert kinds[".pdf"] == "document"
+
+
+class TestClassify:
+    """Test Config.classify."""
+    
+    @pytest.mark.parametrize("path, kind", [
+        (Path("part.STL"), "model"),
+        ("notes/todo.md", "note"),
+        (Path("manual.pdf"), "document"),
+        ("photo.jpeg", "image"),
+        (Path("archive.tar.gz"), "other"),
+        (Path(".hidden"), "other"),
+    ])
+    def test_classify(self, config, path, kind):
+        """Test files are classified by suffix."""
+        assert config.classify(path) == kind
+        assert config.is_model_file(Path(path)) == (kind == "model")
 
 
 class TestConfig:
@@ -0,0 +1,201 @@
+"""Tests for conversion module."""
+
+import os
+import stat
+import time
+
+import pytest
+
+from vault_watcher.conversion import ConversionCache, ConversionJobStore, ConversionQueue
+from vault_watcher.core import FileProcessor
+
+
+FAKE_ASSIMP = """#!/bin/sh
+# Fake assimp: "assimp export <src> <dest>"; fails while a fail-count file is non-empty.
+if [ "$1" = "version" ]; then
+    echo "fake assimp 1.0"
+    exit 0
+fi
+counter="$(dirname "$0")/failures"
+echo "$2" >> "$(dirname "$0")/calls"
+if [ -s "$counter" ]; then
+    head -c -1 "$counter" > "$counter.tmp" && mv "$counter.tmp" "$counter"
+    echo "conversion crashed"
+    exit 1
+fi
+cp "$2" "$3"
+echo "converted $2"
+"""
+
+
+def wait_for(condition, timeout=5.0):
+    """Wait until condition() is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def fake_converter(tmp_path, monkeypatch):
+    """Put a fake assimp converter on PATH and return its directory."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "assimp"
+    script.write_text(FAKE_ASSIMP, encoding="utf-8")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return bin_dir
+
+
+@pytest.fixture
+def processor(config, fake_converter):
+    """File processor with 3D conversion through the fake converter."""
+    config.processing.enable_3d_conversion = True
+    config.three_d_conversion.conversion_tools = ["assimp"]
+    config.three_d_conversion.enable_validator = False
+    config.three_d_conversion.enable_gltfpack = False
+    config.three_d_conversion.retry_delay = 0
+    processor = FileProcessor(config)
+    processor.conversions.poll_interval = 0.02
+    yield processor
+    processor.conversions.stop()
+
+
+class TestConversionQueue:
+    """Test ConversionQueue class."""
+    
+    def test_routing_does_not_wait_for_conversion(self, config, processor):
+        """Test routing queues the conversion and it completes in the background."""
+        model = config.get_vault_path() / "0_INBOX" / "[P:ABC] bracket.stl"
+        model.write_bytes(b"solid bracket")
+        
+        moved = processor.process_file(model)
+        glb = moved.parent.parent / "glb" / "[P:ABC] bracket.glb"
+        assert not glb.exists()
+        
+        store = processor.conversions.store
+        (job,) = store.recent()
+        assert job.status == "queued"
+        
+        processor.conversions.start()
+        assert wait_for(lambda: store.get(job.id).status == "done")
+        assert glb.read_bytes() == b"solid bracket"
+        assert store.get(job.id).tool == "assimp"
+    
+    def test_failed_conversion_is_retried(self, config, processor, fake_converter):
+        """Test a failing attempt is retried until it succeeds."""
+        (fake_converter / "failures").write_text("x", encoding="utf-8")
+        model = config.get_vault_path() / "0_INBOX" / "[R:BOLT] bolt.stl"
+        model.write_bytes(b"solid bolt")
+        
+        processor.process_file(model)
+        processor.conversions.start()
+        
+        store = processor.conversions.store
+        (job,) = store.recent()
+        assert wait_for(lambda: store.get(job.id).status == "done")
+        assert store.get(job.id).attempts == 2
+    
+    def test_gives_up_after_max_retries(self, config, processor, fake_converter):
+        """Test a job fails permanently once retries are exhausted."""
+        (fake_converter / "failures").write_text("xxxxx", encoding="utf-8")
+        config.three_d_conversion.max_retries = 1
+        processor.conversions.max_retries = 1
+        model = config.get_vault_path() / "0_INBOX" / "[P:ABC] broken.stl"
+        model.write_bytes(b"solid broken")
+        
+        processor.process_file(model)
+        processor.conversions.start()
+        
+        store = processor.conversions.store
+        (job,) = store.recent()
+        assert wait_for(lambda: store.get(job.id).status == "failed")
+        assert store.get(job.id).attempts == 2
+        assert "conversion crashed" in store.get(job.id).error
+    
+    def test_interrupted_jobs_resume(self, config, processor):
+        """Test jobs left running by a crash are picked up on start."""
+        model = config.get_vault_path() / "0_INBOX" / "[P:ABC] bracket.stl"
+        model.write_bytes(b"solid bracket")
+        processor.process_file(model)
+        
+        store = processor.conversions.store
+        job = store.claim()
+        assert store.get(job.id).status == "running"
+        
+        processor.conversions.start()
+        assert wait_for(lambda: store.get(job.id).status == "done")
+    
+    def test_old_finished_jobs_pruned_on_start(self, tmp_path):
+        """Test start drops finished jobs past retention and keeps recent or pending ones."""
+        store = ConversionJobStore(tmp_path / "conversion_jobs.sqlite3")
+        old_done, old_failed, recent_done, old_queued = (
+            store.add(f"/vault/{name}.stl", "stl", "ABC") for name in ("a", "b", "c", "d")
+        )
+        store.finish(old_done, "done")
+        store.finish(old_failed, "failed")
+        store.finish(recent_done, "done")
+        week_ago = time.time() - 7 * 86400
+        store._conn.execute(
+            "UPDATE jobs SET updated = ? WHERE id IN (?, ?, ?)", (week_ago, old_done, old_failed, old_queued)
+        )
+        
+        queue = ConversionQueue(store, lambda job: None, poll_interval=0.05, retention=86400)
+        queue.start()
+        queue.stop()
+        
+        assert store.get(old_done) is None
+        assert store.get(old_failed) is None
+        assert store.get(recent_done).status == "done"
+        assert store.get(old_queued) is not None
+
+
+class TestConversionCache:
+    """Test ConversionCache class."""
+    
+    def test_same_model_in_second_project_is_not_reconverted(self, config, processor, fake_converter):
+        """Test an identical source is restored from the cache."""
+        config.processing.enable_hash_deduplication = False
+        inbox = config.get_vault_path() / "0_INBOX"
+        (inbox / "[P:ABC] bracket.stl").write_bytes(b"solid bracket")
+        (inbox / "[P:XYZ] bracket.stl").write_bytes(b"solid bracket")
+        
+        first = processor.process_file(inbox / "[P:ABC] bracket.stl")
+        second = processor.process_file(inbox / "[P:XYZ] bracket.stl")
+        processor.conversions.start()
+        
+        store = processor.conversions.store
+        assert wait_for(lambda: store.counts()["done"] == 2)
+        first_glb = first.parent.parent / "glb" / "[P:ABC] bracket.glb"
+        second_glb = second.parent.parent / "glb" / "[P:XYZ] bracket.glb"
+        assert second_glb.read_bytes() == first_glb.read_bytes() == b"solid bracket"
+        assert len((fake_converter / "calls").read_text(encoding="utf-8").splitlines()) == 1
+        assert {job.tool for job in store.recent()} == {"assimp"}
+    
+    def test_settings_change_invalidates_key(self, config, processor, tmp_path):
+        """Test conversion settings are part of the cache key."""
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid model")
+        key = processor._conversion_cache_key(model)
+        
+        config.three_d_conversion.default_scale = 1.0
+        assert processor._conversion_cache_key(model) != key
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test entries beyond the size cap are evicted oldest first."""
+        cache = ConversionCache(tmp_path / "cache", max_bytes=10)
+        model = tmp_path / "model.glb"
+        model.write_bytes(b"12345")
+        cache.put("a" * 64, model, "assimp")
+        cache.put("b" * 64, model, "assimp")
+        
+        assert cache.restore("a" * 64, tmp_path / "out.glb") == "assimp"
+        cache.put("c" * 64, model, "assimp")
+        
+        assert len(cache) == 2
+        assert cache.total_size() == 10
+        assert cache.restore("b" * 64, tmp_path / "out.glb") is None
+        assert cache.restore("a" * 64, tmp_path / "out.glb") == "assimp"
\ No newline at end of file
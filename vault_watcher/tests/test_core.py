@@ -0,0 +1,234 @@
+"""Tests for core module."""
+
+import hashlib
+
+import pytest
+
+from vault_watcher.core import FileProcessor, HashDatabase, VaultWatcher
+
+
+def full_hash_duplicate(stored, candidate):
+    """Reference behavior: compare full SHA-256 digests."""
+    digests = {hashlib.sha256(path.read_bytes()).hexdigest(): path for path in stored}
+    return digests.get(hashlib.sha256(candidate.read_bytes()).hexdigest())
+
+
+CASES = {
+    "identical_large": (b"A" * 100 + b"B" * 100, b"A" * 100 + b"B" * 100),
+    "different_size": (b"A" * 200, b"A" * 201),
+    "same_size_different_head": (b"A" * 200, b"C" + b"A" * 199),
+    "same_size_different_tail": (b"A" * 200, b"A" * 199 + b"C"),
+    "same_head_tail_different_middle": (b"A" * 100 + b"B" * 100, b"A" * 100 + b"C" * 100),
+    "identical_small": (b"tiny", b"tiny"),
+    "different_small": (b"tiny", b"tinx"),
+    "empty": (b"", b""),
+}
+
+
+class TestHashDatabase:
+    """Test HashDatabase class."""
+    
+    @pytest.mark.parametrize("stored_bytes,candidate_bytes", CASES.values(), ids=CASES.keys())
+    def test_matches_full_hash_behavior(self, config, stored_bytes, candidate_bytes):
+        """Test tiered detection agrees with full-hash comparison."""
+        vault_path = config.get_vault_path()
+        stored = vault_path / "1_PROJECTS" / "stored.bin"
+        stored.write_bytes(stored_bytes)
+        candidate = vault_path / "0_INBOX" / "candidate.bin"
+        candidate.write_bytes(candidate_bytes)
+        
+        hash_db = HashDatabase(config)
+        hash_db.add_file(stored)
+        
+        assert hash_db.is_duplicate(candidate) == full_hash_duplicate([stored], candidate)
+    
+    def test_no_reads_without_size_collision(self, config, mocker):
+        """Test files with a unique size are never hashed."""
+        vault_path = config.get_vault_path()
+        stored = vault_path / "1_PROJECTS" / "stored.bin"
+        stored.write_bytes(b"A" * 200)
+        candidate = vault_path / "0_INBOX" / "candidate.bin"
+        candidate.write_bytes(b"A" * 300)
+        
+        hash_db = HashDatabase(config)
+        hash_db.add_file(stored)
+        partial = mocker.spy(hash_db, "calculate_partial_hash")
+        full = mocker.spy(hash_db, "calculate_hash")
+        
+        assert hash_db.is_duplicate(candidate) is None
+        assert partial.call_count == 0
+        assert full.call_count == 0
+    
+    def test_full_hash_only_on_partial_collision(self, config, mocker):
+        """Test full digest is skipped when partial digests differ."""
+        vault_path = config.get_vault_path()
+        stored = vault_path / "1_PROJECTS" / "stored.bin"
+        stored.write_bytes(b"A" * 200)
+        candidate = vault_path / "0_INBOX" / "candidate.bin"
+        candidate.write_bytes(b"C" + b"A" * 199)
+        
+        hash_db = HashDatabase(config)
+        hash_db.add_file(stored)
+        full = mocker.spy(hash_db, "calculate_hash")
+        
+        assert hash_db.is_duplicate(candidate) is None
+        assert full.call_count == 0
+    
+    def test_legacy_json_import(self, config):
+        """Test entries imported from JSON still detect duplicates."""
+        vault_path = config.get_vault_path()
+        stored = vault_path / "1_PROJECTS" / "stored.bin"
+        stored.write_bytes(b"A" * 200)
+        digest = hashlib.sha256(stored.read_bytes()).hexdigest()
+        config.get_hash_db_path().write_text(f'{{"{digest}": "{stored}"}}', encoding="utf-8")
+        candidate = vault_path / "0_INBOX" / "candidate.bin"
+        candidate.write_bytes(b"A" * 200)
+        
+        hash_db = HashDatabase(config)
+        
+        assert hash_db.is_duplicate(candidate) == stored
+
+
+class TestFileProcessor:
+    """Test FileProcessor class."""
+    
+    def test_duplicate_is_dropped(self, config):
+        """Test a second copy of routed content is removed from the inbox."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        first = inbox / "[P:ABC] part.stl"
+        first.write_bytes(b"solid part")
+        second = inbox / "[P:ABC] part copy.stl"
+        second.write_bytes(b"solid part")
+        
+        processor = FileProcessor(config)
+        moved = processor.process_file(first)
+        
+        assert moved == config.get_vault_path() / "1_PROJECTS" / "ABC" / "models" / "src" / first.name
+        assert moved.exists()
+        assert processor.process_file(second) is None
+        assert not second.exists()
+    
+    def test_events_published(self, config):
+        """Test moves, duplicates and outcomes are published on the event bus."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        first = inbox / "[P:ABC] part.stl"
+        first.write_bytes(b"solid part")
+        second = inbox / "[P:ABC] part copy.stl"
+        second.write_bytes(b"solid part")
+        
+        processor = FileProcessor(config)
+        events = []
+        processor.events.subscribe(events.append)
+        moved = processor.process_file(first)
+        processor.process_file(second)
+        
+        assert [(event.type, event.path, event.dest) for event in events] == [
+            ("moved", str(first), str(moved)),
+            ("processed", str(first), str(moved)),
+            ("deduplicated", str(second), None),
+        ]
+        assert events[2].details == {"original": str(moved)}
+    
+    def test_events_on_failure_and_no_route(self, config):
+        """Test a failed or unrouted file is never published as processed."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        broken = inbox / "broken.md"
+        broken.write_text("---\ntype: [note\n---\n", encoding="utf-8")
+        plain = inbox / "plain.pdf"
+        plain.write_bytes(b"%PDF")
+        
+        processor = FileProcessor(config)
+        events = []
+        processor.events.subscribe(events.append)
+        processor.process_file(broken)
+        processor.process_file(plain)
+        
+        assert [(event.type, event.path) for event in events] == [("failed", str(broken))]
+    
+    def test_metrics_recorded(self, config):
+        """Test processing records latencies, dedup checks and events."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        (inbox / "[P:ABC] part.stl").write_bytes(b"solid part")
+        (inbox / "[P:ABC] part copy.stl").write_bytes(b"solid part")
+        
+        processor = FileProcessor(config)
+        processor.process_file(inbox / "[P:ABC] part.stl")
+        processor.process_file(inbox / "[P:ABC] part copy.stl")
+        registry = processor.metrics.registry
+        
+        assert registry.get_sample_value("vault_watcher_process_seconds_count") == 2
+        assert registry.get_sample_value("vault_watcher_move_seconds_count", {"method": "rename"}) == 1
+        assert registry.get_sample_value("vault_watcher_hash_seconds_count", {"scope": "full"}) >= 1
+        assert registry.get_sample_value("vault_watcher_dedup_checks_total", {"result": "miss"}) == 1
+        assert registry.get_sample_value("vault_watcher_dedup_checks_total", {"result": "hit"}) == 1
+        assert registry.get_sample_value("vault_watcher_events_total", {"type": "deduplicated"}) == 1
+
+
+class TestVaultWatcher:
+    """Test VaultWatcher class."""
+    
+    def test_scan_processes_backlog(self, config):
+        """Test files left in the inbox while nothing was watching are routed by a scan."""
+        config.performance.event_quiet_period = 0
+        vault_path = config.get_vault_path()
+        dropped = vault_path / "0_INBOX" / "[P:ABC] part.stl"
+        dropped.write_bytes(b"solid part")
+        
+        watcher = VaultWatcher(config)
+        try:
+            assert watcher.pending_files() == [dropped]
+            
+            progress = []
+            summary = watcher.scan(progress.append)
+            assert summary["files"] == 1
+            assert summary["moved"] == 1
+            assert sum(progress) == 1
+            assert (vault_path / "1_PROJECTS" / "ABC" / "models" / "src" / dropped.name).exists()
+            assert watcher.pending_files() == []
+        finally:
+            watcher.scheduler.shutdown()
+    
+    def test_first_scan_keeps_organized_vault(self, config):
+        """Test the first scan of an organized vault only fills the index and moves nothing."""
+        config.performance.event_quiet_period = 0
+        vault_path = config.get_vault_path()
+        organized = [
+            vault_path / "1_PROJECTS" / "P-001" / "docs" / "spec.pdf",
+            vault_path / "1_PROJECTS" / "P-001" / "models" / "glb" / "x.glb",
+            vault_path / "3_RESOURCES" / "parts" / "R-1" / "drawings" / "d.pdf",
+            vault_path / "2_CATEGORIES" / "C-1" / "ref" / "a.png",
+        ]
+        for path in organized:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(path.name.encode())
+        
+        watcher = VaultWatcher(config)
+        try:
+            summary = watcher.scan()
+            assert summary["files"] == 0
+            assert all(path.exists() for path in organized)
+            
+            # Later changes in place stay put; loose files outside any assigned folder are pending
+            organized[0].write_bytes(b"revised spec")
+            loose = vault_path / "3_RESOURCES" / "[R:R-1] loose.pdf"
+            loose.write_bytes(b"loose")
+            assert watcher.pending_files() == [loose]
+        finally:
+            watcher.scheduler.shutdown()
+    
+    def test_rescan_walks_incoming_folders_only(self, config):
+        """Test a rescan limited to the inbox and ongoing folders leaves the rest of the index alone."""
+        config.performance.event_quiet_period = 0
+        vault_path = config.get_vault_path()
+        watcher = VaultWatcher(config)
+        try:
+            watcher.pending_files()
+            reconciled_at = watcher.index.reconciled_at()
+            (vault_path / "3_RESOURCES" / "[R:R-1] loose.pdf").write_bytes(b"loose")
+            dropped = vault_path / "0_INBOX" / "[P:ABC] part.stl"
+            dropped.write_bytes(b"solid part")
+            
+            assert watcher.pending_files(incoming_only=True) == [dropped]
+            assert watcher.index.reconciled_at() == reconciled_at
+        finally:
+            watcher.scheduler.shutdown()
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Tests for events module."""
+
+import pytest
+
+from vault_watcher.events import EventBus
+
+
+class TestEventBus:
+    """Test EventBus class."""
+    
+    def test_publish(self):
+        """Test subscribers get events with their details."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+        
+        event = bus.publish("moved", "/vault/0_INBOX/a.stl", "/vault/1_PROJECTS/A/a.stl", method="rename")
+        
+        assert received == [event]
+        assert event.to_dict() == {
+            "type": "moved",
+            "path": "/vault/0_INBOX/a.stl",
+            "dest": "/vault/1_PROJECTS/A/a.stl",
+            "timestamp": event.timestamp,
+            "method": "rename",
+        }
+    
+    def test_type_filter_and_unsubscribe(self):
+        """Test subscribers only get the types they asked for until they unsubscribe."""
+        bus = EventBus()
+        failures = []
+        unsubscribe = bus.subscribe(failures.append, types=["failed"])
+        
+        bus.publish("processed", "a.stl")
+        bus.publish("failed", "b.stl", error="boom")
+        unsubscribe()
+        bus.publish("failed", "c.stl")
+        
+        assert [event.path for event in failures] == ["b.stl"]
+        assert len(bus) == 0
+    
+    def test_failing_subscriber(self):
+        """Test a failing subscriber does not stop delivery or reach the publisher."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(lambda event: 1 / 0)
+        bus.subscribe(received.append)
+        
+        bus.publish("converted", "a.stl", "a.glb")
+        
+        assert len(received) == 1
+    
+    def test_unknown_types(self):
+        """Test unknown event types are rejected."""
+        bus = EventBus()
+        with pytest.raises(ValueError):
+            bus.publish("renamed", "a.stl")
+        with pytest.raises(ValueError):
+            bus.subscribe(print, types=["renamed"])
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Tests for eventstream module."""
+
+import asyncio
+import json
+import threading
+
+from vault_watcher.events import EventBus
+from vault_watcher.eventstream import EventBroadcaster
+
+
+class TestEventBroadcaster:
+    """Test EventBroadcaster class."""
+    
+    def test_fan_out(self):
+        """Test events published on worker threads reach every interested client."""
+        async def run():
+            bus = EventBus()
+            broadcaster = EventBroadcaster()
+            broadcaster.attach(bus)
+            everything = broadcaster.connect()
+            failures = broadcaster.connect(frozenset({"failed"}))
+            
+            worker = threading.Thread(target=lambda: [
+                bus.publish("moved", "a.stl", "b.stl"),
+                bus.publish("failed", "c.stl", error="boom"),
+            ])
+            worker.start()
+            worker.join()
+            
+            received = [await everything.get(), await everything.get()]
+            return received, await failures.get()
+        
+        received, failure = asyncio.run(run())
+        assert [message[0] for message in received] == ["moved", "failed"]
+        assert json.loads(received[0][1])["dest"] == "b.stl"
+        assert failure == received[1]
+    
+    def test_slow_consumer_dropped(self):
+        """Test a client whose buffer overflows is dropped with its buffer freed."""
+        async def run():
+            bus = EventBus()
+            broadcaster = EventBroadcaster(max_events=2)
+            broadcaster.attach(bus)
+            slow = broadcaster.connect()
+            
+            for index in range(3):
+                bus.publish("processed", f"{index}.stl")
+            await asyncio.sleep(0)
+            return slow, await slow.get(), len(broadcaster)
+        
+        slow, message, clients = asyncio.run(run())
+        assert slow.dropped
+        assert message is None
+        assert clients == 0
+    
+    def test_detach(self):
+        """Test nothing is relayed after detaching."""
+        async def run():
+            bus = EventBus()
+            broadcaster = EventBroadcaster()
+            broadcaster.attach(bus)
+            client = broadcaster.connect()
+            broadcaster.detach()
+            bus.publish("processed", "a.stl")
+            await asyncio.sleep(0)
+            return len(bus), client.offer(("processed", "{}"))
+        
+        assert asyncio.run(run()) == (0, True)
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Tests for executor module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from vault_watcher.executor import BackgroundJobs, BlockingExecutor, OperationTimeoutError
+
+
+class TestBlockingExecutor:
+    """Test BlockingExecutor class."""
+    
+    def test_runs_off_loop(self):
+        """Test work runs on a worker thread."""
+        executor = BlockingExecutor(max_workers=2)
+        try:
+            name = asyncio.run(executor.run("names", lambda: threading.current_thread().name))
+        finally:
+            executor.shutdown()
+        assert name.startswith("APIWorker")
+    
+    def test_concurrency_limit(self):
+        """Test an operation never runs more calls at once than its limit."""
+        executor = BlockingExecutor(max_workers=4, limits={"walk": 1})
+        lock = threading.Lock()
+        running, peak = [0], [0]
+        
+        def walk():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+        
+        async def run():
+            await asyncio.gather(*(executor.run("walk", walk) for _ in range(3)))
+        
+        try:
+            asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert peak[0] == 1
+    
+    def test_timeout(self):
+        """Test a call past its timeout raises while other operations keep running."""
+        executor = BlockingExecutor(max_workers=2, timeout=0.05)
+        
+        async def run():
+            with pytest.raises(OperationTimeoutError):
+                await executor.run("slow", time.sleep, 0.5)
+            return await executor.run("fast", lambda: "done")
+        
+        try:
+            assert asyncio.run(run()) == "done"
+        finally:
+            executor.shutdown()
+
+
+class TestBackgroundJobs:
+    """Test BackgroundJobs class."""
+    
+    def test_job_outcomes(self):
+        """Test jobs record their result or error."""
+        executor = BlockingExecutor(max_workers=2)
+        jobs = BackgroundJobs(executor, max_jobs=10)
+        
+        def fail():
+            raise OSError("disk full")
+        
+        async def run():
+            done = jobs.submit("process", lambda value: value * 2, 21)
+            failed = jobs.submit("process", fail)
+            assert done.status == "queued"
+            while jobs._tasks:
+                await asyncio.sleep(0.01)
+            return jobs.get(done.id), jobs.get(failed.id)
+        
+        try:
+            done, failed = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert (done.status, done.result) == ("done", 42)
+        assert (failed.status, failed.error) == ("failed", "disk full")
+    
+    def test_prunes_finished_jobs(self):
+        """Test only the newest finished jobs are kept."""
+        executor = BlockingExecutor(max_workers=1)
+        jobs = BackgroundJobs(executor, max_jobs=2)
+        
+        async def run():
+            for _ in range(4):
+                jobs.submit("process", lambda: None)
+                while jobs._tasks:
+                    await asyncio.sleep(0.01)
+        
+        try:
+            asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert len(jobs) == 2
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Tests for fileops module."""
+
+import errno
+import os
+
+import pytest
+
+from vault_watcher import fileops
+from vault_watcher.fileops import move_file
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Source file with some content."""
+    src = tmp_path / "inbox" / "model.stl"
+    src.parent.mkdir()
+    src.write_bytes(b"solid model" * 1000)
+    return src
+
+
+class TestMoveFile:
+    """Test move_file function."""
+    
+    def test_same_device_renames(self, tmp_path, source):
+        """Test a move on one filesystem is a rename keeping the inode."""
+        inode = source.stat().st_ino
+        dest = tmp_path / "projects" / "ABC" / "model.stl"
+        
+        assert move_file(source, dest) == "rename"
+        assert dest.stat().st_ino == inode
+        assert not source.exists()
+    
+    def test_cross_device_copies(self, tmp_path, source, monkeypatch):
+        """Test a cross-device move copies, keeps metadata and removes the source."""
+        monkeypatch.setattr(fileops, "_same_device", lambda src, dest: False)
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+        dest = tmp_path / "projects" / "model.stl"
+        dest.parent.mkdir()
+        dest.write_bytes(b"old")
+        
+        method = move_file(source, dest)
+        
+        assert method in ("copy_file_range", "sendfile", "copy")
+        assert dest.read_bytes() == b"solid model" * 1000
+        assert dest.stat().st_mtime_ns == 1_000_000_000
+        assert not source.exists()
+        assert list(dest.parent.iterdir()) == [dest]
+    
+    def test_falls_back_to_buffered_copy(self, tmp_path, source, monkeypatch):
+        """Test the buffered copy is used when zero-copy calls are unsupported."""
+        def unsupported(*args):
+            raise OSError(errno.ENOSYS, "not supported")
+        
+        monkeypatch.setattr(fileops, "_same_device", lambda src, dest: False)
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+        dest = tmp_path / "projects" / "model.stl"
+        
+        assert move_file(source, dest, chunk_size=4096) == "copy"
+        assert dest.read_bytes() == b"solid model" * 1000
+    
+    def test_failed_copy_keeps_source(self, tmp_path, source, monkeypatch):
+        """Test a failed copy leaves the source and no temporary files behind."""
+        def broken(*args):
+            raise OSError(errno.EIO, "I/O error")
+        
+        monkeypatch.setattr(fileops, "_same_device", lambda src, dest: False)
+        monkeypatch.setattr(fileops, "_copy_data", broken)
+        dest = tmp_path / "projects" / "model.stl"
+        
+        with pytest.raises(OSError):
+            move_file(source, dest)
+        assert source.exists()
+        assert list(dest.parent.iterdir()) == []
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Tests for frontmatter module."""
+
+import pytest
+import yaml
+
+from vault_watcher.frontmatter import FrontmatterCache, parse_frontmatter, read_frontmatter_block
+
+
+class TestReadFrontmatter:
+    """Test the streaming frontmatter reader."""
+    
+    def test_reads_block(self, tmp_path):
+        """Test the block between the delimiters is returned."""
+        note = tmp_path / "note.md"
+        note.write_text("---\ntype: note\nproject: ABC\n---\n# Title\n---\nbody\n", encoding="utf-8")
+        
+        assert read_frontmatter_block(note) == "type: note\nproject: ABC\n"
+        assert parse_frontmatter(note) == {"type": "note", "project": "ABC"}
+    
+    def test_without_frontmatter(self, tmp_path):
+        """Test notes not starting with a delimiter have no frontmatter."""
+        note = tmp_path / "note.md"
+        note.write_text("# Title\n---\ntype: note\n---\n", encoding="utf-8")
+        
+        assert read_frontmatter_block(note) is None
+        assert parse_frontmatter(note) == {}
+    
+    def test_stops_at_byte_cap(self, tmp_path):
+        """Test an unclosed or oversized block is not read past the cap."""
+        note = tmp_path / "note.md"
+        note.write_text("---\ntype: note\n" + "x" * 1000 + "\n---\n", encoding="utf-8")
+        
+        assert read_frontmatter_block(note, max_bytes=100) is None
+        assert read_frontmatter_block(note, max_bytes=2000) is not None
+
+
+class TestFrontmatterCache:
+    """Test FrontmatterCache class."""
+    
+    def test_reparses_on_change(self, tmp_path):
+        """Test an entry is reused until the note's mtime or size changes."""
+        note = tmp_path / "note.md"
+        note.write_text("---\ntype: note\n---\n", encoding="utf-8")
+        cache = FrontmatterCache()
+        
+        first = cache.get(note)
+        first["type"] = "changed"
+        assert cache.get(note) == {"type": "note"}
+        
+        note.write_text("---\ntype: note\nproject: ABC\n---\n", encoding="utf-8")
+        assert cache.get(note)["project"] == "ABC"
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the cache is bounded."""
+        cache = FrontmatterCache(max_entries=2)
+        notes = [tmp_path / f"note{index}.md" for index in range(3)]
+        for note in notes:
+            note.write_text("---\ntype: note\n---\n", encoding="utf-8")
+            cache.get(note)
+        
+        assert len(cache) == 2
+    
+    def test_yaml_errors_not_cached(self, tmp_path):
+        """Test invalid frontmatter raises every time."""
+        note = tmp_path / "note.md"
+        note.write_text("---\ntype: [note\n---\n", encoding="utf-8")
+        cache = FrontmatterCache()
+        
+        for _ in range(2):
+            with pytest.raises(yaml.YAMLError):
+                cache.get(note)
+        assert len(cache) == 0
\ No newline at end of file
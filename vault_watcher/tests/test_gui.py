@@ -0,0 +1,135 @@
+"""Tests for gui module."""
+
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QModelIndex, QPersistentModelIndex
+
+from vault_watcher.gui import PATH_ROLE, VaultTreeModel, VaultWatcherThread, describe_event, list_directory
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Application instance for widgets and icons."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def model(app, config):
+    """Tree model showing the test vault."""
+    model = VaultTreeModel(config)
+    model.set_vault(config.get_vault_path())
+    return model
+
+
+def settle(app, model):
+    """Wait for listing tasks and deliver their results."""
+    model.pool.waitForDone()
+    app.processEvents()
+
+
+def children(model, parent):
+    """Get the display names of the rows under an index."""
+    return [model.index(row, 0, parent).data() for row in range(model.rowCount(parent))]
+
+
+class TestListDirectory:
+    """Test list_directory function."""
+    
+    def test_entries(self, tmp_path):
+        """Test entries are sorted by name with sizes of files."""
+        (tmp_path / "b.txt").write_bytes(b"12345")
+        (tmp_path / "a").mkdir()
+        assert list_directory(str(tmp_path)) == [("a", True, 0), ("b.txt", False, 5)]
+
+
+class TestVaultTreeModel:
+    """Test VaultTreeModel class."""
+    
+    def test_main_folders(self, model):
+        """Test the vault root holds the main folders before anything is listed."""
+        vault = model.index(0, 0)
+        assert children(model, vault) == ["Входящие", "В работе", "Проекты", "Категории", "Ресурсы", "Администрирование"]
+        assert model.pool.activeThreadCount() == 0
+    
+    def test_lazy_listing(self, app, config, model):
+        """Test a folder is listed only when fetched."""
+        inbox_path = config.get_vault_path() / "0_INBOX"
+        (inbox_path / "sub").mkdir()
+        (inbox_path / "sub" / "deep.txt").write_text("deep")
+        (inbox_path / "note.md").write_text("note")
+        inbox = model.index(0, 0, model.index(0, 0))
+        
+        assert model.rowCount(inbox) == 0
+        assert model.hasChildren(inbox)
+        assert model.canFetchMore(inbox)
+        
+        model.fetchMore(inbox)
+        assert not model.canFetchMore(inbox)
+        settle(app, model)
+        
+        assert children(model, inbox) == ["note.md", "sub"]
+        note = model.index(0, 0, inbox)
+        assert note.siblingAtColumn(1).data() == "4.0 B"
+        assert note.siblingAtColumn(2).data() == "Заметка"
+        assert note.data(PATH_ROLE) == str(inbox_path / "note.md")
+        # Subfolders stay unlisted until they are expanded
+        assert model.rowCount(model.index(1, 0, inbox)) == 0
+    
+    def test_apply_event(self, app, config, model):
+        """Test events update the listed folder row by row."""
+        inbox_path = config.get_vault_path() / "0_INBOX"
+        (inbox_path / "b.stl").write_bytes(b"solid")
+        inbox = model.index(0, 0, model.index(0, 0))
+        model.fetchMore(inbox)
+        settle(app, model)
+        kept = QPersistentModelIndex(model.index(0, 0, inbox))
+        
+        (inbox_path / "a.pdf").write_bytes(b"pdf")
+        (inbox_path / "c.png").write_bytes(b"png")
+        model.apply_event("created", str(inbox_path / "a.pdf"))
+        model.apply_event("created", str(inbox_path / "c.png"))
+        model._refresh_stale()
+        settle(app, model)
+        
+        assert children(model, inbox) == ["a.pdf", "b.stl", "c.png"]
+        assert kept.row() == 1 and kept.data() == "b.stl"
+        
+        (inbox_path / "b.stl").rename(inbox_path / "d.stl")
+        model.apply_event("moved", str(inbox_path / "b.stl"), str(inbox_path / "d.stl"))
+        model._refresh_stale()
+        settle(app, model)
+        
+        assert children(model, inbox) == ["a.pdf", "c.png", "d.stl"]
+    
+    def test_events_for_unlisted_folders(self, model, config):
+        """Test events in folders that were never listed are ignored."""
+        model.apply_event("created", str(config.get_vault_path() / "0_INBOX" / "a.pdf"))
+        assert not model._stale
+    
+    def test_missing_vault(self, app, tmp_path, config):
+        """Test a missing vault gives an empty tree."""
+        model = VaultTreeModel(config)
+        model.set_vault(tmp_path / "missing")
+        assert model.rowCount(QModelIndex()) == 0
+
+
+class TestVaultWatcherThread:
+    """Test VaultWatcherThread class."""
+    
+    def test_events_batched(self, app, config):
+        """Test events published between frames are emitted as one batch."""
+        thread = VaultWatcherThread(config)
+        batches = []
+        thread.events_signal.connect(batches.append)
+        
+        thread.watcher.events.publish("moved", "/vault/0_INBOX/a.stl", "/vault/1_PROJECTS/A/a.stl")
+        thread.watcher.events.publish("failed", "/vault/0_INBOX/b.stl", error="disk full")
+        thread.emit_events()
+        thread.emit_events()
+        
+        assert len(batches) == 1
+        assert [event.type for event in batches[0]] == ["moved", "failed"]
+        assert describe_event(batches[0][0]) == "Перемещён: /vault/0_INBOX/a.stl → /vault/1_PROJECTS/A/a.stl"
+        assert describe_event(batches[0][1]) == "Ошибка: /vault/0_INBOX/b.stl (disk full)"
\ No newline at end of file
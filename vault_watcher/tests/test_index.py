@@ -0,0 +1,103 @@
+"""Tests for index module."""
+
+import pytest
+
+from vault_watcher.index import VaultIndex
+
+
+@pytest.fixture
+def vault(config):
+    """Vault with a few files in projects and resources."""
+    vault_path = config.get_vault_path()
+    (vault_path / "1_PROJECTS" / "ABC" / "models" / "src").mkdir(parents=True)
+    (vault_path / "1_PROJECTS" / "ABC" / "models" / "src" / "part.stl").write_bytes(b"x" * 10)
+    (vault_path / "1_PROJECTS" / "ABC" / "notes.md").write_text("# ABC", encoding="utf-8")
+    (vault_path / "3_RESOURCES" / "parts").mkdir()
+    (vault_path / "3_RESOURCES" / "parts" / "photo.png").write_bytes(b"p" * 4)
+    return vault_path
+
+
+@pytest.fixture
+def index(config, vault):
+    """Reconciled vault index."""
+    index = VaultIndex.from_config(config)
+    index.reconcile()
+    yield index
+    index.close()
+
+
+class TestVaultIndex:
+    """Test VaultIndex class."""
+    
+    def test_reconcile_counts_vault(self, index):
+        """Test statistics after a full scan."""
+        stats = index.statistics()
+        
+        assert stats["total_files"] == 3
+        assert stats["total_size"] == 10 + 5 + 4
+        assert (stats["models"], stats["notes"], stats["images"], stats["documents"]) == (1, 1, 1, 0)
+        assert (stats["projects"], stats["categories"], stats["resources"]) == (1, 0, 1)
+    
+    def test_updates_are_incremental(self, index, vault):
+        """Test file and directory updates adjust the totals."""
+        doc = vault / "1_PROJECTS" / "ABC" / "spec.pdf"
+        doc.write_bytes(b"d" * 100)
+        index.update(doc)
+        doc.write_bytes(b"d" * 50)
+        index.update(doc)
+        
+        category = vault / "2_CATEGORIES" / "fasteners"
+        (category / "notes").mkdir(parents=True)
+        (category / "notes" / "bolts.md").write_text("bolts", encoding="utf-8")
+        index.update(category)
+        
+        stats = index.statistics()
+        assert stats["documents"] == 1
+        assert stats["notes"] == 2
+        assert stats["categories"] == 1
+        assert stats["total_size"] == 10 + 5 + 4 + 50 + 5
+    
+    def test_remove_directory(self, index, vault):
+        """Test removing a directory forgets everything below it, and only that."""
+        (vault / "1_PROJECTS" / "ABC2").mkdir()
+        (vault / "1_PROJECTS" / "ABC2" / "a.md").write_text("a", encoding="utf-8")
+        index.update(vault / "1_PROJECTS" / "ABC2")
+        
+        index.remove(vault / "1_PROJECTS" / "ABC")
+        
+        stats = index.statistics()
+        assert stats["projects"] == 1
+        assert stats["total_files"] == 2
+    
+    def test_reconcile_after_downtime(self, index, vault):
+        """Test changes made without events are picked up by reconcile."""
+        (vault / "1_PROJECTS" / "ABC" / "notes.md").unlink()
+        (vault / "3_RESOURCES" / "parts" / "photo.png").write_bytes(b"p" * 8)
+        (vault / "0_INBOX" / "new.obj").write_bytes(b"o")
+        
+        changes = index.reconcile()
+        
+        assert (changes["added"], changes["updated"], changes["removed"]) == (1, 1, 1)
+        stats = index.statistics()
+        assert (stats["total_files"], stats["models"], stats["notes"]) == (3, 2, 0)
+    
+    def test_own_database_is_not_indexed(self, config, index):
+        """Test the index does not count its own files."""
+        index.reconcile()
+        assert index.statistics()["total_files"] == 3
+    
+    def test_admin_folder_not_indexed(self, config, vault):
+        """Test the watcher's own files in the admin folder are left out."""
+        cache = vault / "9_ADMIN" / "glb_cache"
+        cache.mkdir(parents=True, exist_ok=True)
+        (cache / "cached.glb").write_bytes(b"g" * 8)
+        index = VaultIndex.from_config(config)
+        try:
+            index.reconcile()
+            index.update(cache / "cached.glb")
+            stats = index.statistics()
+        finally:
+            index.close()
+        
+        assert stats["models"] == 1
+        assert stats["total_files"] == 3
\ No newline at end of file
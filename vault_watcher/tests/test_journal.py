@@ -0,0 +1,122 @@
+"""Tests for journal module."""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from vault_watcher.core import FileProcessor
+from vault_watcher.journal import ProcessingJournal, process_identity
+
+
+class TestProcessingJournal:
+    """Test ProcessingJournal class."""
+    
+    def test_steps(self, tmp_path):
+        """Test entries are advanced and removed when finished."""
+        journal = ProcessingJournal(tmp_path / "journal.sqlite3")
+        entry_id = journal.begin(tmp_path / "a.stl", tmp_path / "b.stl", "P", "ABC")
+        journal.advance(entry_id, "moved")
+        
+        [entry] = journal.pending()
+        assert (entry.step, entry.kind, entry.code, entry.pid) == ("moved", "P", "ABC", os.getpid())
+        
+        journal.finish(entry_id)
+        assert len(journal) == 0
+    
+    def test_skips_live_processes(self, tmp_path):
+        """Test operations of another running process are not offered for recovery."""
+        journal = ProcessingJournal(tmp_path / "journal.sqlite3")
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            entry_id = journal.begin(tmp_path / "a.stl", tmp_path / "b.stl")
+            journal._conn.execute(
+                "UPDATE operations SET pid = ?, process = ? WHERE id = ?", (other.pid, process_identity(other.pid), entry_id)
+            )
+            assert journal.pending() == []
+        finally:
+            other.kill()
+            other.wait()
+        assert len(journal.pending()) == 1
+    
+    def test_reused_pid_is_not_live(self, tmp_path):
+        """Test an entry whose pid now belongs to a different process is offered for recovery."""
+        journal = ProcessingJournal(tmp_path / "journal.sqlite3")
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            if not process_identity(other.pid):
+                pytest.skip("process identity needs /proc")
+            entry_id = journal.begin(tmp_path / "a.stl", tmp_path / "b.stl")
+            journal._conn.execute(
+                "UPDATE operations SET pid = ?, process = 'old-boot:1' WHERE id = ?", (other.pid, entry_id)
+            )
+            assert len(journal.pending()) == 1
+        finally:
+            other.kill()
+            other.wait()
+
+
+class TestRecovery:
+    """Test FileProcessor.recover."""
+    
+    def test_completes_interrupted_copy(self, config):
+        """Test a move that reached its destination drops the source copy and records the hash."""
+        vault_path = config.get_vault_path()
+        src = vault_path / "0_INBOX" / "[C:TOOLS] drill.pdf"
+        dest = vault_path / "2_CATEGORIES" / "TOOLS" / "incoming" / src.name
+        dest.parent.mkdir(parents=True)
+        src.write_bytes(b"manual")
+        dest.write_bytes(b"manual")
+        temp = dest.with_name(f".{dest.name}.x1y2.tmp")
+        temp.write_bytes(b"man")
+        
+        processor = FileProcessor(config)
+        processor.journal.begin(src, dest, "C", "TOOLS")
+        
+        assert processor.recover() == {"completed": 1, "rolled_back": 0, "temp_files_removed": 1}
+        assert not src.exists()
+        assert not temp.exists()
+        assert processor.hash_db.store.with_size(len(b"manual"))
+        assert len(processor.journal) == 0
+    
+    def test_sweeps_stale_temp_files(self, config):
+        """Test stale temp files of unjournaled and old-style copies are removed, fresh ones are kept."""
+        folder = config.get_vault_path() / "1_PROJECTS" / "ABC" / "assets"
+        folder.mkdir(parents=True)
+        stale = [folder / ".spec.pdf.a1b2c3d4.tmp", folder / "tmpk3j_9x2q"]
+        fresh = folder / ".other.pdf.e5f6g7h8.tmp"
+        kept = folder / "tmp_notes.md"
+        for path in [*stale, fresh, kept]:
+            path.write_bytes(b"partial")
+        long_ago = time.time() - 2 * config.processing.temp_file_max_age
+        for path in [*stale, kept]:
+            os.utime(path, (long_ago, long_ago))
+        
+        assert FileProcessor(config).recover()["temp_files_removed"] == 2
+        assert not any(path.exists() for path in stale)
+        assert fresh.exists() and kept.exists()
+    
+    def test_rolls_back_unfinished_move(self, config):
+        """Test a move that never reached its destination leaves the source in place."""
+        vault_path = config.get_vault_path()
+        src = vault_path / "0_INBOX" / "[C:TOOLS] drill.pdf"
+        dest = vault_path / "2_CATEGORIES" / "TOOLS" / "incoming" / src.name
+        src.write_bytes(b"manual")
+        
+        processor = FileProcessor(config)
+        processor.journal.begin(src, dest, "C", "TOOLS")
+        
+        assert processor.recover()["rolled_back"] == 1
+        assert src.exists()
+        assert len(processor.journal) == 0
+    
+    def test_routing_leaves_no_entries(self, config):
+        """Test a completed routing is removed from the journal."""
+        src = config.get_vault_path() / "0_INBOX" / "[C:TOOLS] drill.pdf"
+        src.write_bytes(b"manual")
+        
+        processor = FileProcessor(config)
+        assert processor.process_file(src) is not None
+        assert len(processor.journal) == 0
\ No newline at end of file
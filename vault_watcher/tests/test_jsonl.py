@@ -0,0 +1,58 @@
+"""Tests for jsonl module."""
+
+import json
+from datetime import date
+
+from vault_watcher.jsonl import JsonlWriter
+
+
+def read_records(path):
+    """Read JSON records from a file."""
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJsonlWriter:
+    """Test JsonlWriter class."""
+    
+    def test_buffers_until_full(self, tmp_path):
+        """Test records are appended in batches of buffer_size."""
+        writer = JsonlWriter(tmp_path, buffer_size=3, flush_interval=60)
+        writer.write({"op": "move", "index": 0})
+        writer.write({"op": "move", "index": 1})
+        assert not writer.current_path.exists()
+        
+        writer.write({"op": "move", "index": 2})
+        assert [record["index"] for record in read_records(writer.current_path)] == [0, 1, 2]
+        
+        writer.write({"op": "dedup", "index": 3})
+        writer.close()
+        assert len(read_records(writer.current_path)) == 4
+    
+    def test_appends_to_existing_log(self, tmp_path):
+        """Test a restarted writer appends to today's file."""
+        for index in range(2):
+            with JsonlWriter(tmp_path, flush_interval=0) as writer:
+                writer.write({"index": index})
+        
+        assert read_records(writer.current_path) == [{"index": 0}, {"index": 1}]
+    
+    def test_rotates_daily(self, tmp_path):
+        """Test records go to the file of the day they were written."""
+        today = [date(2026, 1, 1)]
+        writer = JsonlWriter(tmp_path, flush_interval=60, today=lambda: today[0])
+        writer.write({"index": 0})
+        today[0] = date(2026, 1, 2)
+        writer.write({"index": 1})
+        writer.close()
+        
+        assert read_records(tmp_path / "2026-01-01.log.jsonl") == [{"index": 0}]
+        assert read_records(tmp_path / "2026-01-02.log.jsonl") == [{"index": 1}]
+    
+    def test_flushes_periodically(self, tmp_path):
+        """Test the background flush writes records within the interval."""
+        writer = JsonlWriter(tmp_path, flush_interval=0.05)
+        writer.write({"index": 0})
+        writer._closed.wait(0.3)
+        
+        assert read_records(writer.current_path) == [{"index": 0}]
+        writer.close()
\ No newline at end of file
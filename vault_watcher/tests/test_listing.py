@@ -0,0 +1,76 @@
+"""Tests for listing module."""
+
+import os
+
+import pytest
+
+from vault_watcher.listing import DirectoryListing, InvalidCursorError
+
+
+def file_type(name, is_directory):
+    """Classify entries by suffix."""
+    if name.lower().endswith(".stl"):
+        return "3D Model"
+    return "Directory" if is_directory else "File"
+
+
+@pytest.fixture
+def directory(tmp_path):
+    """Directory with two subdirectories and a few files."""
+    for name in ["b_dir", "a_dir"]:
+        (tmp_path / name).mkdir()
+    for index, name in enumerate(["c.stl", "a.stl", "b.txt", "d.STL"]):
+        (tmp_path / name).write_bytes(b"x" * (index + 1))
+    return tmp_path
+
+
+def collect(listing, directory, **query):
+    """Walk all pages and return entry names."""
+    names, cursor = [], None
+    while True:
+        page = listing.page(directory, cursor=cursor, **query)
+        names.extend(entry.name for entry in page.entries)
+        cursor = page.next_cursor
+        if cursor is None:
+            return names
+
+
+class TestDirectoryListing:
+    """Test DirectoryListing class."""
+    
+    def test_pages_cover_listing(self, directory):
+        """Test cursor pages return every entry once, directories first."""
+        listing = DirectoryListing(file_type)
+        
+        assert collect(listing, directory, limit=2) == ["a_dir", "b_dir", "a.stl", "b.txt", "c.stl", "d.STL"]
+        assert collect(listing, directory, limit=4, order="desc") == ["b_dir", "a_dir", "d.STL", "c.stl", "b.txt", "a.stl"]
+    
+    def test_filters_and_sort(self, directory):
+        """Test filtering by suffix and file type and sorting by size."""
+        listing = DirectoryListing(file_type)
+        
+        assert collect(listing, directory, suffixes=["stl"], sort="size", order="desc") == ["d.STL", "a.stl", "c.stl"]
+        page = listing.page(directory, file_type="3d model", limit=10)
+        assert page.total == 3
+    
+    def test_etag_follows_directory_changes(self, directory):
+        """Test the ETag is stable until the directory changes."""
+        listing = DirectoryListing(file_type)
+        page = listing.page(directory)
+        assert listing.etag_for(directory) == page.etag
+        assert listing.etag_for(directory, limit=5) != page.etag
+        
+        (directory / "e.stl").write_bytes(b"e")
+        os.utime(directory, ns=(0, 1))
+        assert listing.etag_for(directory) != page.etag
+        assert listing.page(directory).total == 7
+    
+    def test_invalid_cursor(self, directory):
+        """Test malformed cursors are rejected."""
+        listing = DirectoryListing(file_type)
+        with pytest.raises(InvalidCursorError):
+            listing.page(directory, cursor="not-a-cursor")
+        
+        cursor = listing.page(directory, limit=1).next_cursor
+        with pytest.raises(InvalidCursorError):
+            listing.page(directory, cursor=cursor, sort="size")
\ No newline at end of file
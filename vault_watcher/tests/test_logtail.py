@@ -0,0 +1,88 @@
+"""Tests for logtail module."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from vault_watcher.logtail import LogFilter, LogFollower, iter_lines_reversed, tail
+
+
+def record(index, level="info", event="file_operation", **fields):
+    """Build a structlog-style JSON line."""
+    return json.dumps({
+        "event": event,
+        "level": level,
+        "timestamp": f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}.000000Z",
+        "index": index,
+        **fields,
+    })
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log file with 300 records; every tenth is an error."""
+    path = tmp_path / "vault_watcher.log"
+    lines = [
+        record(i, level="error" if i % 10 == 0 else "info", file_path=f"/vault/{i}.stl")
+        for i in range(300)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestTail:
+    """Test tail function."""
+    
+    def test_returns_last_lines_in_order(self, log_file):
+        """Test the newest lines are returned oldest first."""
+        lines = tail(log_file, 3)
+        assert [json.loads(line)["index"] for line in lines] == [297, 298, 299]
+    
+    def test_reads_backwards_across_blocks(self, log_file):
+        """Test small blocks reassemble lines split between reads."""
+        lines = list(iter_lines_reversed(log_file, block_size=7))
+        assert len(lines) == 300
+        assert json.loads(lines[0])["index"] == 299
+        assert json.loads(lines[-1])["index"] == 0
+    
+    def test_filters(self, log_file):
+        """Test level, event, path and time filters."""
+        errors = tail(log_file, 2, LogFilter(level="warning"))
+        assert [json.loads(line)["index"] for line in errors] == [280, 290]
+        
+        assert tail(log_file, 10, LogFilter(file_path="/vault/42.")) == [record(42, file_path="/vault/42.stl")]
+        assert tail(log_file, 10, LogFilter(event="other")) == []
+        
+        window = LogFilter(since=datetime(2026, 1, 1, 0, 4, 55), until=datetime(2026, 1, 1, 0, 4, 57))
+        assert [json.loads(line)["index"] for line in tail(log_file, 10, window)] == [295, 296, 297]
+    
+    def test_unknown_level(self):
+        """Test unknown levels are rejected."""
+        with pytest.raises(ValueError):
+            LogFilter(level="verbose")
+
+
+class TestLogFollower:
+    """Test LogFollower class."""
+    
+    def test_reads_only_appended_lines(self, log_file):
+        """Test new complete lines are returned once."""
+        follower = LogFollower(log_file)
+        assert follower.read_new() == []
+        
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(record(300) + "\n" + record(301)[:10])
+        assert follower.read_new() == [record(300)]
+        
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(record(301)[10:] + "\n")
+        assert follower.read_new() == [record(301)]
+    
+    def test_follows_rotation(self, log_file):
+        """Test a rotated log is read from the start of the new file."""
+        follower = LogFollower(log_file)
+        log_file.rename(log_file.with_suffix(".log.1"))
+        log_file.write_text(record(0) + "\n", encoding="utf-8")
+        
+        assert follower.read_new() == [record(0)]
\ No newline at end of file
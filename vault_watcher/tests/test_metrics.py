@@ -0,0 +1,40 @@
+"""Tests for metrics module."""
+
+from vault_watcher.events import EventBus
+from vault_watcher.metrics import ProcessingMetrics
+
+
+class TestProcessingMetrics:
+    """Test ProcessingMetrics class."""
+    
+    def test_counts_events(self):
+        """Test events published on a bus are counted by type."""
+        metrics = ProcessingMetrics()
+        bus = EventBus()
+        bus.subscribe(metrics.count_event)
+        bus.publish("moved", "a.stl", "b.stl")
+        bus.publish("moved", "c.stl", "d.stl")
+        
+        assert metrics.registry.get_sample_value("vault_watcher_events_total", {"type": "moved"}) == 2
+        assert metrics.registry.get_sample_value("vault_watcher_events_total", {"type": "failed"}) == 0
+    
+    def test_tracked_queues(self):
+        """Test queue depths are read from the tracked sources at scrape time only."""
+        metrics = ProcessingMetrics()
+        reads = []
+        
+        def counters():
+            reads.append(1)
+            return {"events_received": 5, "pending": 2, "pool_queued": 3, "pool_running": 1, "pool_workers": 4}
+        
+        metrics.track(counters, lambda: {"queued": 7, "done": 1})
+        assert reads == []
+        
+        text = metrics.render().decode()
+        assert reads == [1]
+        assert 'vault_watcher_queue_depth{queue="pool"} 3.0' in text
+        assert 'vault_watcher_pipeline_events_total{stage="received"} 5.0' in text
+        assert 'vault_watcher_conversion_jobs{status="queued"} 7.0' in text
+        
+        metrics.untrack()
+        assert "vault_watcher_queue_depth" not in metrics.render().decode()
\ No newline at end of file
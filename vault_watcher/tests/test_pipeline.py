@@ -0,0 +1,110 @@
+"""Tests for pipeline module."""
+
+import threading
+import time
+
+from vault_watcher.pipeline import EventPipeline
+
+
+def wait_for(condition, timeout=2.0):
+    """Wait until condition() is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestEventPipeline:
+    """Test EventPipeline class."""
+    
+    def test_coalesces_events_per_path(self, tmp_path):
+        """Test a burst of events for one path is dispatched once."""
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid")
+        dispatched = []
+        pipeline = EventPipeline(dispatched.append, quiet_period=0.05, poll_interval=0.01)
+        pipeline.start()
+        try:
+            for _ in range(20):
+                pipeline.submit(model)
+            assert wait_for(lambda: dispatched)
+            time.sleep(0.1)
+        finally:
+            pipeline.stop()
+        
+        assert dispatched == [model]
+        metrics = pipeline.get_metrics()
+        assert metrics["events_received"] == 20
+        assert metrics["events_coalesced"] == 19
+        assert metrics["events_processed"] == 1
+        assert metrics["pending"] == 0
+    
+    def test_waits_for_growing_file(self, tmp_path):
+        """Test a file still being written is not dispatched."""
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"")
+        dispatched = []
+        pipeline = EventPipeline(dispatched.append, quiet_period=0.05, poll_interval=0.01)
+        pipeline.start()
+        try:
+            pipeline.submit(model)
+            for _ in range(10):
+                with model.open("ab") as f:
+                    f.write(b"chunk")
+                time.sleep(0.02)
+                assert dispatched == []
+            assert wait_for(lambda: dispatched)
+        finally:
+            pipeline.stop()
+        
+        assert dispatched == [model]
+    
+    def test_drops_vanished_files(self, tmp_path):
+        """Test paths removed before settling are dropped."""
+        model = tmp_path / "model.stl"
+        dispatched = []
+        pipeline = EventPipeline(dispatched.append, quiet_period=0.01, poll_interval=0.01)
+        pipeline.start()
+        try:
+            pipeline.submit(model)
+            assert wait_for(lambda: pipeline.get_metrics()["events_dropped"] == 1)
+        finally:
+            pipeline.stop()
+        
+        assert dispatched == []
+    
+    def test_sweep_does_not_block_submit(self, tmp_path):
+        """Test events are accepted while a sweep is stat'ing slow files."""
+        slow, fast = tmp_path / "slow.stl", tmp_path / "fast.stl"
+        slow.write_bytes(b"solid")
+        fast.write_bytes(b"solid")
+        pipeline = EventPipeline(lambda path: None, quiet_period=0)
+        pipeline.submit(slow)
+        
+        in_stat, release = threading.Event(), threading.Event()
+        signature = pipeline._signature
+        
+        def slow_signature(file_path):
+            if file_path == slow and threading.current_thread().name == "Sweep":
+                in_stat.set()
+                release.wait(5)
+            return signature(file_path)
+        
+        pipeline._signature = slow_signature
+        settled = []
+        sweep = threading.Thread(target=lambda: settled.extend(pipeline._collect_settled()), name="Sweep")
+        sweep.start()
+        try:
+            assert in_stat.wait(2)
+            submitter = threading.Thread(target=pipeline.submit, args=(fast,))
+            submitter.start()
+            submitter.join(1)
+            assert not submitter.is_alive()
+        finally:
+            release.set()
+            sweep.join()
+        
+        assert settled == [slow]
+        assert pipeline.get_metrics()["pending"] == 1
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""Tests for ratelimit module."""
+
+from vault_watcher.ratelimit import RateLimiter
+
+
+class TestRateLimiter:
+    """Test RateLimiter class."""
+    
+    def test_burst_then_limit(self):
+        """Test a client may burst up to the rate and is then told how long to wait."""
+        limiter = RateLimiter(3, period=60.0)
+        
+        assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+        retry_after = limiter.acquire("a")
+        assert 0 < retry_after <= 20.0
+        assert limiter.acquire("b") == 0.0
+    
+    def test_refill(self, monkeypatch):
+        """Test tokens come back over the period."""
+        now = [100.0]
+        monkeypatch.setattr("vault_watcher.ratelimit.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(2, period=10.0)
+        limiter.acquire("a")
+        limiter.acquire("a")
+        assert limiter.acquire("a") > 0
+        
+        now[0] += 5.0
+        assert limiter.acquire("a") == 0.0
+    
+    def test_forgets_old_clients(self):
+        """Test buckets beyond max_clients are evicted oldest first."""
+        limiter = RateLimiter(1, max_clients=2)
+        for client in ("a", "b", "c"):
+            limiter.acquire(client)
+        
+        assert len(limiter) == 2
+        assert limiter.acquire("a") == 0.0
\ No newline at end of file
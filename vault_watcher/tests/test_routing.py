@@ -0,0 +1,60 @@
+"""Tests for routing module."""
+
+import pytest
+
+from vault_watcher.routing import RoutingTable
+
+
+@pytest.fixture
+def routing(config):
+    """Routing table for the test vault."""
+    return RoutingTable(config)
+
+
+class TestRoutingTable:
+    """Test RoutingTable class."""
+    
+    @pytest.mark.parametrize("relative, expected", [
+        ("1_PROJECTS/ABC/models/src/part.stl", ("P", "ABC")),
+        ("3_RESOURCES/parts/M3-SCREW/datasheet.pdf", ("R", "M3-SCREW")),
+        ("2_CATEGORIES/TOOLS/incoming/drill.pdf", ("C", "TOOLS")),
+        ("3_RESOURCES/datasheet.pdf", (None, None)),
+        ("1_PROJECTS/loose.stl", (None, None)),
+        ("0_INBOX/[R:M3-SCREW] screw.step", ("R", "M3-SCREW")),
+        ("0_INBOX/drill.pdf", (None, None)),
+    ])
+    def test_detect(self, config, routing, relative, expected):
+        """Test folder rules and name marks."""
+        assert routing.detect(config.get_vault_path() / relative) == expected
+    
+    def test_symlinked_vault(self, config, routing, tmp_path):
+        """Test paths through a link to the vault are matched after resolving."""
+        link = tmp_path / "link"
+        link.symlink_to(config.get_vault_path())
+        assert routing.detect(link / "1_PROJECTS" / "ABC" / "notes.txt") == ("P", "ABC")
+    
+    def test_assign_file_cache(self, config, routing):
+        """Test .assign files are cached per directory until invalidated."""
+        inbox = config.get_vault_path() / "0_INBOX"
+        model = inbox / "bracket.stl"
+        assign = inbox / "bracket.stl.assign"
+        assign.write_text("P:ABC", encoding="utf-8")
+        
+        assert routing.detect(model) == ("P", "ABC")
+        
+        assign.write_text("C:TOOLS", encoding="utf-8")
+        assert routing.detect(model) == ("P", "ABC")
+        
+        routing.invalidate(assign)
+        assert routing.detect(model) == ("C", "TOOLS")
+    
+    def test_directory_invalidation(self, config, routing):
+        """Test removing a directory drops the cache of its subdirectories."""
+        folder = config.get_vault_path() / "0_INBOX" / "batch"
+        folder.mkdir()
+        (folder / "bracket.stl.assign").write_text("R:BRACKET", encoding="utf-8")
+        assert routing.detect(folder / "bracket.stl") == ("R", "BRACKET")
+        
+        (folder / "bracket.stl.assign").unlink()
+        routing.invalidate(folder.parent, is_directory=True)
+        assert routing.detect(folder / "bracket.stl") == (None, None)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Tests for scheduler module."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from vault_watcher.scheduler import ProcessingScheduler, SchedulerFullError
+
+
+class TestProcessingScheduler:
+    """Test ProcessingScheduler class."""
+    
+    def test_same_path_never_overlaps(self):
+        """Test items for one path run one at a time in submission order."""
+        active = set()
+        overlaps = []
+        calls = []
+        lock = threading.Lock()
+        
+        def worker(file_path):
+            with lock:
+                if file_path in active:
+                    overlaps.append(file_path)
+                active.add(file_path)
+                calls.append(file_path)
+            time.sleep(0.01)
+            with lock:
+                active.discard(file_path)
+            return file_path
+        
+        scheduler = ProcessingScheduler(worker, max_workers=4)
+        paths = [Path("a.stl"), Path("b.stl")] * 5
+        futures = [scheduler.submit(path) for path in paths]
+        for future in futures:
+            future.result(timeout=5)
+        scheduler.shutdown()
+        
+        assert overlaps == []
+        assert calls.count(Path("a.stl")) == 5
+        assert scheduler.get_metrics()["completed"] == 10
+    
+    def test_backpressure(self):
+        """Test submit refuses work past the queue limit."""
+        release = threading.Event()
+        scheduler = ProcessingScheduler(lambda file_path: release.wait(5), max_workers=1, queue_limit=2)
+        scheduler.submit(Path("a.stl"))
+        scheduler.submit(Path("b.stl"))
+        
+        with pytest.raises(SchedulerFullError):
+            scheduler.submit(Path("c.stl"), block=False)
+        with pytest.raises(SchedulerFullError):
+            scheduler.submit(Path("c.stl"), timeout=0.01)
+        
+        release.set()
+        scheduler.submit(Path("c.stl"), timeout=5).result(timeout=5)
+        scheduler.shutdown()
+    
+    def test_run_batch_preserves_order(self):
+        """Test batch results follow input order and failures map to None."""
+        def worker(file_path):
+            if file_path.name == "bad.stl":
+                raise ValueError("broken model")
+            return file_path.name
+        
+        scheduler = ProcessingScheduler(worker, max_workers=3, batch_size=2)
+        paths = [Path("a.stl"), Path("bad.stl"), Path("c.stl"), Path("d.stl"), Path("e.stl")]
+        
+        progress = []
+        assert scheduler.run_batch(paths, progress.append) == ["a.stl", None, "c.stl", "d.stl", "e.stl"]
+        assert progress == [2, 2, 1]
+        assert scheduler.get_metrics()["failed"] == 1
+        scheduler.shutdown()    
+    def test_rejected_drain_fails_queued_items(self):
+        """Test a drain the executor refuses fails every item queued for the path and frees its slots."""
+        scheduler = ProcessingScheduler(lambda file_path: file_path.name, max_workers=1, queue_limit=2)
+        queued = []
+        
+        def refuse(fn, *args):
+            # Another caller queues behind the path before the drain is refused
+            queued.append(scheduler.submit(Path("a.stl")))
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        
+        scheduler._executor.submit = refuse
+        first = scheduler.submit(Path("a.stl"))
+        
+        for future in (first, *queued):
+            with pytest.raises(RuntimeError):
+                future.result(timeout=1)
+        assert scheduler.get_metrics() == {
+            "submitted": 2, "completed": 0, "failed": 2, "running": 0, "queued": 0, "workers": 1,
+        }
+        assert scheduler._slots.acquire(blocking=False)
+        assert scheduler._slots.acquire(blocking=False)
+        scheduler.shutdown()
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""Tests for storage module."""
+
+import json
+
+from vault_watcher.storage import DigestCache, HashStore
+
+
+class TestHashStore:
+    """Test HashStore class."""
+    
+    def test_put_and_get(self, tmp_path):
+        """Test point lookups after incremental writes."""
+        store = HashStore(tmp_path / "hash_index.sqlite3")
+        store.put("/vault/a.stl", 10, digest="abc")
+        store.put("/vault/b.stl", 20, digest="def")
+        
+        assert store.get("abc") == "/vault/a.stl"
+        assert store.get("missing") is None
+        assert len(store) == 2
+        
+        store.update("/vault/a.stl", digest="xyz")
+        assert store.get("abc") is None
+        assert store.get("xyz") == "/vault/a.stl"
+    
+    def test_lookup_by_size(self, tmp_path):
+        """Test size index returns only same-size entries."""
+        store = HashStore(tmp_path / "hash_index.sqlite3")
+        store.put("/vault/a.stl", 10, partial="p1")
+        store.put("/vault/b.stl", 10)
+        store.put("/vault/c.stl", 20)
+        
+        entries = store.with_size(10)
+        assert sorted(entry.path for entry in entries) == ["/vault/a.stl", "/vault/b.stl"]
+        assert store.with_size(30) == []
+        assert sorted(store.missing("digest")) == ["/vault/a.stl", "/vault/b.stl", "/vault/c.stl"]
+    
+    def test_persistence(self, tmp_path):
+        """Test entries survive reopening the store."""
+        db_path = tmp_path / "hash_index.sqlite3"
+        store = HashStore(db_path)
+        store.put("/vault/a.stl", 10, digest="abc")
+        store.close()
+        
+        reopened = HashStore(db_path)
+        assert reopened.get("abc") == "/vault/a.stl"
+    
+    def test_json_round_trip(self, tmp_path):
+        """Test JSON import and export."""
+        source = tmp_path / "hash_index.json"
+        source.write_text(json.dumps({"abc": "/vault/a.stl", "def": "/vault/b.stl"}), encoding="utf-8")
+        
+        store = HashStore(tmp_path / "hash_index.sqlite3")
+        assert store.import_json(source) == 2
+        assert store.get("def") == "/vault/b.stl"
+        
+        target = tmp_path / "export" / "hash_index.json"
+        assert store.export_json(target) == 2
+        assert json.loads(target.read_text(encoding="utf-8")) == {
+            "abc": "/vault/a.stl",
+            "def": "/vault/b.stl",
+        }
+        assert not list(target.parent.glob("*.tmp"))
+
+
+class TestDigestCache:
+    """Test DigestCache class."""
+    
+    def test_hit_until_file_changes(self, tmp_path):
+        """Test cached digest is invalidated by size or mtime changes."""
+        cache = DigestCache(tmp_path / "hash_index.sqlite3")
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid")
+        
+        cache.put(model.stat(), "sha256", "digest-1")
+        assert cache.get(model.stat(), "sha256") == "digest-1"
+        assert cache.get(model.stat(), "md5") is None
+        
+        model.write_bytes(b"solid model")
+        assert cache.get(model.stat(), "sha256") is None
+    
+    def test_survives_rename_and_restart(self, tmp_path):
+        """Test cache entries follow same-filesystem renames across reopen."""
+        db_path = tmp_path / "hash_index.sqlite3"
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid")
+        DigestCache(db_path).put(model.stat(), "sha256", "digest-1")
+        
+        moved = tmp_path / "moved.stl"
+        model.rename(moved)
+        assert DigestCache(db_path).get(moved.stat(), "sha256") == "digest-1"    
+    def test_keeps_latest_version_per_inode(self, tmp_path):
+        """Test rewriting a file replaces its cached digest instead of adding a row."""
+        cache = DigestCache(tmp_path / "hash_index.sqlite3")
+        model = tmp_path / "model.stl"
+        model.write_bytes(b"solid")
+        cache.put(model.stat(), "sha256", "digest-1")
+        
+        model.write_bytes(b"solid model")
+        cache.put(model.stat(), "sha256", "digest-2")
+        
+        assert cache.get(model.stat(), "sha256") == "digest-2"
+        assert cache._conn.execute("SELECT COUNT(*) FROM digests").fetchone()[0] == 1
+    
+    def test_prunes_oldest_beyond_limit(self, tmp_path):
+        """Test the cache keeps only the newest max_entries rows."""
+        db_path = tmp_path / "hash_index.sqlite3"
+        cache = DigestCache(db_path, max_entries=10)
+        models = []
+        for i in range(5):
+            model = tmp_path / f"model{i}.stl"
+            model.write_bytes(b"solid" * (i + 1))
+            cache.put(model.stat(), "sha256", f"digest-{i}")
+            models.append(model)
+        
+        cache.max_entries = 2
+        assert cache.prune() == 3
+        assert [cache.get(model.stat(), "sha256") for model in models] == [None, None, None, "digest-3", "digest-4"]
+        
+        reopened = DigestCache(db_path, max_entries=1)
+        assert reopened.get(models[3].stat(), "sha256") is None
+        assert reopened.get(models[4].stat(), "sha256") == "digest-4"
\ No newline at end of file